@@ -7,8 +7,13 @@ caching, and common operations across Radarr, Sonarr, and Tautulli integrations.
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future
+from types import TracebackType
+from typing import Any, Callable, Dict, Hashable, Optional, Type, TypeVar
+
+import requests
 
 from prunarr.logger import get_logger
 
@@ -18,6 +23,32 @@ try:
 except ImportError:
     CacheManager = None
 
+# Optional fast JSON decoder for large API payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar("T")
+
+
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson on the raw bytes when available.
+
+    Args:
+        response: HTTP response to decode
+
+    Returns:
+        Decoded JSON payload
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class BaseAPIClient(ABC):
     """
@@ -59,11 +90,68 @@ class BaseAPIClient(ABC):
         self.cache_manager = cache_manager
         self.logger = get_logger(self._get_logger_name(), debug=debug, log_level=log_level)
 
+        # In-flight requests by key, so concurrent identical calls share one fetch
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+
         # Initialize the underlying API client (implemented by subclass)
         self._initialize_client()
 
         self.logger.debug(f"Initialized {self.__class__.__name__} client: {self.base_url}")
 
+    def close(self) -> None:
+        """Release pooled HTTP connections held by this client, if any."""
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "BaseAPIClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _single_flight(self, key: Hashable, fetch_func: Callable[[], T]) -> T:
+        """
+        Run fetch_func once for concurrent callers sharing the same key.
+
+        The first caller performs the fetch; callers arriving while it is in
+        flight wait for and receive the same result (or exception).
+
+        Args:
+            key: Identifies the request (e.g. ("series", 123))
+            fetch_func: Function performing the actual lookup
+
+        Returns:
+            Result of fetch_func
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fetch_func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     @abstractmethod
     def _get_logger_name(self) -> str:
         """
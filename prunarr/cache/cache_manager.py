@@ -12,6 +12,9 @@ from prunarr.cache.cache_config import CacheConfig
 from prunarr.cache.cache_store import CacheStore
 from prunarr.logger import get_logger
 
+# Upper bound on episode file TTL; these change whenever files are deleted or imported
+EPISODE_FILES_MAX_TTL = 300  # 5 minutes
+
 
 class CacheManager:
     """
@@ -31,9 +34,11 @@ class CacheManager:
     KEY_SONARR_SERIES = "sonarr_series"
     KEY_SONARR_SERIES_DETAIL = "sonarr_series_detail"
     KEY_SONARR_EPISODES = "sonarr_episodes"
+    KEY_SONARR_EPISODE_FILES = "sonarr_episode_files"
     KEY_TAUTULLI_HISTORY = "tautulli_history"
     KEY_RADARR_TAG = "radarr_tag"
     KEY_SONARR_TAG = "sonarr_tag"
+    KEY_SONARR_TAGS = "sonarr_tags"
     KEY_METADATA_IMDB = "metadata_imdb"
     KEY_METADATA_TVDB = "metadata_tvdb"
 
@@ -157,7 +162,10 @@ class CacheManager:
         )
 
     def get_sonarr_episodes(
-        self, series_id: int, fetch_func: Callable[[], List[Dict]]
+        self,
+        series_id: int,
+        fetch_func: Callable[[], List[Dict]],
+        season_number: Optional[int] = None,
     ) -> List[Dict]:
         """
         Get episodes for a specific series from cache or fetch.
@@ -165,14 +173,46 @@ class CacheManager:
         Args:
             series_id: Series ID
             fetch_func: Function to fetch episodes
+            season_number: Optional season the episodes are restricted to
 
         Returns:
             List of episode dictionaries
         """
+        key_args = (series_id,) if season_number is None else (series_id, season_number)
+        return self.get_or_fetch(
+            self.KEY_SONARR_EPISODES, fetch_func, self.config.ttl_series, *key_args
+        )
+
+    def get_sonarr_episode_files(
+        self, series_id: int, fetch_func: Callable[[], List[Dict]]
+    ) -> List[Dict]:
+        """
+        Get episode files for a specific series from cache or fetch.
+
+        Args:
+            series_id: Series ID
+            fetch_func: Function to fetch episode files
+
+        Returns:
+            List of episode file dictionaries
+        """
         return self.get_or_fetch(
-            self.KEY_SONARR_EPISODES, fetch_func, self.config.ttl_series, series_id
+            self.KEY_SONARR_EPISODE_FILES,
+            fetch_func,
+            min(self.config.ttl_series, EPISODE_FILES_MAX_TTL),
+            series_id,
         )
 
+    def invalidate_sonarr_episode_files(self, series_id: int):
+        """
+        Drop the cached episode files of a single series.
+
+        Args:
+            series_id: Series ID
+        """
+        if self.is_enabled():
+            self.store.delete(self._generate_key(self.KEY_SONARR_EPISODE_FILES, series_id))
+
     def get_radarr_movie_detail(self, movie_id: int, fetch_func: Callable[[], Dict]) -> Dict:
         """
         Get individual Radarr movie details from cache or fetch.
@@ -231,6 +271,18 @@ class CacheManager:
         """
         return self.get_or_fetch(self.KEY_SONARR_TAG, fetch_func, self.config.ttl_tags, tag_id)
 
+    def get_sonarr_tags(self, fetch_func: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Get all Sonarr tags from cache or fetch.
+
+        Args:
+            fetch_func: Function to fetch all tags
+
+        Returns:
+            List of tag dictionaries
+        """
+        return self.get_or_fetch(self.KEY_SONARR_TAGS, fetch_func, self.config.ttl_tags)
+
     def get_metadata_imdb(self, rating_key: str, fetch_func: Callable[[], Dict]) -> Dict:
         """
         Get IMDB metadata from cache or fetch.
@@ -276,11 +328,12 @@ class CacheManager:
             self.store.clear(self.KEY_RADARR_MOVIES)
 
     def clear_series(self):
-        """Clear Sonarr series cache (including details and episodes)."""
+        """Clear Sonarr series cache (including details, episodes and episode files)."""
         if self.is_enabled():
             self.store.clear(self.KEY_SONARR_SERIES)
             self.store.clear(self.KEY_SONARR_SERIES_DETAIL)
             self.store.clear(self.KEY_SONARR_EPISODES)
+            self.store.clear(self.KEY_SONARR_EPISODE_FILES)
 
     def clear_history(self):
         """Clear Tautulli history cache."""
@@ -292,6 +345,7 @@ class CacheManager:
         if self.is_enabled():
             self.store.clear(self.KEY_RADARR_TAG)
             self.store.clear(self.KEY_SONARR_TAG)
+            self.store.clear(self.KEY_SONARR_TAGS)
 
     def clear_metadata(self):
         """Clear metadata caches."""
@@ -9,7 +9,7 @@ import gzip
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 
 class CacheStore:
@@ -73,9 +73,11 @@ class CacheStore:
         except Exception:
             pass  # Non-critical, don't fail on stats save error
 
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
         """
-        Retrieve cached data by key.
+        Read a cache entry from disk without touching the stats.
+
+        Expired and corrupted entries are deleted.
 
         Args:
             key: Cache key
@@ -86,8 +88,6 @@ class CacheStore:
         cache_path = self._get_cache_path(key)
 
         if not cache_path.exists():
-            self.stats["misses"] += 1
-            self._save_stats()
             return None
 
         try:
@@ -102,23 +102,50 @@ class CacheStore:
             # Check if expired
             if cache_data.get("expires_at", 0) < time.time():
                 self.delete(key)
-                self.stats["misses"] += 1
-                self._save_stats()
                 return None
 
-            self.stats["hits"] += 1
-            self.stats["last_accessed"] = int(time.time())
-            self._save_stats()
-
             return cache_data
 
         except Exception:
             # Corrupted cache file, delete it
             self.delete(key)
-            self.stats["misses"] += 1
-            self._save_stats()
             return None
 
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached data by key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached data dictionary or None if not found/expired
+        """
+        return self.get_many([key])[key]
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieve several cache entries, updating the stats file only once.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Dictionary mapping each key to its cached data dictionary, or None
+            if not found/expired
+        """
+        results = {key: self._read(key) for key in keys}
+
+        hits = sum(1 for entry in results.values() if entry is not None)
+        self.stats["hits"] += hits
+        self.stats["misses"] += len(results) - hits
+        if hits:
+            self.stats["last_accessed"] = int(time.time())
+        if results:
+            self._save_stats()
+
+        return results
+
     def set(self, key: str, data: Any, ttl: int):
         """
         Store data in cache with TTL.
@@ -160,21 +160,11 @@ def _cache_episodes(prunarr: PrunArr, series_data: list):
         return
 
     with console.status(f"[cyan]Caching episodes for {len(series_ids)} series..."):
-        cached_series = 0
-        total_episodes = 0
-
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS_API_HEAVY) as executor:
-            futures = {
-                executor.submit(prunarr.sonarr.get_episodes_by_series_id, sid): sid
-                for sid in series_ids
-            }
-            for future in as_completed(futures):
-                try:
-                    episodes = future.result()
-                    cached_series += 1
-                    total_episodes += len(episodes)
-                except Exception:
-                    pass
+        episodes_by_series = prunarr.sonarr.get_episodes_by_series_ids(
+            series_ids, concurrency=MAX_WORKERS_API_HEAVY
+        )
+        cached_series = len(episodes_by_series)
+        total_episodes = sum(len(episodes) for episodes in episodes_by_series.values())
 
         console.print(
             f"[green]✓[/green] Cached {total_episodes} episodes across {cached_series} series"
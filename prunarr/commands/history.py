@@ -21,6 +21,7 @@ from prunarr.utils import (
     format_timestamp,
     safe_get,
 )
+from prunarr.utils.serializers import prepare_history_for_json
 from prunarr.utils.tables import create_history_details_table, create_history_table
 from prunarr.utils.validators import validate_output_format
 
@@ -133,8 +134,6 @@ def list_history(
         # Output based on format
         if output == "json":
             # Prepare JSON-serializable data using shared serializer
-            from prunarr.utils.serializers import prepare_history_for_json
-
             json_output = [prepare_history_for_json(record) for record in history]
             print(json.dumps(json_output, indent=2))
         else:
@@ -24,8 +24,7 @@ from prunarr.utils import (
 )
 from prunarr.utils.filters import (
     apply_streaming_filter,
-    filter_by_excluded_tags,
-    filter_by_tags,
+    compose_filters,
 )
 from prunarr.utils.parsers import parse_file_size, parse_iso_datetime
 from prunarr.utils.serializers import prepare_datetime_for_json, prepare_movie_for_json
@@ -432,9 +431,10 @@ def list_movies(
             logger=logger,
         )
 
-        # Apply tag filters
-        filtered_movies = filter_by_tags(filtered_movies, tags, match_all=tag_match_all)
-        filtered_movies = filter_by_excluded_tags(filtered_movies, exclude_tags)
+        # Apply tag filters in a single pass
+        if tags or exclude_tags:
+            keep = compose_filters(tags=tags, match_all=tag_match_all, excluded_tags=exclude_tags)
+            filtered_movies = [movie for movie in filtered_movies if keep(movie)]
 
         # Apply sorting
         filtered_movies = sort_movies(filtered_movies, sort_by, sort_desc)
@@ -723,9 +723,10 @@ def remove_movies(
             logger=logger,
         )
 
-        # Apply tag filters
-        movies_to_remove = filter_by_tags(movies_to_remove, tags, match_all=tag_match_all)
-        movies_to_remove = filter_by_excluded_tags(movies_to_remove, exclude_tags)
+        # Apply tag filters in a single pass
+        if tags or exclude_tags:
+            keep = compose_filters(tags=tags, match_all=tag_match_all, excluded_tags=exclude_tags)
+            movies_to_remove = [movie for movie in movies_to_remove if keep(movie)]
 
         # Apply sorting
         movies_to_remove = sort_movies(movies_to_remove, sort_by, sort_desc_actual)
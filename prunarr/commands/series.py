@@ -29,8 +29,7 @@ from prunarr.utils import (
 )
 from prunarr.utils.filters import (
     apply_streaming_filter,
-    filter_by_excluded_tags,
-    filter_by_tags,
+    compose_filters,
 )
 from prunarr.utils.serializers import prepare_series_for_json
 from prunarr.utils.table_helpers import format_series_table_row
@@ -197,9 +196,10 @@ def list_series(
             logger=logger,
         )
 
-        # Apply tag filters
-        filtered_series = filter_by_tags(filtered_series, tags, match_all=tag_match_all)
-        filtered_series = filter_by_excluded_tags(filtered_series, exclude_tags)
+        # Apply tag filters in a single pass
+        if tags or exclude_tags:
+            keep = compose_filters(tags=tags, match_all=tag_match_all, excluded_tags=exclude_tags)
+            filtered_series = [series for series in filtered_series if keep(series)]
 
         # Apply limit
         if limit:
@@ -416,10 +416,9 @@ def remove_series(
             items_to_remove = [item for item in items_to_remove if item.get("user") == username]
 
         if series_name:
+            series_name_folded = series_name.casefold()
             items_to_remove = [
-                item
-                for item in items_to_remove
-                if series_name.lower() in item.get("title", "").lower()
+                item for item in items_to_remove if series_name_folded in item["_title_folded"]
             ]
 
         if season and removal_mode == "season":
@@ -455,9 +454,10 @@ def remove_series(
             logger=logger,
         )
 
-        # Apply tag filters
-        items_to_remove = filter_by_tags(items_to_remove, tags, match_all=tag_match_all)
-        items_to_remove = filter_by_excluded_tags(items_to_remove, exclude_tags)
+        # Apply tag filters in a single pass
+        if tags or exclude_tags:
+            keep = compose_filters(tags=tags, match_all=tag_match_all, excluded_tags=exclude_tags)
+            items_to_remove = [item for item in items_to_remove if keep(item)]
 
         if not items_to_remove:
             logger.info("No series found that meet the removal criteria")
@@ -775,13 +775,14 @@ def get_series_details(
 
         # Get episode file data for filesize information
         episode_files = prunarr.sonarr.get_episode_files(series_id)
-        episode_file_map = {}
+        file_size_by_id = {}
         total_series_size = 0
         for file_data in episode_files:
             file_id = file_data.get("id")
             if file_id:
-                episode_file_map[file_id] = file_data
-                total_series_size += file_data.get("size", 0)
+                file_size = file_data.get("size", 0)
+                file_size_by_id[file_id] = file_size
+                total_series_size += file_size
 
         # Display seasons and episodes
         seasons = list(seasons_data.values())
@@ -835,10 +836,7 @@ def get_series_details(
                 # Calculate total season filesize
                 season_total_size = 0
                 for episode in season_episodes:
-                    episode_file_id = episode.get("episode_file_id")
-                    if episode_file_id and episode_file_id in episode_file_map:
-                        file_data = episode_file_map[episode_file_id]
-                        season_total_size += file_data.get("size", 0)
+                    season_total_size += file_size_by_id.get(episode.get("episode_file_id"), 0)
 
                 season_json = {
                     "season_number": season_num,
@@ -861,10 +859,7 @@ def get_series_details(
                         continue
 
                     # Get episode filesize
-                    episode_size = 0
-                    if episode_file_id and episode_file_id in episode_file_map:
-                        file_data = episode_file_map[episode_file_id]
-                        episode_size = file_data.get("size", 0)
+                    episode_size = file_size_by_id.get(episode_file_id, 0)
 
                     # Format watched date
                     watched_date_iso = None
@@ -934,10 +929,7 @@ def get_series_details(
                 # Calculate total season filesize
                 season_total_size = 0
                 for episode in season_episodes:
-                    episode_file_id = episode.get("episode_file_id")
-                    if episode_file_id and episode_file_id in episode_file_map:
-                        file_data = episode_file_map[episode_file_id]
-                        season_total_size += file_data.get("size", 0)
+                    season_total_size += file_size_by_id.get(episode.get("episode_file_id"), 0)
 
                 # Season header with total size
                 season_size_str = (
@@ -985,10 +977,7 @@ def get_series_details(
                         status = "[red]❌ Missing[/red]"
 
                     # Format episode filesize
-                    episode_size = 0
-                    if episode_file_id and episode_file_id in episode_file_map:
-                        file_data = episode_file_map[episode_file_id]
-                        episode_size = file_data.get("size", 0)
+                    episode_size = file_size_by_id.get(episode_file_id, 0)
 
                     size_str = format_file_size(episode_size) if episode_size > 0 else "-"
 
@@ -15,12 +15,19 @@ The configuration supports:
 
 import os
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class Settings(BaseModel):
     """
@@ -108,6 +115,11 @@ class Settings(BaseModel):
         description="TTL for JustWatch streaming data cache in seconds (default: 24 hours)",
     )
 
+    @cached_property
+    def user_tag_pattern(self) -> re.Pattern:
+        """Compiled user_tag_regex, shared by everything that parses user tags."""
+        return re.compile(self.user_tag_regex)
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, value: str) -> str:
@@ -222,13 +234,42 @@ def load_settings(config_file: Optional[str] = None) -> Settings:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
-        try:
-            with config_path.open("r", encoding="utf-8") as file:
-                config_data = yaml.safe_load(file) or {}
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML configuration file: {e}")
+        with config_path.open("r", encoding="utf-8") as file:
+            config_data = _parse_config_yaml(file)
+
+    return _build_settings(config_data)
+
+
+def load_settings_from_stream(stream: TextIO) -> Settings:
+    """
+    Load configuration settings from an open YAML text stream.
+
+    Behaves like load_settings with a config file, including the environment
+    variable fallback, without touching the filesystem.
+
+    Args:
+        stream: Readable text stream containing YAML configuration
+
+    Returns:
+        Validated Settings object with all configuration
+
+    Raises:
+        ValidationError: If configuration values are invalid
+        ValueError: If the YAML is malformed
+    """
+    return _build_settings(_parse_config_yaml(stream))
+
+
+def _parse_config_yaml(stream: TextIO) -> Dict[str, Any]:
+    """Parse YAML configuration, treating an empty document as no configuration."""
+    try:
+        return yaml.load(stream, Loader=SafeLoader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML configuration file: {e}")
+
 
-    # Build settings with YAML values taking precedence over environment variables
+def _build_settings(config_data: Dict[str, Any]) -> Settings:
+    """Build settings with YAML values taking precedence over environment variables."""
     return Settings(
         radarr_api_key=config_data.get("radarr_api_key") or os.getenv("RADARR_API_KEY", ""),
         radarr_url=config_data.get("radarr_url") or os.getenv("RADARR_URL", ""),
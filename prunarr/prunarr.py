@@ -16,9 +16,11 @@ The PrunArr class serves as the central coordinator for:
 
 from __future__ import annotations
 
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from prunarr.cache import CacheConfig, CacheManager
 from prunarr.config import Settings
@@ -35,6 +37,9 @@ from prunarr.sonarr import SonarrAPI
 from prunarr.tautulli import TautulliAPI
 from prunarr.utils import make_episode_key
 
+# Shared read-only mapping for episodes nobody has watched
+_NO_WATCHERS: Mapping[str, Dict[str, Any]] = MappingProxyType({})
+
 
 class PrunArr:
     """
@@ -127,10 +132,10 @@ class PrunArr:
             debug=debug,
             log_level=log_level,
         )
-        self.tag_pattern = re.compile(settings.user_tag_regex)
+        self.tag_pattern = settings.user_tag_pattern
 
         # Initialize service layer
-        self.user_service = UserService(settings.user_tag_regex)
+        self.user_service = UserService(self.tag_pattern)
         self.media_matcher = MediaMatcher()
         self.watch_calculator = WatchCalculator()
         self.movie_service = MovieService(
@@ -447,8 +452,8 @@ class PrunArr:
         episode_key = make_episode_key(season_num, episode_num)
 
         watched_by_user = series_user and series_user in episode_watchers
-        watched_by_others = bool([u for u in episode_watchers.keys() if u != series_user])
-        all_watchers = list(episode_watchers.keys())
+        watched_by_others = any(u != series_user for u in episode_watchers)
+        all_watchers = list(episode_watchers)
 
         # Calculate most recent watch
         most_recent_watch = None
@@ -486,7 +491,7 @@ class PrunArr:
             "all_watchers": all_watchers,
             "most_recent_watch": most_recent_watch,
             "days_since_watched": days_since_watched,
-            "watchers_detail": episode_watchers if show_all_watchers else {},
+            "watchers_detail": episode_watchers if show_all_watchers else _NO_WATCHERS,
         }
 
     # Series-related methods
@@ -574,6 +579,7 @@ class PrunArr:
         watched_only: bool = False,
         unwatched_only: bool = False,
         show_all_watchers: bool = False,
+        summary_only: bool = False,
     ) -> Dict[str, Any]:
         """
         Get comprehensive detailed information about a series including episode-level watch data.
@@ -584,6 +590,7 @@ class PrunArr:
             watched_only: Show only episodes watched by the requester
             unwatched_only: Show only episodes NOT watched by the requester
             show_all_watchers: Include detailed watcher information for each episode
+            summary_only: Only compute per-season counts; season "episodes" lists stay empty
 
         Returns:
             Dictionary with comprehensive series and episode details
@@ -595,93 +602,86 @@ class PrunArr:
         if not series_info:
             return {}
 
-        # Get watch status data for this series
-        series_with_status = self.get_series_with_watch_status(
-            include_untagged=True, username_filter=None, series_filter=None, season_filter=None
-        )
+        # Start the independent Tautulli and Sonarr fetches in the background so their
+        # network round trips overlap with each other and with the watch status pass
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            history_future = executor.submit(self.tautulli.get_episode_completed_history)
+            # A season filter is applied server-side so only that season is transferred
+            episodes_future = executor.submit(
+                self.sonarr.get_episodes_by_series_id, series_id, season_filter
+            )
+
+            # Get watch status data for this series
+            series_with_status = self.get_series_with_watch_status(
+                include_untagged=True, username_filter=None, series_filter=None, season_filter=None
+            )
+            series_watch_data = next(
+                (s for s in series_with_status if s.get("id") == series_id), {}
+            )
+            tautulli_history = history_future.result()
 
-        series_watch_data = next((s for s in series_with_status if s.get("id") == series_id), None)
         if not series_watch_data:
             return {}
 
         # Get detailed watch information
         tvdb_id = str(series_info.get("tvdb_id", ""))
-        tautulli_history = self.tautulli.get_episode_completed_history()
         series_tvdb_cache = self.tautulli.build_series_metadata_cache(tautulli_history)
 
-        # Build watch lookup for this specific series
+        # Build watch lookup for this specific series, tracking the most recent
+        # watch timestamp per episode as records are inserted
         watch_lookup = {}
-        for record in tautulli_history:
-            grandparent_key = record.get("grandparent_rating_key")
-            if grandparent_key and series_tvdb_cache.get(str(grandparent_key)) == tvdb_id:
-                season_num = record.get("season_num")
-                episode_num = record.get("episode_num")
-                user = record.get("user")
-                watched_at = record.get("watched_at")
-
-                if not all([season_num, episode_num, user, watched_at]):
-                    continue
-
-                episode_key = f"s{season_num}e{episode_num}"
-                if episode_key not in watch_lookup:
-                    watch_lookup[episode_key] = {}
-
-                if user not in watch_lookup[episode_key] or int(watched_at) > int(
-                    watch_lookup[episode_key][user]["watched_at"]
-                ):
-                    watch_lookup[episode_key][user] = {
-                        "watched_at": watched_at,
-                        "watched_date": datetime.fromtimestamp(int(watched_at)),
-                        "season_num": season_num,
-                        "episode_num": episode_num,
-                    }
+        episode_max_ts: Dict[Tuple[int, int], int] = {}
+        max_ts_get = episode_max_ts.get
+
+        # Collect the grandparent keys that map to this series once, in both string and
+        # int form, so each history record needs a single set probe and no str() call
+        matching_keys = {key for key, value in series_tvdb_cache.items() if value == tvdb_id}
+        matching_keys.update([int(key) for key in matching_keys if key.isdigit()])
+
+        # When nothing in the history belongs to this series, skip the scan entirely
+        series_history = tautulli_history if matching_keys else []
+        for record in series_history:
+            if record.get("grandparent_rating_key") not in matching_keys:
+                continue
 
-        # Get episode info from series seasons metadata (this gives us ALL episodes, not just downloaded ones)
-        seasons_metadata = series_info.get("seasons", [])
+            season_num = record.get("season_num")
+            episode_num = record.get("episode_num")
+            user = record.get("user")
+            watched_at = record.get("watched_at")
 
-        if hasattr(self, "_debug_logger"):
-            self._debug_logger.debug(f"Series seasons metadata: {seasons_metadata}")
+            if not (season_num and episode_num and user and watched_at):
+                continue
 
-        # Build complete episode list from season metadata
-        episode_metadata_lookup = {}
-        for season in seasons_metadata:
-            season_num = season.get("seasonNumber", 0)
-            # Try different field names for episode count
-            total_episode_count = (
-                season.get("totalEpisodeCount", 0)
-                or season.get("episodeCount", 0)
-                or season.get("statistics", {}).get("totalEpisodeCount", 0)
-            )
+            # Key episodes by (season, episode) tuples; the "sXeY" string form is
+            # only built for episodes that end up in the result
+            try:
+                episode_key = (int(season_num), int(episode_num))
+            except (ValueError, TypeError):
+                continue
 
-            if hasattr(self, "_debug_logger"):
-                self._debug_logger.debug(
-                    f"Season {season_num}: {total_episode_count} total episodes (season data: {season})"
-                )
+            if episode_key not in watch_lookup:
+                watch_lookup[episode_key] = {}
 
-            # Create episode entries for all episodes in this season
-            episode_file_count = season.get("statistics", {}).get("episodeFileCount", 0)
-            for ep_num in range(1, total_episode_count + 1):
-                episode_key = f"s{season_num}e{ep_num}"
+            watched_ts = int(watched_at)
+            if watched_ts > max_ts_get(episode_key, -1):
+                episode_max_ts[episode_key] = watched_ts
 
-                # Estimate if this episode has a file based on episode file count
-                # This is not perfect but better than showing all as missing
-                has_file_estimated = ep_num <= episode_file_count
-
-                episode_metadata_lookup[episode_key] = {
-                    "season_number": season_num,
-                    "episode_number": ep_num,
-                    "title": f"Episode {ep_num}",  # Default title, we'll update if we have better data
-                    "air_date": "",
-                    "runtime": 0,
-                    "has_file": has_file_estimated,  # Estimate based on file count
-                    "monitored": season.get("monitored", False),
-                    "overview": "",
+            if user not in watch_lookup[episode_key] or watched_ts > int(
+                watch_lookup[episode_key][user]["watched_at"]
+            ):
+                watch_lookup[episode_key][user] = {
+                    "watched_at": watched_at,
+                    "season_num": season_num,
+                    "episode_num": episode_num,
                 }
 
-        # Now get real episode details from Sonarr using the fixed wrapper method
+        # Build the episode list from Sonarr, which returns every episode of the series
+        # (not just downloaded ones) with real titles and file state
+        episode_metadata_lookup = {}
         try:
-            # Use the fixed wrapper method to get all episodes for this series
-            all_episodes = self.sonarr.get_episodes_by_series_id(series_id)
+            # The episode endpoint is scoped by seriesId server-side, so the
+            # response needs no per-episode series check
+            all_episodes = episodes_future.result()
 
             if hasattr(self, "_debug_logger"):
                 self._debug_logger.debug(
@@ -690,10 +690,15 @@ class PrunArr:
                 if all_episodes:
                     self._debug_logger.debug(f"Sample episode: {all_episodes[0]}")
 
-            if hasattr(self, "_debug_logger"):
-                self._debug_logger.debug(f"Processing {len(all_episodes)} episodes from API")
-                if len(all_episodes) > 0:
-                    self._debug_logger.debug(f"Sample episode data: {all_episodes[0]}")
+            # Detect the payload schema once (Sonarr uses camelCase) instead of
+            # probing both key spellings for every episode
+            sample_episode = next((ep for ep in all_episodes if isinstance(ep, dict)), {})
+            if "seasonNumber" in sample_episode:
+                season_field, episode_field = "seasonNumber", "episodeNumber"
+                air_date_field, has_file_field = "airDate", "hasFile"
+            else:
+                season_field, episode_field = "season_number", "episode_number"
+                air_date_field, has_file_field = "air_date", "has_file"
 
             for ep in all_episodes:
                 if not isinstance(ep, dict):
@@ -701,53 +706,71 @@ class PrunArr:
                         self._debug_logger.debug(f"Skipping non-dict episode: {ep}")
                     continue
 
-                season_num = ep.get("seasonNumber", ep.get("season_number"))
-                episode_num = ep.get("episodeNumber", ep.get("episode_number"))
-                series_id_in_ep = ep.get("seriesId")
-
-                if hasattr(self, "_debug_logger"):
-                    self._debug_logger.debug(
-                        f"Episode: s{season_num}e{episode_num}, seriesId={series_id_in_ep}, title='{ep.get('title', 'N/A')}'"
-                    )
+                season_num = ep.get(season_field)
+                episode_num = ep.get(episode_field)
 
-                # Only process episodes that belong to our series
-                if series_id_in_ep != series_id:
-                    if hasattr(self, "_debug_logger"):
-                        self._debug_logger.debug(
-                            f"Skipping episode from different series: {series_id_in_ep} != {series_id}"
-                        )
+                if season_num is None or episode_num is None:
                     continue
 
-                if season_num is not None and episode_num is not None:
-                    episode_key = f"s{season_num}e{episode_num}"
-                    if episode_key in episode_metadata_lookup:
-                        # Update with real episode data from Sonarr
-                        episode_metadata_lookup[episode_key].update(
-                            {
-                                "title": ep.get("title", f"Episode {episode_num}"),
-                                "air_date": ep.get("airDate", ep.get("air_date", "")),
-                                "runtime": ep.get("runtime", 0),
-                                "has_file": ep.get("hasFile", ep.get("has_file", False)),
-                                "episode_file_id": ep.get("episodeFileId"),
-                                "overview": ep.get("overview", ""),
-                                "monitored": ep.get("monitored", False),
-                            }
-                        )
+                # Skip off-filter seasons and specials up front so no entries are built for them
+                if season_filter is not None and season_num != season_filter:
+                    continue
+                if season_filter is None and season_num == 0:
+                    continue
 
-                        if hasattr(self, "_debug_logger"):
-                            self._debug_logger.debug(
-                                f"Updated {episode_key}: title='{episode_metadata_lookup[episode_key]['title']}', has_file={episode_metadata_lookup[episode_key]['has_file']}"
-                            )
-                    else:
-                        if hasattr(self, "_debug_logger"):
-                            self._debug_logger.debug(
-                                f"Episode {episode_key} not in our lookup table"
-                            )
+                episode_metadata_lookup[(season_num, episode_num)] = {
+                    "season_number": season_num,
+                    "episode_number": episode_num,
+                    "title": ep.get("title", f"Episode {episode_num}"),
+                    "air_date": ep.get(air_date_field, ""),
+                    "runtime": ep.get("runtime", 0),
+                    "has_file": ep.get(has_file_field, False),
+                    "episode_file_id": ep.get("episodeFileId"),
+                    "overview": ep.get("overview", ""),
+                    "monitored": ep.get("monitored", False),
+                }
 
         except Exception as e:
             if hasattr(self, "_debug_logger"):
                 self._debug_logger.debug(f"Could not get episode details: {e}")
 
+        # Fall back to placeholder episodes from the season statistics when Sonarr
+        # returned nothing usable
+        if not episode_metadata_lookup:
+            seasons_metadata = series_info.get("seasons", [])
+
+            if hasattr(self, "_debug_logger"):
+                self._debug_logger.debug(f"Series seasons metadata: {seasons_metadata}")
+
+            for season in seasons_metadata:
+                season_num = season.get("seasonNumber", 0)
+
+                if season_filter is not None and season_num != season_filter:
+                    continue
+                if season_filter is None and season_num == 0:
+                    continue
+
+                # Try different field names for episode count
+                total_episode_count = (
+                    season.get("totalEpisodeCount", 0)
+                    or season.get("episodeCount", 0)
+                    or season.get("statistics", {}).get("totalEpisodeCount", 0)
+                )
+                episode_file_count = season.get("statistics", {}).get("episodeFileCount", 0)
+
+                for ep_num in range(1, total_episode_count + 1):
+                    episode_metadata_lookup[(season_num, ep_num)] = {
+                        "season_number": season_num,
+                        "episode_number": ep_num,
+                        "title": f"Episode {ep_num}",
+                        "air_date": "",
+                        "runtime": 0,
+                        # Estimate file state from the season's episode file count
+                        "has_file": ep_num <= episode_file_count,
+                        "monitored": season.get("monitored", False),
+                        "overview": "",
+                    }
+
         if hasattr(self, "_debug_logger"):
             self._debug_logger.debug(
                 f"Built complete episode lookup with {len(episode_metadata_lookup)} episodes"
@@ -756,44 +779,25 @@ class PrunArr:
         # Organize episodes by season - process ALL episodes from Sonarr, not just watched ones
         seasons_data = {}
         series_user = series_info.get("user")
-        now = datetime.now()
+        now_ts = int(datetime.now().timestamp())
 
         # Process all episodes from Sonarr
+        # Bind hot-loop lookups to locals
+        watch_get = watch_lookup.get
         for episode_key, ep_metadata in episode_metadata_lookup.items():
-            episode_watchers = watch_lookup.get(episode_key, {})
-            # Extract season and episode numbers from ep_metadata directly
-            season_num = ep_metadata.get("season_number")
-            episode_num = ep_metadata.get("episode_number")
-
-            if season_num is None or episode_num is None:
-                continue
-
-            # Apply season filter
-            if season_filter is not None and season_num != season_filter:
-                continue
-
-            # Skip season 0 (specials) unless specifically requested
-            if season_filter is None and season_num == 0:
-                continue
+            episode_watchers = watch_get(episode_key, _NO_WATCHERS)
+            # Season and specials filters were applied when the lookup was built
+            season_num = ep_metadata["season_number"]
+            episode_num = ep_metadata["episode_number"]
 
-            # Determine watch status for this episode
+            # Apply watch filtering before any per-episode detail is computed
             watched_by_user = series_user and series_user in episode_watchers
-            watched_by_others = bool([u for u in episode_watchers.keys() if u != series_user])
-            all_watchers = list(episode_watchers.keys())
-
-            # Apply filtering
             if watched_only and not watched_by_user:
                 continue
             if unwatched_only and watched_by_user:
                 continue
 
-            # Calculate days since watched (most recent watch by any user)
-            most_recent_watch = None
-            days_since_watched = None
-            if episode_watchers:
-                most_recent_ts = max(int(w["watched_at"]) for w in episode_watchers.values())
-                most_recent_watch = datetime.fromtimestamp(most_recent_ts)
-                days_since_watched = (now - most_recent_watch).days
+            watched_by_others = any(u != series_user for u in episode_watchers)
 
             # Determine watch status string
             if watched_by_user:
@@ -803,35 +807,10 @@ class PrunArr:
             else:
                 watch_status = "unwatched"
 
-            # Build episode detail with both watch data and metadata
-            episode_detail = {
-                "season_number": season_num,
-                "episode_number": episode_num,
-                "episode_key": episode_key,
-                "title": ep_metadata.get("title", "Unknown Episode"),
-                "air_date": ep_metadata.get("air_date", ""),
-                "runtime": ep_metadata.get("runtime", 0),
-                "has_file": ep_metadata.get("has_file", False),
-                "episode_file_id": ep_metadata.get("episode_file_id"),
-                "watched": watched_by_user,
-                "watched_at": (
-                    episode_watchers.get(series_user, {}).get("watched_at")
-                    if watched_by_user
-                    else None
-                ),
-                "watched_by": series_user if watched_by_user else "",
-                "watch_status": watch_status,
-                "watched_by_user": watched_by_user,
-                "watched_by_others": watched_by_others,
-                "all_watchers": all_watchers,
-                "most_recent_watch": most_recent_watch,
-                "days_since_watched": days_since_watched,
-                "watchers_detail": episode_watchers if show_all_watchers else {},
-            }
-
-            # Add to seasons data
-            if season_num not in seasons_data:
-                seasons_data[season_num] = {
+            # Add to seasons data; watch_status doubles as the season counter name
+            season_data = seasons_data.get(season_num)
+            if season_data is None:
+                season_data = seasons_data[season_num] = {
                     "season_number": season_num,
                     "episodes": [],
                     "watched_by_user": 0,
@@ -840,19 +819,65 @@ class PrunArr:
                     "total_episodes": 0,
                 }
 
-            seasons_data[season_num]["episodes"].append(episode_detail)
-            seasons_data[season_num]["total_episodes"] += 1
+            season_data["total_episodes"] += 1
+            season_data[watch_status] += 1
 
-            if watched_by_user:
-                seasons_data[season_num]["watched_by_user"] += 1
-            elif watched_by_others:
-                seasons_data[season_num]["watched_by_others"] += 1
-            else:
-                seasons_data[season_num]["unwatched"] += 1
+            if summary_only:
+                continue
+
+            all_watchers = list(episode_watchers)
+
+            # Watch dates are only materialized for episodes that are shown
+            if show_all_watchers:
+                episode_watchers = {
+                    user: {
+                        **watch,
+                        "watched_date": datetime.fromtimestamp(int(watch["watched_at"])),
+                    }
+                    for user, watch in episode_watchers.items()
+                }
+
+            # Calculate days since watched (most recent watch by any user)
+            most_recent_watch = None
+            days_since_watched = None
+            most_recent_ts = max_ts_get(episode_key)
+            if most_recent_ts is not None:
+                most_recent_watch = datetime.fromtimestamp(most_recent_ts)
+                days_since_watched = (now_ts - most_recent_ts) // 86400
+
+            # Build episode detail with both watch data and metadata
+            season_data["episodes"].append(
+                {
+                    "season_number": season_num,
+                    "episode_number": episode_num,
+                    "episode_key": make_episode_key(season_num, episode_num),
+                    "title": ep_metadata.get("title", "Unknown Episode"),
+                    "air_date": ep_metadata.get("air_date", ""),
+                    "runtime": ep_metadata.get("runtime", 0),
+                    "has_file": ep_metadata.get("has_file", False),
+                    "episode_file_id": ep_metadata.get("episode_file_id"),
+                    "watched": watched_by_user,
+                    "watched_at": (
+                        episode_watchers.get(series_user, {}).get("watched_at")
+                        if watched_by_user
+                        else None
+                    ),
+                    "watched_by": series_user if watched_by_user else "",
+                    "watch_status": watch_status,
+                    "watched_by_user": watched_by_user,
+                    "watched_by_others": watched_by_others,
+                    "all_watchers": all_watchers,
+                    "most_recent_watch": most_recent_watch,
+                    "days_since_watched": days_since_watched,
+                    "watchers_detail": episode_watchers if show_all_watchers else _NO_WATCHERS,
+                }
+            )
 
         # Sort episodes within each season
-        for season_data in seasons_data.values():
-            season_data["episodes"].sort(key=lambda ep: ep["episode_number"])
+        if not summary_only:
+            episode_number_key = itemgetter("episode_number")
+            for season_data in seasons_data.values():
+                season_data["episodes"].sort(key=episode_number_key)
 
         return {
             "series_info": series_info,
@@ -865,5 +890,6 @@ class PrunArr:
                 "watched_only": watched_only,
                 "unwatched_only": unwatched_only,
                 "show_all_watchers": show_all_watchers,
+                "summary_only": summary_only,
             },
         }
@@ -5,7 +5,7 @@ This service handles the complex logic of matching Tautulli watch history
 records with Radarr/Sonarr media items using IMDB/TVDB identifiers.
 """
 
-from typing import Any, Dict, List
+from typing import AbstractSet, Any, Dict, List, Optional
 
 from prunarr.utils.parsers import make_episode_key
 
@@ -73,7 +73,9 @@ class MediaMatcher:
 
     @staticmethod
     def build_episode_watch_lookup(
-        tautulli_history: List[Dict[str, Any]], series_tvdb_cache: Dict[str, str]
+        tautulli_history: List[Dict[str, Any]],
+        series_tvdb_cache: Dict[str, str],
+        allowed_tvdb: Optional[AbstractSet[str]] = None,
     ) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """
         Build watch lookup dictionary for episodes.
@@ -81,6 +83,8 @@ class MediaMatcher:
         Args:
             tautulli_history: List of episode watch history records from Tautulli
             series_tvdb_cache: Mapping of rating_key -> tvdb_id
+            allowed_tvdb: Optional set of tvdb_id strings to restrict the lookup to;
+                          records for other series are skipped
 
         Returns:
             Dictionary mapping tvdb_id -> episode_key -> user -> watch_data
@@ -97,15 +101,18 @@ class MediaMatcher:
             if not tvdb_id:
                 continue
 
+            series_key = str(tvdb_id)
+            if allowed_tvdb is not None and series_key not in allowed_tvdb:
+                continue
+
             season_num = record.get("season_num")
             episode_num = record.get("episode_num")
             user = record.get("user")
             watched_at = record.get("watched_at")
 
-            if not all([season_num, episode_num, user, watched_at]):
+            if not (season_num and episode_num and user and watched_at):
                 continue
 
-            series_key = str(tvdb_id)
             episode_key = make_episode_key(season_num, episode_num)
 
             if series_key not in watch_lookup:
@@ -8,7 +8,8 @@ and managing episode-level detailed information.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from prunarr.cache import CacheManager
@@ -61,6 +62,17 @@ class SeriesService:
         self.cache_manager = cache_manager
         self.logger = logger
 
+        # Per-instance memoization so one command run builds each structure once
+        self._all_series_cache: Optional[List[Dict[str, Any]]] = None
+        self._tag_map_cache: Optional[Dict[int, str]] = None
+        self._watch_lookup_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def invalidate(self) -> None:
+        """Clear memoized series, tag and watch lookup data so the next call refetches."""
+        self._all_series_cache = None
+        self._tag_map_cache = None
+        self._watch_lookup_cache = None
+
     def get_all_series(self, include_untagged: bool = True) -> List[Dict[str, Any]]:
         """
         Get all Sonarr series with enhanced information.
@@ -74,8 +86,58 @@ class SeriesService:
         if self.logger:
             self.logger.debug(f"get_all_series: include_untagged={include_untagged}")
 
+        return list(self._iter_all_series(include_untagged))
+
+    def _iter_all_series(self, include_untagged: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over enriched Sonarr series without copying the memoized list.
+
+        Args:
+            include_untagged: Include series without user tags
+
+        Yields:
+            Enriched series dictionaries
+        """
+        if self._all_series_cache is None:
+            self._all_series_cache = self._build_all_series()
+
+        if include_untagged:
+            yield from self._all_series_cache
+        else:
+            yield from (s for s in self._all_series_cache if s["user"])
+
+    def _get_tag_source(self) -> Any:
+        """
+        Get the source for resolving Sonarr tag labels.
+
+        Returns the tag ID to label map, fetched once per instance. If fetching all
+        tags fails, the Sonarr client is returned instead so tags are looked up one
+        at a time, tolerating individual failures; the map is retried on next use.
+        """
+        if self._tag_map_cache is None:
+            try:
+                self._tag_map_cache = self.user_service.build_tag_map(self.sonarr)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Failed to fetch Sonarr tags, looking up per tag: {e}")
+                return self.sonarr
+        return self._tag_map_cache
+
+    def _build_all_series(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all Sonarr series and enrich them with user and tag information.
+
+        Returns:
+            List of enriched series dictionaries, including untagged series
+        """
         result: List[Dict[str, Any]] = []
-        series_list = self.sonarr.get_series()
+
+        # Series and tags are independent requests; resolve all tag labels with a
+        # single request (instead of one per tag) while the series list loads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            tag_source_future = executor.submit(self._get_tag_source)
+            series_list = self.sonarr.get_series()
+            tag_source = tag_source_future.result()
 
         if self.logger:
             self.logger.debug(f"Fetched {len(series_list)} series from Sonarr API")
@@ -85,29 +147,30 @@ class SeriesService:
 
             # Determine user from tags
             username = (
-                self.user_service.extract_username_from_tags(tag_ids, self.sonarr)
+                self.user_service.extract_username_from_tags(tag_ids, tag_source)
                 if tag_ids
                 else None
             )
 
-            # Skip untagged series if not requested
-            if not include_untagged and not username:
-                continue
-
             # Get non-user tag labels for display
             tag_labels = (
-                self.user_service.get_non_user_tag_labels(tag_ids, self.sonarr) if tag_ids else []
+                self.user_service.get_non_user_tag_labels(tag_ids, tag_source) if tag_ids else []
             )
 
             # Get season info
             seasons = series.get("seasons", [])
-            total_episodes = sum(season.get("totalEpisodeCount", 0) for season in seasons)
-            downloaded_episodes = sum(season.get("episodeFileCount", 0) for season in seasons)
+            total_episodes = 0
+            downloaded_episodes = 0
+            for season in seasons:
+                season_get = season.get
+                total_episodes += season_get("totalEpisodeCount", 0)
+                downloaded_episodes += season_get("episodeFileCount", 0)
 
             result.append(
                 {
                     "id": series.get("id"),
                     "title": series.get("title"),
+                    "_title_folded": (series.get("title") or "").casefold(),
                     "year": series.get("year"),
                     "tvdb_id": series.get("tvdbId"),
                     "imdb_id": series.get("imdbId"),
@@ -148,6 +211,37 @@ class SeriesService:
         Returns:
             List of series with watch status, episode details, and watch progress
         """
+        return list(
+            self._iter_series_with_watch_status(
+                include_untagged=include_untagged,
+                username_filter=username_filter,
+                series_filter=series_filter,
+                season_filter=season_filter,
+                check_streaming=check_streaming,
+            )
+        )
+
+    def _iter_series_with_watch_status(
+        self,
+        include_untagged: bool = True,
+        username_filter: Optional[str] = None,
+        series_filter: Optional[str] = None,
+        season_filter: Optional[int] = None,
+        check_streaming: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over series with their watch status, yielding one series at a time.
+
+        Args:
+            include_untagged: Include series without user tags
+            username_filter: Filter by specific username
+            series_filter: Filter by series title (partial match)
+            season_filter: Filter by specific season number
+            check_streaming: Whether to check and cache streaming availability
+
+        Yields:
+            Series dictionaries with watch status, episode details, and watch progress
+        """
         if self.logger:
             self.logger.debug(
                 f"get_series_with_watch_status: include_untagged={include_untagged}, "
@@ -155,6 +249,13 @@ class SeriesService:
                 f"season_filter={season_filter}, check_streaming={check_streaming}"
             )
 
+        # Fetch Tautulli history in the background while Sonarr series are loaded
+        history_future = None
+        if self._watch_lookup_cache is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            history_future = executor.submit(self.tautulli.get_episode_completed_history)
+            executor.shutdown(wait=False)
+
         # Get and filter series
         all_series = self.get_all_series(include_untagged=include_untagged)
 
@@ -162,9 +263,8 @@ class SeriesService:
             self.logger.debug(f"Retrieved {len(all_series)} series from Sonarr")
 
         if series_filter:
-            all_series = [
-                s for s in all_series if series_filter.lower() in s.get("title", "").lower()
-            ]
+            series_filter_folded = series_filter.casefold()
+            all_series = [s for s in all_series if series_filter_folded in s["_title_folded"]]
             if self.logger:
                 self.logger.debug(
                     f"After series_filter '{series_filter}': {len(all_series)} series"
@@ -177,39 +277,66 @@ class SeriesService:
                     f"After username_filter '{username_filter}': {len(all_series)} series"
                 )
 
-        # Build watch lookup
-        tautulli_history = self.tautulli.get_episode_completed_history()
-
-        if self.logger:
-            self.logger.debug(
-                f"Retrieved {len(tautulli_history)} episode watch history records from Tautulli"
+        # Build watch lookup, restricted to the filtered series unless the full
+        # library lookup is already memoized
+        watch_lookup = self._watch_lookup_cache
+        if watch_lookup is None:
+            restricted = bool(series_filter or username_filter)
+            allowed_tvdb = (
+                {str(s["tvdb_id"]) for s in all_series if s.get("tvdb_id")} if restricted else None
             )
+            tautulli_history = history_future.result()
 
-        series_tvdb_cache = self.tautulli.build_series_metadata_cache(tautulli_history)
+            if self.logger:
+                self.logger.debug(
+                    f"Retrieved {len(tautulli_history)} episode watch history records from Tautulli"
+                )
 
-        if self.logger:
-            self.logger.debug(f"Built TVDB cache with {len(series_tvdb_cache)} unique series")
+            series_tvdb_cache = self.tautulli.build_series_metadata_cache(tautulli_history)
 
-        watch_lookup = self.media_matcher.build_episode_watch_lookup(
-            tautulli_history, series_tvdb_cache
-        )
+            if self.logger:
+                self.logger.debug(f"Built TVDB cache with {len(series_tvdb_cache)} unique series")
 
-        if self.logger:
-            self.logger.debug(f"Built episode watch lookup for {len(watch_lookup)} series")
+            watch_lookup = self.media_matcher.build_episode_watch_lookup(
+                tautulli_history, series_tvdb_cache, allowed_tvdb=allowed_tvdb
+            )
+            if not restricted:
+                self._watch_lookup_cache = watch_lookup
 
-        # Process each series
-        series_with_status = []
+            if self.logger:
+                self.logger.debug(f"Built episode watch lookup for {len(watch_lookup)} series")
+
+        # Load cached streaming availability for all remaining series in one batch
+        streaming_entries: Dict[str, Any] = {}
+        if check_streaming and self.cache_manager and self.cache_manager.store:
+            cached_by_key = self.cache_manager.store.get_many(
+                f"streaming_series_{series.get('tvdb_id')}"
+                for series in all_series
+                if series.get("tvdb_id")
+            )
+            streaming_entries = {
+                key[len("streaming_series_") :]: entry
+                for key, entry in cached_by_key.items()
+                if entry
+            }
+
+        # Bind loop-invariant lookups once
+        watch_get = watch_lookup.get
+        count_watched_episodes = self.watch_calculator.count_watched_episodes
+        determine_series_watch_status = self.watch_calculator.determine_series_watch_status
+        calculate_most_recent_watch = self.watch_calculator.calculate_most_recent_watch
 
+        # Process each series
         for series in all_series:
-            series_id = series.get("id")
-            tvdb_id = str(series.get("tvdb_id", ""))
-            series_watch_info = watch_lookup.get(tvdb_id, {})
-            series_user = series.get("user")
+            series_get = series.get
+            tvdb_id = str(series_get("tvdb_id", ""))
+            series_watch_info = watch_get(tvdb_id, {})
+            series_user = series_get("user")
 
             # Get episode counts
-            statistics = series.get("statistics", {})
-            total_available_episodes = statistics.get("episodeCount", 0)
-            total_downloaded_episodes = statistics.get("episodeFileCount", 0)
+            statistics_get = (series_get("statistics") or {}).get
+            total_available_episodes = statistics_get("episodeCount", 0)
+            total_downloaded_episodes = statistics_get("episodeFileCount", 0)
             total_episodes_in_watch_history = len(series_watch_info)
 
             # Determine best episode count source
@@ -220,41 +347,39 @@ class SeriesService:
             )
 
             # Count watched episodes
-            total_watched_episodes = self.watch_calculator.count_watched_episodes(
+            total_watched_episodes = count_watched_episodes(
                 series_watch_info, series_user, season_filter
             )
 
             # Determine watch status
-            watch_status = self.watch_calculator.determine_series_watch_status(
+            watch_status = determine_series_watch_status(
                 total_watched_episodes, actual_total_episodes
             )
 
             # Calculate most recent watch
-            most_recent_watch, days_since_watched = (
-                self.watch_calculator.calculate_most_recent_watch(series_watch_info)
-            )
-
-            # Get available seasons string
-            available_seasons_str = self._get_available_seasons_str(series_id)
-
-            # Calculate total series filesize
-            total_size_on_disk = sum(
-                season.get("statistics", {}).get("sizeOnDisk", 0)
-                for season in series.get("seasons", [])
-            )
+            most_recent_watch, days_since_watched = calculate_most_recent_watch(series_watch_info)
+
+            # Collect available seasons and total filesize in one pass over the seasons;
+            # skip the scan when Sonarr reports no downloaded files for the series
+            available_seasons = []
+            total_size_on_disk = 0
+            if statistics_get("episodeFileCount") != 0:
+                for season in series_get("seasons", []):
+                    season_statistics = season.get("statistics") or {}
+                    total_size_on_disk += season_statistics.get("sizeOnDisk", 0)
+                    if season_statistics.get("episodeFileCount", 0) > 0:
+                        available_seasons.append(str(season.get("seasonNumber")))
+            available_seasons_str = ", ".join(available_seasons) if available_seasons else "None"
 
             # Check streaming availability from cache if enabled
             streaming_available = None
-            if check_streaming and self.cache_manager and tvdb_id:
-                cache_key = f"streaming_series_{tvdb_id}"
-                if self.cache_manager.store:
-                    cached_entry = self.cache_manager.store.get(cache_key)
-                    if cached_entry:
-                        streaming_available = cached_entry.get("data")
-                        if self.logger:
-                            self.logger.debug(
-                                f"Found cached streaming status for {series.get('title')}: {streaming_available}"
-                            )
+            cached_entry = streaming_entries.get(tvdb_id)
+            if cached_entry:
+                streaming_available = cached_entry.get("data")
+                if self.logger:
+                    self.logger.debug(
+                        f"Found cached streaming status for {series_get('title')}: {streaming_available}"
+                    )
 
             series_data = {
                 **series,
@@ -276,9 +401,7 @@ class SeriesService:
             if streaming_available is not None:
                 series_data["streaming_available"] = streaming_available
 
-            series_with_status.append(series_data)
-
-        return series_with_status
+            yield series_data
 
     def get_series_ready_for_removal(
         self,
@@ -303,33 +426,32 @@ class SeriesService:
                 f"removal_mode={removal_mode}, check_streaming={check_streaming}"
             )
 
-        series_with_status = self.get_series_with_watch_status(
+        # Stream series through the checks so only removal candidates are kept
+        series_with_status = self._iter_series_with_watch_status(
             include_untagged=False, check_streaming=check_streaming
         )
         items_to_remove = []
 
         for series in series_with_status:
-            series_user = series.get("user")
-            if not series_user:
+            if not series.get("user"):
+                continue
+
+            # Both modes require the last watch to be old enough; check it once
+            days_since_watched = series.get("days_since_watched")
+            if days_since_watched is None or days_since_watched < days_watched:
                 continue
 
             if removal_mode == "series":
-                # Remove entire series if fully watched by requester and old enough
-                if (
-                    series.get("watch_status") == "fully_watched"
-                    and series.get("days_since_watched") is not None
-                    and series.get("days_since_watched") >= days_watched
-                ):
-                    items_to_remove.append({**series, "removal_type": "series"})
+                # Remove entire series if fully watched by requester. Each yielded
+                # series is already a fresh dict, so tag it in place rather than copying
+                if series.get("watch_status") == "fully_watched":
+                    series["removal_type"] = "series"
+                    items_to_remove.append(series)
 
             elif removal_mode == "season":
                 # Remove individual seasons that are fully watched
                 for season_data in series.get("seasons_data", []):
-                    if (
-                        season_data.get("completion_percentage") == 100
-                        and series.get("days_since_watched") is not None
-                        and series.get("days_since_watched") >= days_watched
-                    ):
+                    if season_data.get("completion_percentage") == 100:
                         items_to_remove.append(
                             {
                                 **series,
@@ -358,17 +480,21 @@ class SeriesService:
 
         # Check if identifier is numeric (series ID)
         if identifier.isdigit():
+            # Sonarr IDs are unique, so stop at the first hit
             series_id = int(identifier)
-            matching_series = [s for s in all_series if s.get("id") == series_id]
-            return matching_series
+            match = next((s for s in all_series if s.get("id") == series_id), None)
+            return [match] if match else []
 
         # Search by title with fuzzy matching
-        identifier_lower = identifier.lower().strip()
+        identifier_lower = identifier.casefold().strip()
         exact_matches = []
         partial_matches = []
 
         for series in all_series:
-            series_title = series.get("title", "").lower()
+            # Prefer the title casefolded once in get_all_series
+            series_title = series.get("_title_folded")
+            if series_title is None:
+                series_title = (series.get("title") or "").casefold()
 
             # Exact match (case insensitive)
             if series_title == identifier_lower:
@@ -379,30 +505,3 @@ class SeriesService:
 
         # Return exact matches first, then partial matches
         return exact_matches + partial_matches
-
-    def _get_available_seasons_str(self, series_id: int) -> str:
-        """
-        Get formatted string of available seasons for display.
-
-        Args:
-            series_id: Sonarr series ID
-
-        Returns:
-            Comma-separated string of available season numbers
-        """
-        try:
-            series_data = self.sonarr.get_series(series_id)
-            if not series_data or not isinstance(series_data, list) or len(series_data) == 0:
-                return "N/A"
-
-            series_info = series_data[0]
-            seasons = series_info.get("seasons", [])
-            available_seasons = [
-                str(s.get("seasonNumber"))
-                for s in seasons
-                if s.get("statistics", {}).get("episodeFileCount", 0) > 0
-            ]
-
-            return ", ".join(available_seasons) if available_seasons else "None"
-        except Exception:
-            return "N/A"
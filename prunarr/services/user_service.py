@@ -6,7 +6,7 @@ user associations from Radarr/Sonarr tags.
 """
 
 import re
-from typing import List, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Pattern, Union
 
 
 class UserService:
@@ -21,23 +21,72 @@ class UserService:
         tag_pattern: Compiled regex pattern for user tag extraction
     """
 
-    def __init__(self, user_tag_regex: str):
+    def __init__(self, user_tag_regex: Union[str, Pattern[str]]):
         """
         Initialize UserService with tag pattern.
 
         Args:
             user_tag_regex: Regex pattern for extracting username from tags
-                          (default: r'^\\d+ - (.+)$' for format "123 - username")
+                          (default: r'^\\d+ - (.+)$' for format "123 - username"),
+                          or an already compiled pattern such as Settings.user_tag_pattern
         """
+        # re.compile returns an already compiled pattern unchanged
         self.tag_pattern = re.compile(user_tag_regex)
+        # Bound once; called for every tag of every item in list/removal paths
+        self._match = self.tag_pattern.match
 
-    def extract_username_from_tags(self, tag_ids: List[int], api_client) -> Optional[str]:
+    def build_tag_map(self, api_client) -> Dict[int, str]:
+        """
+        Fetch all tags once and map tag IDs to their labels.
+
+        Args:
+            api_client: API client instance exposing get_tags()
+
+        Returns:
+            Dictionary mapping tag ID to tag label
+
+        Examples:
+            >>> tag_map = user_service.build_tag_map(sonarr_client)
+            >>> username = user_service.extract_username_from_tags([5, 10], tag_map)
+        """
+        return {
+            tag["id"]: tag.get("label", "")
+            for tag in api_client.get_tags() or []
+            if tag.get("id") is not None
+        }
+
+    def _iter_tag_labels(self, tag_ids: List[int], tag_source) -> Iterator[str]:
+        """
+        Yield labels for the given tag IDs from a tag map or an API client.
+
+        Args:
+            tag_ids: List of tag IDs to resolve
+            tag_source: Tag ID to label mapping, or API client for per-tag retrieval
+
+        Yields:
+            Tag label strings (may be empty for unknown tags)
+        """
+        if isinstance(tag_source, Mapping):
+            for tag_id in tag_ids:
+                yield tag_source.get(tag_id, "")
+            return
+
+        for tag_id in tag_ids:
+            try:
+                tag = tag_source.get_tag(tag_id)
+            except Exception:
+                # Continue processing remaining tags if one fails
+                continue
+            yield tag.get("label", "")
+
+    def extract_username_from_tags(self, tag_ids: List[int], tag_source) -> Optional[str]:
         """
         Extract username from media tags using configured regex pattern.
 
         Args:
             tag_ids: List of tag IDs to examine
-            api_client: API client instance (Radarr or Sonarr) for tag retrieval
+            tag_source: Tag map from build_tag_map(), or API client instance
+                        (Radarr or Sonarr) for per-tag retrieval
 
         Returns:
             Username string if a matching tag is found, None otherwise
@@ -48,16 +97,10 @@ class UserService:
             >>> username = user_service.extract_username_from_tags([5, 10], radarr_client)
             >>> print(username)  # "john_doe"
         """
-        for tag_id in tag_ids:
-            try:
-                tag = api_client.get_tag(tag_id)
-                label = tag.get("label", "")
-                match = self.tag_pattern.match(label)
-                if match:
-                    return match.group(1)
-            except Exception:
-                # Continue processing remaining tags if one fails
-                continue
+        for label in self._iter_tag_labels(tag_ids, tag_source):
+            match = self._match(label)
+            if match:
+                return match.group(1)
         return None
 
     def validate_tag_format(self, tag_label: str) -> bool:
@@ -70,7 +113,7 @@ class UserService:
         Returns:
             True if tag matches pattern, False otherwise
         """
-        return bool(self.tag_pattern.match(tag_label))
+        return bool(self._match(tag_label))
 
     def extract_username_from_label(self, tag_label: str) -> Optional[str]:
         """
@@ -82,7 +125,7 @@ class UserService:
         Returns:
             Username if pattern matches, None otherwise
         """
-        match = self.tag_pattern.match(tag_label)
+        match = self._match(tag_label)
         return match.group(1) if match else None
 
     def is_user_tag(self, tag_label: str) -> bool:
@@ -97,13 +140,14 @@ class UserService:
         """
         return self.validate_tag_format(tag_label)
 
-    def get_all_tag_labels(self, tag_ids: List[int], api_client) -> List[str]:
+    def get_all_tag_labels(self, tag_ids: List[int], tag_source) -> List[str]:
         """
         Get all tag labels for given tag IDs.
 
         Args:
             tag_ids: List of tag IDs to retrieve
-            api_client: API client instance (Radarr or Sonarr) for tag retrieval
+            tag_source: Tag map from build_tag_map(), or API client instance
+                        (Radarr or Sonarr) for per-tag retrieval
 
         Returns:
             List of tag label strings
@@ -112,19 +156,9 @@ class UserService:
             >>> labels = user_service.get_all_tag_labels([1, 2, 3], radarr_client)
             >>> print(labels)  # ["4K", "Action", "123 - john_doe"]
         """
-        labels = []
-        for tag_id in tag_ids:
-            try:
-                tag = api_client.get_tag(tag_id)
-                label = tag.get("label", "")
-                if label:
-                    labels.append(label)
-            except Exception:
-                # Skip failed tag retrievals
-                continue
-        return labels
+        return [label for label in self._iter_tag_labels(tag_ids, tag_source) if label]
 
-    def get_non_user_tag_labels(self, tag_ids: List[int], api_client) -> List[str]:
+    def get_non_user_tag_labels(self, tag_ids: List[int], tag_source) -> List[str]:
         """
         Get all non-user tag labels (tags that don't match user tag pattern).
 
@@ -132,7 +166,8 @@ class UserService:
 
         Args:
             tag_ids: List of tag IDs to examine
-            api_client: API client instance (Radarr or Sonarr) for tag retrieval
+            tag_source: Tag map from build_tag_map(), or API client instance
+                        (Radarr or Sonarr) for per-tag retrieval
 
         Returns:
             List of non-user tag label strings
@@ -141,5 +176,5 @@ class UserService:
             >>> tags = user_service.get_non_user_tag_labels([1, 2, 3], radarr_client)
             >>> print(tags)  # ["4K", "Action"] (excludes "123 - john_doe")
         """
-        all_labels = self.get_all_tag_labels(tag_ids, api_client)
+        all_labels = self.get_all_tag_labels(tag_ids, tag_source)
         return [label for label in all_labels if not self.is_user_tag(label)]
@@ -158,22 +158,21 @@ class WatchCalculator:
 
         count = 0
         for episode_key, episode_watchers in series_watch_info.items():
-            parsed = parse_episode_key(episode_key)
-            if not parsed:
+            # Cheap membership check first; only parse keys the user actually watched
+            if series_user not in episode_watchers:
                 continue
 
-            season_num, _ = parsed
-
-            # Apply season filter
-            if season_filter is not None and season_num != season_filter:
+            parsed = parse_episode_key(episode_key)
+            if not parsed:
                 continue
 
-            # Skip season 0 (specials) unless specifically requested
-            if season_filter is None and season_num == 0:
-                continue
+            season_num = parsed[0]
 
-            # Check if series user watched this episode
-            if series_user in episode_watchers:
+            if season_filter is None:
+                # Skip season 0 (specials) unless specifically requested
+                if season_num != 0:
+                    count += 1
+            elif season_num == season_filter:
                 count += 1
 
         return count
@@ -16,12 +16,18 @@ The SonarrAPI class serves as an enhanced facade over pyarr.SonarrAPI, providing
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import copy
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from pyarr import SonarrAPI as PyarrSonarrAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from prunarr.api.base_client import BaseAPIClient
+from prunarr.api.base_client import BaseAPIClient, decode_json
 
 # Optional cache manager import
 try:
@@ -29,6 +35,42 @@ try:
 except ImportError:
     CacheManager = None
 
+# Optional streaming JSON parser for filtering large lists without materializing them
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Connection pool sizing for direct HTTP calls sharing one session
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Default number of episode file deletions kept in flight at once
+DEFAULT_DELETE_CONCURRENCY = 8
+
+# Default number of per-series episode requests kept in flight at once
+DEFAULT_EPISODE_FETCH_CONCURRENCY = 8
+
+# Series-scoped responses remembered for conditional GETs, least recently used evicted
+ETAG_CACHE_MAX_ENTRIES = 128
+
+
+def _as_list(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Normalize an API payload to a list of records.
+
+    Args:
+        payload: Decoded response (list, single dict, or anything else)
+
+    Returns:
+        The list itself, a single dict wrapped in a list, or an empty list
+    """
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        return [payload]
+    return []
+
 
 class SonarrAPI(BaseAPIClient):
     """
@@ -60,6 +102,7 @@ class SonarrAPI(BaseAPIClient):
         cache_manager: Optional["CacheManager"] = None,
         debug: bool = False,
         log_level: str = "ERROR",
+        delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
     ) -> None:
         """
         Initialize the Sonarr API client with server connection details.
@@ -70,6 +113,8 @@ class SonarrAPI(BaseAPIClient):
             cache_manager: Optional cache manager for performance optimization
             debug: Enable debug logging
             log_level: Minimum log level to display
+            delete_concurrency: Maximum parallel episode file deletions
+                                (bounded by the HTTP pool size)
 
         Examples:
             >>> sonarr = SonarrAPI("http://localhost:8989", "your-api-key")
@@ -79,15 +124,88 @@ class SonarrAPI(BaseAPIClient):
         super().__init__(url, api_key, cache_manager, debug, log_level)
         self._base_url = self.base_url
         self._api_key = self.api_key
+        # Endpoint URLs for direct API calls, built once
+        self._episode_url = f"{self._base_url}/api/v3/episode"
+        self._episodefile_url = f"{self._base_url}/api/v3/episodefile"
+        self._episodefile_bulk_url = f"{self._episodefile_url}/bulk"
+        self.delete_concurrency = max(1, min(delete_concurrency, HTTP_POOL_MAXSIZE))
+        # series_id -> season number -> episode file IDs, reused across season deletes
+        self._season_file_index: Dict[int, Dict[int, List[int]]] = {}
+        # (url, params) -> (ETag, decoded payload) for conditional GETs, in LRU order
+        self._etag_cache: OrderedDict[Tuple[str, Tuple], Tuple[str, Any]] = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # Episode retrieval strategy that last succeeded against this server
+        self._fetch_episodes_impl: Optional[Callable[[int, Optional[int]], Any]] = None
+        # None until a bulk delete reveals whether the server supports it
+        self._bulk_delete_supported: Optional[bool] = None
 
     def _get_logger_name(self) -> str:
         """Get the logger name for this API client."""
         return "prunarr.sonarr"
 
     def _initialize_client(self) -> None:
-        """Initialize the underlying pyarr SonarrAPI client."""
+        """Initialize the underlying pyarr SonarrAPI client and the pooled HTTP session."""
         self._api = PyarrSonarrAPI(self.base_url, self.api_key)
 
+        # Direct API calls share one keep-alive session; auth travels in a header
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["X-Api-Key"] = self.api_key
+
+    def _get_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """
+        Perform a conditional GET and return the decoded JSON payload.
+
+        When a previous series-scoped response for the same URL and parameters
+        carried an ETag, the request is sent with If-None-Match and a 304 reply
+        returns a copy of the previously decoded payload without transferring or
+        parsing it. Only the ETAG_CACHE_MAX_ENTRIES most recently used responses
+        are kept, and library-wide listings are never stored.
+
+        Args:
+            url: Full request URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            requests.RequestException: If the HTTP request fails
+        """
+        cacheable = "seriesId" in params
+        key = (url, tuple(sorted(params.items())))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key) if cacheable else None
+            if cached:
+                self._etag_cache.move_to_end(key)
+
+        request_kwargs = {}
+        if cached:
+            request_kwargs["headers"] = {"If-None-Match": cached[0]}
+
+        response = self._session.get(url, params=params, timeout=30, **request_kwargs)
+        if cached and response.status_code == 304:
+            # Callers may modify what they receive; keep the stored payload pristine
+            return copy.deepcopy(cached[1])
+
+        response.raise_for_status()
+        payload = decode_json(response)
+
+        etag = response.headers.get("ETag")
+        if cacheable and isinstance(etag, str) and etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, copy.deepcopy(payload))
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                    self._etag_cache.popitem(last=False)
+        return payload
+
     def get_series(self, series_id: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Retrieve TV series from Sonarr with optional filtering and detailed metadata.
@@ -153,13 +271,17 @@ class SonarrAPI(BaseAPIClient):
         Raises:
             Exception: If series doesn't exist or API communication fails
         """
-        # Use cache if available
-        if self.cache_manager and self.cache_manager.is_enabled():
-            return self.cache_manager.get_sonarr_series_detail(
-                series_id, lambda: self._api.get_series(series_id)
-            )
 
-        return self._api.get_series(series_id)
+        def fetch() -> Dict[str, Any]:
+            # Use cache if available
+            if self.cache_manager and self.cache_manager.is_enabled():
+                return self.cache_manager.get_sonarr_series_detail(
+                    series_id, lambda: self._api.get_series(series_id)
+                )
+            return self._api.get_series(series_id)
+
+        # Concurrent lookups of the same series share one request
+        return self._single_flight(("series_detail", series_id), fetch)
 
     def get_episode(self, series_id: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -195,7 +317,9 @@ class SonarrAPI(BaseAPIClient):
             return self._api.get_episode(series=series_id, **kwargs)
         return self._api.get_episode(**kwargs)
 
-    def get_episodes_by_series_id(self, series_id: int) -> List[Dict[str, Any]]:
+    def get_episodes_by_series_id(
+        self, series_id: int, season_number: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Retrieve all episodes for a specific series using direct API access.
 
@@ -206,6 +330,8 @@ class SonarrAPI(BaseAPIClient):
 
         Args:
             series_id: Sonarr series ID to retrieve episodes for
+            season_number: Optional season to restrict the result to; the filter
+                           is sent to Sonarr so only that season is transferred
 
         Returns:
             List of episode dictionaries with complete metadata, file information,
@@ -224,63 +350,115 @@ class SonarrAPI(BaseAPIClient):
             3. pyarr with series parameter (fallback 2)
             4. Empty list if all methods fail (graceful degradation)
         """
-        # Use cache if available
-        if self.cache_manager and self.cache_manager.is_enabled():
-            return self.cache_manager.get_sonarr_episodes(
-                series_id, lambda: self._fetch_episodes(series_id)
-            )
 
-        return self._fetch_episodes(series_id)
+        def fetch() -> List[Dict[str, Any]]:
+            # Use cache if available
+            if self.cache_manager and self.cache_manager.is_enabled():
+                return self.cache_manager.get_sonarr_episodes(
+                    series_id,
+                    lambda: self._fetch_episodes(series_id, season_number),
+                    season_number,
+                )
+            return self._fetch_episodes(series_id, season_number)
+
+        # Concurrent lookups of the same series share one request
+        return self._single_flight(("episodes", series_id, season_number), fetch)
 
-    def _fetch_episodes(self, series_id: int) -> List[Dict[str, Any]]:
+    def get_episodes_by_series_ids(
+        self, series_ids: List[int], concurrency: int = DEFAULT_EPISODE_FETCH_CONCURRENCY
+    ) -> Dict[int, List[Dict[str, Any]]]:
         """
-        Internal method to fetch episodes (extracted for caching).
+        Retrieve episodes for many series concurrently.
+
+        Each series is fetched through get_episodes_by_series_id(), so cache
+        lookups and fallbacks behave exactly as for a single series, while at
+        most ``concurrency`` requests are in flight at once.
 
         Args:
-            series_id: Sonarr series ID
+            series_ids: Sonarr series IDs to retrieve episodes for
+            concurrency: Maximum number of parallel requests
 
         Returns:
-            List of episode dictionaries
+            Dictionary mapping each series ID to its list of episodes
+
+        Examples:
+            >>> episodes_by_series = sonarr.get_episodes_by_series_ids([1, 2, 3])
+            >>> print(len(episodes_by_series[2]))
         """
-        try:
-            # Primary method: Direct HTTP call to Sonarr API bypassing pyarr limitations
-            url = f"{self._base_url}/api/v3/episode"
-            params = {"seriesId": series_id, "includeImages": "false", "apikey": self._api_key}
+        unique_ids = list(dict.fromkeys(series_ids))
+        if not unique_ids:
+            return {}
+
+        workers = max(1, min(concurrency, HTTP_POOL_MAXSIZE, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.get_episodes_by_series_id, unique_ids)
+            return dict(zip(unique_ids, results))
+
+    def _fetch_episodes(
+        self, series_id: int, season_number: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Internal method to fetch episodes (extracted for caching).
 
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            episodes = response.json()
+        The first retrieval strategy that succeeds is remembered, so later
+        calls go straight to it instead of failing through the whole ladder
+        again. If the remembered strategy stops working the ladder is retried.
 
-            if isinstance(episodes, list):
-                return episodes
-            elif isinstance(episodes, dict):
-                return [episodes]
-            else:
-                return []
+        Args:
+            series_id: Sonarr series ID
+            season_number: Optional season to restrict the result to
 
-        except Exception:
-            # Fallback 1: pyarr with seriesId parameter
+        Returns:
+            List of episode dictionaries
+        """
+        episodes = None
+        strategy = self._fetch_episodes_impl
+        if strategy is not None:
             try:
-                episodes = self._api.get_episode(seriesId=series_id)
-                if isinstance(episodes, list):
-                    return episodes
-                elif isinstance(episodes, dict):
-                    return [episodes]
-                else:
-                    return []
+                episodes = _as_list(strategy(series_id, season_number))
             except Exception:
+                self._fetch_episodes_impl = None
+
+        if episodes is None:
+            for strategy in (
+                self._fetch_episodes_http,
+                self._fetch_episodes_pyarr_series_id,
+                self._fetch_episodes_pyarr_series,
+            ):
                 try:
-                    # Fallback 2: pyarr with series parameter (older versions)
-                    episodes = self._api.get_episode(series=series_id)
-                    if isinstance(episodes, list):
-                        return episodes
-                    elif isinstance(episodes, dict):
-                        return [episodes]
-                    else:
-                        return []
+                    episodes = _as_list(strategy(series_id, season_number))
                 except Exception:
-                    # Graceful degradation: return empty list if all methods fail
-                    return []
+                    continue
+                self._fetch_episodes_impl = strategy
+                break
+            else:
+                # Graceful degradation: return empty list if all methods fail
+                return []
+
+        if season_number is None:
+            return episodes
+
+        # Only the direct call filters server-side; keep the result exact either way
+        return [ep for ep in episodes if ep.get("seasonNumber") == season_number]
+
+    def _fetch_episodes_http(self, series_id: int, season_number: Optional[int] = None) -> Any:
+        """Primary method: direct HTTP call to Sonarr API bypassing pyarr limitations."""
+        params = {"seriesId": series_id, "includeImages": "false"}
+        if season_number is not None:
+            params["seasonNumber"] = season_number
+        return self._get_json(self._episode_url, params)
+
+    def _fetch_episodes_pyarr_series_id(
+        self, series_id: int, season_number: Optional[int] = None
+    ) -> Any:
+        """Fallback 1: pyarr with seriesId parameter."""
+        return self._api.get_episode(seriesId=series_id)
+
+    def _fetch_episodes_pyarr_series(
+        self, series_id: int, season_number: Optional[int] = None
+    ) -> Any:
+        """Fallback 2: pyarr with series parameter (older versions)."""
+        return self._api.get_episode(series=series_id)
 
     def get_tag(self, tag_id: int) -> Dict[str, Any]:
         """
@@ -303,11 +481,33 @@ class SonarrAPI(BaseAPIClient):
         Raises:
             Exception: If tag doesn't exist or API communication fails
         """
-        # Use cache if available
+
+        def fetch() -> Dict[str, Any]:
+            # Use cache if available
+            if self.cache_manager and self.cache_manager.is_enabled():
+                return self.cache_manager.get_sonarr_tag(tag_id, lambda: self._api.get_tag(tag_id))
+            return self._api.get_tag(tag_id)
+
+        # Concurrent lookups of the same tag share one request
+        return self._single_flight(("tag", tag_id), fetch)
+
+    def get_tags(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve all tags defined in Sonarr with a single API call.
+
+        Prefer this over repeated get_tag() calls when resolving the tags of
+        many series at once. Results are cached if cache_manager is available.
+
+        Returns:
+            List of tag dictionaries with keys like 'id', 'label'
+
+        Raises:
+            Exception: If API communication fails
+        """
         if self.cache_manager and self.cache_manager.is_enabled():
-            return self.cache_manager.get_sonarr_tag(tag_id, lambda: self._api.get_tag(tag_id))
+            return self.cache_manager.get_sonarr_tags(lambda: self._api.get_tag())
 
-        return self._api.get_tag(tag_id)
+        return self._api.get_tag()
 
     def delete_series(
         self, series_id: int, delete_files: bool = True, add_exclusion: bool = False
@@ -348,6 +548,137 @@ class SonarrAPI(BaseAPIClient):
         except Exception:
             # Log the exception in production code, but return False for now
             return False
+        finally:
+            self._season_file_index.pop(series_id, None)
+            if self.cache_manager:
+                self.cache_manager.invalidate_sonarr_episode_files(series_id)
+
+    def delete_episode_file(self, episode_file_id: int, series_id: Optional[int] = None) -> bool:
+        """
+        Delete a single episode file from disk via Sonarr.
+
+        Args:
+            episode_file_id: Sonarr episode file ID to delete
+            series_id: Optional owning series ID whose cached episode files
+                       should be invalidated
+
+        Returns:
+            True if deletion was successful, False if it failed
+        """
+        try:
+            response = self._session.delete(
+                f"{self._episodefile_url}/{episode_file_id}", timeout=30
+            )
+            response.raise_for_status()
+            return True
+        except Exception:
+            return False
+        finally:
+            if series_id is not None and self.cache_manager:
+                self.cache_manager.invalidate_sonarr_episode_files(series_id)
+
+    def delete_episode_files_bulk(self, episode_file_ids: List[int]) -> bool:
+        """
+        Delete several episode files with one request to Sonarr's bulk endpoint.
+
+        Args:
+            episode_file_ids: Sonarr episode file IDs to delete
+
+        Returns:
+            True if Sonarr accepted the bulk deletion, False otherwise. Older
+            Sonarr versions without the endpoint are remembered and skipped.
+        """
+        try:
+            response = self._session.delete(
+                self._episodefile_bulk_url,
+                json={"episodeFileIds": list(episode_file_ids)},
+                timeout=60,
+            )
+        except Exception:
+            return False
+
+        if response.status_code in (404, 405):
+            self._bulk_delete_supported = False
+            return False
+        return response.status_code in (200, 204)
+
+    def delete_season_files(self, series_id: int, season_number: int) -> bool:
+        """
+        Delete all downloaded episode files of one season.
+
+        All files are removed with a single bulk request. On Sonarr versions
+        without the bulk endpoint, deletions are issued individually in
+        parallel, with at most ``delete_concurrency`` requests in flight so
+        the Sonarr server is not overwhelmed.
+
+        Args:
+            series_id: Unique Sonarr series ID
+            season_number: Season whose episode files should be deleted
+
+        Returns:
+            True if every file was deleted (or none existed), False otherwise,
+            including when the series' episode files could not be listed
+
+        Examples:
+            >>> success = sonarr.delete_season_files(123, season_number=2)
+        """
+        try:
+            by_season = self._get_season_file_index(series_id)
+        except Exception:
+            # A failed or truncated listing must never pass for a season without files
+            return False
+        season_file_ids = by_season.get(season_number)
+        if not season_file_ids:
+            return True
+
+        all_success = self._bulk_delete_supported is not False and (
+            self.delete_episode_files_bulk(season_file_ids)
+        )
+        if not all_success:
+            workers = min(self.delete_concurrency, len(season_file_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.delete_episode_file, file_id)
+                    for file_id in season_file_ids
+                ]
+                all_success = all([future.result() for future in as_completed(futures)])
+
+        if all_success:
+            by_season.pop(season_number, None)
+        else:
+            # Unknown which files survived; rebuild the index on next use
+            self._season_file_index.pop(series_id, None)
+
+        if self.cache_manager and self.cache_manager.is_enabled():
+            self.cache_manager.clear_series()
+
+        return all_success
+
+    def _get_season_file_index(self, series_id: int) -> Dict[int, List[int]]:
+        """
+        Group a series' episode file IDs by season number, building the index once.
+
+        The index is only stored once the listing completed, so a failed listing
+        is retried on next use instead of being remembered as an empty series.
+
+        Args:
+            series_id: Unique Sonarr series ID
+
+        Returns:
+            Dictionary mapping season number to episode file IDs
+
+        Raises:
+            Exception: If the series' episode files cannot be listed
+        """
+        by_season = self._season_file_index.get(series_id)
+        if by_season is None:
+            by_season = {}
+            for episode_file in self._iter_episode_files(series_id):
+                file_id = episode_file.get("id")
+                if file_id is not None:
+                    by_season.setdefault(episode_file.get("seasonNumber"), []).append(file_id)
+            self._season_file_index[series_id] = by_season
+        return by_season
 
     def get_season_info(self, series_id: int) -> List[Dict[str, Any]]:
         """
@@ -390,8 +721,8 @@ class SonarrAPI(BaseAPIClient):
             series_id: Optional series ID to filter episodes by
 
         Returns:
-            List of standardized episode dictionaries containing file information,
-            metadata, and download status
+            List of standardized episode dictionaries containing file information
+            (size, quality, path), metadata, and download status
 
         Examples:
             Get all episodes with files:
@@ -406,40 +737,79 @@ class SonarrAPI(BaseAPIClient):
             with the 'has_file' field indicating download status.
         """
         try:
-            # Get episodes using appropriate method based on series_id
-            if series_id:
-                episodes = self._api.get_episode(series=series_id)
-            else:
-                episodes = self._api.get_episode()
-
-            # Ensure episodes is a list for consistent processing
-            if not isinstance(episodes, list):
-                episodes = [episodes] if episodes else []
-
-            # Transform to standardized format with comprehensive information
-            episodes_with_info = []
-            for episode in episodes:
-                episodes_with_info.append(
-                    {
-                        "id": episode.get("id"),
-                        "series_id": episode.get("seriesId"),
-                        "season_number": episode.get("seasonNumber"),
-                        "episode_number": episode.get("episodeNumber"),
-                        "title": episode.get("title"),
-                        "has_file": episode.get("hasFile", False),
-                        "episode_file_id": episode.get("episodeFileId"),
-                        "air_date": episode.get("airDate"),
-                        "overview": episode.get("overview", ""),
-                        "runtime": episode.get("runtime", 0),
-                        "monitored": episode.get("monitored", False),
-                        "downloaded": episode.get("hasFile", False),
-                    }
-                )
-
-            return episodes_with_info
+            return list(self._iter_episodes_with_files(series_id))
         except Exception:
             return []
 
+    def _iter_episodes_with_files(
+        self, series_id: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield standardized episode dictionaries one at a time.
+
+        Lets single-pass consumers avoid materializing the full episode list.
+
+        Args:
+            series_id: Optional series ID to filter episodes by
+
+        Yields:
+            Standardized episode dictionaries (see get_episodes_with_files)
+
+        Raises:
+            Exception: If episodes cannot be retrieved from Sonarr
+        """
+        # Get episodes using appropriate method based on series_id
+        if series_id:
+            try:
+                # One request returns the episodes with their file records embedded
+                episodes = self._fetch_episodes_with_files(series_id)
+            except Exception:
+                episodes = self._api.get_episode(series=series_id)
+        else:
+            episodes = self._api.get_episode()
+
+        # Ensure episodes is a list for consistent processing
+        if not isinstance(episodes, list):
+            episodes = [episodes] if episodes else []
+
+        # Transform to standardized format with comprehensive information
+        for episode in episodes:
+            episode_file = episode.get("episodeFile") or {}
+            yield {
+                "id": episode.get("id"),
+                "series_id": episode.get("seriesId"),
+                "season_number": episode.get("seasonNumber"),
+                "episode_number": episode.get("episodeNumber"),
+                "title": episode.get("title"),
+                "has_file": episode.get("hasFile", False),
+                "episode_file_id": episode.get("episodeFileId"),
+                "air_date": episode.get("airDate"),
+                "overview": episode.get("overview", ""),
+                "runtime": episode.get("runtime", 0),
+                "monitored": episode.get("monitored", False),
+                "downloaded": episode.get("hasFile", False),
+                "size": episode_file.get("size", 0),
+                "quality": episode_file.get("quality", {}).get("quality", {}).get("name"),
+                "path": episode_file.get("path"),
+            }
+
+    def _fetch_episodes_with_files(self, series_id: int) -> List[Dict[str, Any]]:
+        """
+        Fetch a series' episodes with their episode file records embedded.
+
+        Args:
+            series_id: Sonarr series ID
+
+        Returns:
+            List of episode dictionaries carrying an ``episodeFile`` sub-object
+            when the episode is downloaded
+
+        Raises:
+            requests.RequestException: If the HTTP request fails
+        """
+        params = {"seriesId": series_id, "includeEpisodeFile": "true", "includeImages": "false"}
+        return self._get_json(self._episode_url, params)
+
     def get_episode_files(self, series_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve comprehensive episode file information including size and quality data.
@@ -466,29 +836,106 @@ class SonarrAPI(BaseAPIClient):
 
         Note:
             File sizes are returned in bytes. Use appropriate formatting
-            for human-readable display.
+            for human-readable display. Series-scoped results are cached
+            briefly if cache_manager is available.
         """
         try:
-            # Direct HTTP call to Sonarr API for comprehensive episode file data
-            url = f"{self._base_url}/api/v3/episodefile"
-            params = {"apikey": self._api_key}
+            return self._load_episode_files(series_id)
+        except Exception:
+            return []
+
+    def _load_episode_files(self, series_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Load episode files through the cache when enabled, letting failures propagate.
+
+        Args:
+            series_id: Optional series ID to filter episode files by
+
+        Returns:
+            List of episode file dictionaries
+
+        Raises:
+            requests.RequestException: If the HTTP request fails
+        """
+        if series_id and self.cache_manager and self.cache_manager.is_enabled():
+            return self.cache_manager.get_sonarr_episode_files(
+                series_id, lambda: self._fetch_episode_files(series_id)
+            )
+
+        return self._fetch_episode_files(series_id)
+
+    def _iter_episode_files(
+        self,
+        series_id: int,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a series' episode files, optionally filtered by a predicate.
+
+        Uses the cached list when caching is enabled. Otherwise, when ijson
+        is installed, records are parsed straight from the response stream so
+        only one record is held in memory at a time.
+
+        Args:
+            series_id: Sonarr series ID
+            predicate: Optional filter applied to each episode file record
+
+        Yields:
+            Episode file dictionaries accepted by the predicate
+
+        Raises:
+            Exception: If the episode files cannot be listed completely
+        """
+        if ijson is None or (self.cache_manager and self.cache_manager.is_enabled()):
+            records = iter(self._load_episode_files(series_id))
+        else:
+            records = self._stream_episode_files(series_id)
+
+        for record in records:
+            if predicate is None or predicate(record):
+                yield record
+
+    def _stream_episode_files(self, series_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        Stream-parse episode file records for a series with ijson.
+
+        Args:
+            series_id: Sonarr series ID
 
-            if series_id:
-                params["seriesId"] = series_id
+        Yields:
+            Episode file dictionaries as they are parsed
 
-            response = requests.get(url, params=params, timeout=30)
+        Raises:
+            Exception: If the request fails or the stream breaks off mid-listing,
+                so a partial listing is never mistaken for a complete one
+        """
+        with self._session.get(
+            self._episodefile_url, params={"seriesId": series_id}, timeout=30, stream=True
+        ) as response:
             response.raise_for_status()
-            episode_files = response.json()
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "item", use_float=True)
 
-            if isinstance(episode_files, list):
-                return episode_files
-            elif isinstance(episode_files, dict):
-                return [episode_files]
-            else:
-                return []
+    def _fetch_episode_files(self, series_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Internal method to fetch episode files (extracted for caching).
 
-        except Exception:
-            return []
+        Args:
+            series_id: Optional series ID to filter episode files by
+
+        Returns:
+            List of episode file dictionaries
+
+        Raises:
+            requests.RequestException: If the HTTP request fails
+        """
+        # Direct HTTP call to Sonarr API for comprehensive episode file data
+        params = {}
+
+        if series_id:
+            params["seriesId"] = series_id
+
+        return _as_list(self._get_json(self._episodefile_url, params))
 
     def get_series_episodes_summary(self, series_id: int) -> Dict[str, Any]:
         """
@@ -519,37 +966,39 @@ class SonarrAPI(BaseAPIClient):
         Note:
             The summary includes all seasons including specials (season 0)
             and provides both individual season and series-wide statistics.
+            Sizes come from the embedded episode file records, so no separate
+            get_episode_files() call is needed.
         """
         try:
-            episodes = self.get_episodes_with_files(series_id)
-            seasons_info = {}
+            totals: Counter = Counter()
+            downloaded: Counter = Counter()
+            sizes: Counter = Counter()
 
-            # Process episodes and organize by season
-            for episode in episodes:
+            # Count episodes per season in a single pass
+            for episode in self._iter_episodes_with_files(series_id):
                 season_num = episode.get("season_number")
-                if season_num not in seasons_info:
-                    seasons_info[season_num] = {
-                        "season_number": season_num,
-                        "episodes": [],
-                        "total_episodes": 0,
-                        "downloaded_episodes": 0,
-                    }
-
-                seasons_info[season_num]["episodes"].append(episode)
-                seasons_info[season_num]["total_episodes"] += 1
+                totals[season_num] += 1
                 if episode.get("has_file"):
-                    seasons_info[season_num]["downloaded_episodes"] += 1
-
-            # Calculate series-wide statistics
-            total_downloaded = sum(s["downloaded_episodes"] for s in seasons_info.values())
-            total_episodes = sum(s["total_episodes"] for s in seasons_info.values())
+                    downloaded[season_num] += 1
+                    sizes[season_num] += episode.get("size") or 0
+
+            seasons = [
+                {
+                    "season_number": season_num,
+                    "total_episodes": totals[season_num],
+                    "downloaded_episodes": downloaded[season_num],
+                    "size_on_disk": sizes[season_num],
+                }
+                for season_num in totals
+            ]
 
             return {
                 "series_id": series_id,
-                "seasons": list(seasons_info.values()),
-                "total_seasons": len(seasons_info),
-                "total_episodes": total_episodes,
-                "downloaded_episodes": total_downloaded,
+                "seasons": seasons,
+                "total_seasons": len(seasons),
+                "total_episodes": sum(totals.values()),
+                "downloaded_episodes": sum(downloaded.values()),
+                "size_on_disk": sum(sizes.values()),
             }
         except Exception:
             # Return empty summary structure on any error
@@ -559,4 +1008,5 @@ class SonarrAPI(BaseAPIClient):
                 "total_seasons": 0,
                 "total_episodes": 0,
                 "downloaded_episodes": 0,
+                "size_on_disk": 0,
             }
@@ -17,15 +17,40 @@ The TautulliAPI class provides:
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from prunarr.api.base_client import BaseAPIClient
+from prunarr.api.base_client import BaseAPIClient, decode_json
 
 # Compiled regex patterns for efficient ID extraction
 IMDB_ID_PATTERN = re.compile(r"^imdb:\/\/(tt\d+)")
 TVDB_ID_PATTERN = re.compile(r"^tvdb:\/\/(\d+)")
+# Both of the above as one alternation, so a single scan of the GUIDs finds either ID
+GUID_PATTERN = re.compile(r"^(?:imdb://(?P<imdb>tt\d+)|tvdb://(?P<tvdb>\d+))")
+
+# Seconds that derived history results are reused within a single process
+MEMO_TTL_SECONDS = 60
+
+# Concurrent page requests once the total history size is known
+HISTORY_PAGE_WORKERS = 5
+
+# Metadata responses kept in memory per client; oldest entries are evicted first
+METADATA_MEMO_MAX_ENTRIES = 4096
+
+# Concurrent metadata requests when resolving series TVDB IDs
+METADATA_WORKERS = 8
+
+# Connection pool sizing for the shared keep-alive session
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 20
 
 # Optional cache manager import
 try:
@@ -34,6 +59,106 @@ except ImportError:
     CacheManager = None
 
 
+def _scan_guids(metadata: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract the IMDb and TVDB IDs from a metadata record's GUIDs in one pass.
+
+    Args:
+        metadata: Tautulli metadata dictionary (may lack "guids")
+
+    Returns:
+        Tuple of (imdb_id, tvdb_id); each is None when no GUID provides it
+    """
+    imdb_id = tvdb_id = None
+    for guid in metadata.get("guids", []) or []:
+        m = GUID_PATTERN.match(guid)
+        if m is None:
+            continue
+        imdb_id = imdb_id or m.group("imdb")
+        tvdb_id = tvdb_id or m.group("tvdb")
+        if imdb_id and tvdb_id:
+            break
+    return imdb_id, tvdb_id
+
+
+def _format_history_title(record: Dict[str, Any]) -> str:
+    """
+    Build a display title, combining series and episode details for episodes.
+
+    Args:
+        record: Raw Tautulli history record
+
+    Returns:
+        Display title; movies and other types keep their original title
+    """
+    get = record.get
+    title = get("title", "")
+    if get("media_type", "") != "episode":
+        return title
+
+    series_title = get("grandparent_title", "")
+    season_num = get("parent_media_index")
+    episode_num = get("media_index")
+    if series_title and title:
+        if season_num is not None and episode_num is not None:
+            return f"{series_title} - {title} (S{season_num} · E{episode_num})"
+        return f"{series_title} - {title}"
+    return series_title or title
+
+
+def _format_movie_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a raw history record to the fields used for completed movies."""
+    get = record.get
+    return {
+        "title": get("title"),
+        "rating_key": get("rating_key"),
+        "user": get("friendly_name"),
+        "watched_at": get("date"),
+        "watched_status": get("watched_status"),
+        "media_type": get("media_type"),
+    }
+
+
+def _format_episode_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a raw history record to the fields used for completed episodes."""
+    get = record.get
+    return {
+        "title": get("title"),
+        "rating_key": get("rating_key"),
+        "parent_rating_key": get("parent_rating_key"),
+        "grandparent_rating_key": get("grandparent_rating_key"),
+        "user": get("friendly_name"),
+        "watched_at": get("date"),
+        "watched_status": get("watched_status"),
+        "media_type": get("media_type"),
+        "season_num": get("parent_media_index"),
+        "episode_num": get("media_index"),
+        "series_title": get("grandparent_title"),
+    }
+
+
+def _format_history_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a raw history record to the fields shown in history listings."""
+    get = record.get
+    return {
+        "history_id": get("id"),
+        "title": _format_history_title(record),
+        "rating_key": get("rating_key"),
+        "user": get("friendly_name"),
+        "user_id": get("user_id"),
+        "watched_at": get("date"),
+        "stopped": get("stopped"),
+        "watched_status": get("watched_status"),
+        "media_type": get("media_type", ""),
+        "year": get("year"),
+        "duration": get("duration"),
+        "percent_complete": get("percent_complete"),
+        "ip_address": get("ip_address"),
+        "platform": get("platform"),
+        "player": get("player"),
+    }
+
+
 class TautulliAPI(BaseAPIClient):
     """
     Advanced Tautulli API client with comprehensive watch history and metadata capabilities.
@@ -78,15 +203,80 @@ class TautulliAPI(BaseAPIClient):
             >>> tautulli = TautulliAPI("http://localhost:8181", "your-api-key")
             >>> history = tautulli.get_watch_history(limit=100)
         """
+        # In-process memo of derived results: name -> (expires_at, source, value)
+        self._memo: Dict[str, Tuple[float, Any, Any]] = {}
+        # Metadata is effectively immutable within a run: rating_key -> metadata
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
+        self._metadata_lock = threading.Lock()
         super().__init__(base_url, api_key, cache_manager, debug, log_level)
 
+    def _memo_get(self, name: str, source: Any = None) -> Any:
+        """Return a memoized value if it has not expired and was built from source."""
+        entry = self._memo.get(name)
+        if entry is None:
+            return None
+        expires_at, memo_source, value = entry
+        if expires_at < time.monotonic() or memo_source is not source:
+            return None
+        return value
+
+    def _memo_set(self, name: str, value: Any, source: Any = None) -> None:
+        """Memoize a derived value for MEMO_TTL_SECONDS."""
+        self._memo[name] = (time.monotonic() + MEMO_TTL_SECONDS, source, value)
+
+    def _memoized(self, name: str, build: Callable[[], Any], source: Any = None) -> Any:
+        """
+        Return the memoized value for name, building it at most once for concurrent callers.
+
+        Args:
+            name: Memo entry name
+            build: Function computing the value on a miss
+            source: Object the value is derived from; a different source is a miss
+
+        Returns:
+            The memoized or freshly built value
+        """
+        value = self._memo_get(name, source)
+        if value is not None:
+            return value
+
+        def build_once() -> Any:
+            # Callers that missed just before the previous build finished find it here
+            value = self._memo_get(name, source)
+            if value is None:
+                value = build()
+                self._memo_set(name, value, source)
+            return value
+
+        return self._single_flight(("memo", name, id(source)), build_once)
+
     def _get_logger_name(self) -> str:
         """Get the logger name for this API client."""
         return "prunarr.tautulli"
 
     def _initialize_client(self) -> None:
-        """Initialize the Tautulli API client (no separate client library)."""
-        # Tautulli uses direct HTTP requests, no separate client library needed
+        """Initialize the pooled HTTP session (Tautulli needs no separate client library)."""
+        # Consecutive history pages and metadata lookups reuse keep-alive connections
+        self._session = requests.Session()
+        # Transient failures are retried with backoff so a glitch mid-pagination
+        # does not abort the whole history walk
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Accept"] = "application/json"
+        # History pages are repetitive JSON; keep compressed transfer advertised
+        # (requests decodes gzip/deflate bodies transparently)
+        self._session.headers.setdefault("Accept-Encoding", "gzip, deflate")
 
     def _request(self, cmd: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -105,7 +295,7 @@ class TautulliAPI(BaseAPIClient):
         Raises:
             requests.HTTPError: If API request fails or authentication is invalid
             requests.Timeout: If request exceeds timeout limit
-            ValueError: If API returns invalid JSON
+            ValueError: If API returns invalid JSON, or transient errors persist after retries
 
         Note:
             All API requests automatically include authentication and are limited
@@ -116,7 +306,7 @@ class TautulliAPI(BaseAPIClient):
         params.update({"apikey": self.api_key, "cmd": cmd})
 
         try:
-            response = requests.get(url, params=params, timeout=15)
+            response = self._session.get(url, params=params, timeout=15)
 
             # Handle authentication errors
             if response.status_code == 401:
@@ -137,7 +327,7 @@ class TautulliAPI(BaseAPIClient):
 
             # Parse JSON response
             try:
-                json_data = response.json()
+                json_data = decode_json(response)
 
                 # Check for Tautulli API errors
                 if (
@@ -160,6 +350,12 @@ class TautulliAPI(BaseAPIClient):
             )
         except requests.exceptions.Timeout:
             raise ValueError("Tautulli API request timed out. Server may be overloaded.")
+        except requests.exceptions.RetryError:
+            position = f" at record {params['start']}" if "start" in params else ""
+            raise ValueError(
+                f"Tautulli kept failing for {cmd}{position} after retries. "
+                "Server may be overloaded."
+            )
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Network error connecting to Tautulli: {e}")
 
@@ -169,6 +365,9 @@ class TautulliAPI(BaseAPIClient):
         order_column: str = "date",
         order_dir: str = "desc",
         limit: Optional[int] = None,
+        user_id: Optional[int] = None,
+        media_type: Optional[str] = None,
+        search: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve comprehensive watch history with advanced pagination and sorting.
@@ -182,6 +381,9 @@ class TautulliAPI(BaseAPIClient):
             order_column: Column to sort by (date, friendly_name, media_type, etc.)
             order_dir: Sort direction ("desc" or "asc")
             limit: Maximum number of records to return (None for all available)
+            user_id: Only return history for this Tautulli user ID (server-side)
+            media_type: Only return this media type, e.g. "movie" or "episode" (server-side)
+            search: Free-text search applied by Tautulli (server-side)
 
         Returns:
             List of comprehensive watch history records with complete metadata
@@ -201,18 +403,63 @@ class TautulliAPI(BaseAPIClient):
             while respecting rate limits and server performance. Results are cached
             if cache_manager is available.
         """
+        server_filters = {
+            key: value
+            for key, value in (("user_id", user_id), ("media_type", media_type), ("search", search))
+            if value is not None
+        }
+
         # Try cache first if available
         if self.cache_manager and self.cache_manager.is_enabled():
             cached_data = self.cache_manager.get_tautulli_history(
-                lambda: self._fetch_watch_history(page_size, order_column, order_dir, limit),
+                lambda: self._fetch_watch_history(
+                    page_size, order_column, order_dir, limit, server_filters
+                ),
                 page_size,
                 order_column,
                 order_dir,
                 limit,
+                *sorted(server_filters.items()),
             )
             return cached_data
 
-        return self._fetch_watch_history(page_size, order_column, order_dir, limit)
+        return self._fetch_watch_history(page_size, order_column, order_dir, limit, server_filters)
+
+    def _fetch_history_page(
+        self,
+        start: int,
+        length: int,
+        order_column: str,
+        order_dir: str,
+        server_filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Fetch a single page of watch history.
+
+        Args:
+            start: Offset of the first record
+            length: Number of records to request
+            order_column: Column to sort by
+            order_dir: Sort direction
+            server_filters: Extra get_history parameters (user_id, media_type, search)
+
+        Returns:
+            Tuple of (page records, total records reported by Tautulli or None)
+        """
+        params = {
+            "length": length,
+            "start": start,
+            "order_column": order_column,
+            "order_dir": order_dir,
+        }
+        if server_filters:
+            params.update(server_filters)
+
+        resp = self._request("get_history", params=params)
+        # Tautulli response structure: { "data": { "data": [ ... ], "recordsFiltered": ... } }
+        data_obj = resp.get("data", {})
+        total = data_obj.get("recordsFiltered") or data_obj.get("recordsTotal")
+        return data_obj.get("data", []), total
 
     def _fetch_watch_history(
         self,
@@ -220,54 +467,146 @@ class TautulliAPI(BaseAPIClient):
         order_column: str,
         order_dir: str,
         limit: Optional[int],
+        server_filters: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Internal method to fetch watch history from API."""
-        all_records: List[Dict[str, Any]] = []
-        start = 0
-        total_records_available = None
+        """Internal method to materialize watch history from the API."""
+        return list(
+            islice(
+                self._iter_watch_history(page_size, order_column, order_dir, limit, server_filters),
+                limit,
+            )
+        )
+
+    def _iter_watch_history(
+        self,
+        page_size: int,
+        order_column: str,
+        order_dir: str,
+        limit: Optional[int] = None,
+        server_filters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield watch history records page by page from the API.
 
+        The first page reports the total record count; when it is known, the
+        remaining pages are requested concurrently instead of one after another.
+        The limit only bounds how many records are requested; callers slice the
+        iterator themselves.
+        """
+        first_length = min(page_size, limit) if limit else page_size
+        page_data, total_records_available = self._fetch_history_page(
+            0, first_length, order_column, order_dir, server_filters
+        )
+        yield from page_data
+
+        # Stop if we've reached our limit or got less than requested
+        if len(page_data) < first_length or (limit and len(page_data) >= limit):
+            return
+
+        if total_records_available:
+            target = min(total_records_available, limit) if limit else total_records_available
+            starts = range(first_length, target, page_size)
+            if not starts:
+                return
+
+            def fetch_page(page_start: int) -> List[Dict[str, Any]]:
+                length = min(page_size, target - page_start)
+                return self._fetch_history_page(
+                    page_start, length, order_column, order_dir, server_filters
+                )[0]
+
+            # Keep at most HISTORY_PAGE_WORKERS pages in flight so a consumer that stops
+            # early does not pay for the rest of the history
+            executor = ThreadPoolExecutor(max_workers=min(HISTORY_PAGE_WORKERS, len(starts)))
+            remaining = iter(starts)
+            pending = deque(
+                executor.submit(fetch_page, page_start)
+                for page_start in islice(remaining, HISTORY_PAGE_WORKERS)
+            )
+            try:
+                while pending:
+                    # Futures are consumed in request order, keeping the server-side sort intact
+                    page = pending.popleft().result()
+                    if not page:
+                        break
+                    next_start = next(remaining, None)
+                    if next_start is not None:
+                        pending.append(executor.submit(fetch_page, next_start))
+                    yield from page
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
+
+        # Total unknown: walk pages sequentially until a short or empty page
+        fetched = len(page_data)
+        start = first_length
         while True:
             # Calculate how many records to request this iteration
             current_page_size = page_size
-            if limit and (limit - len(all_records)) < page_size:
-                current_page_size = limit - len(all_records)
-
-            params = {
-                "length": current_page_size,
-                "start": start,
-                "order_column": order_column,
-                "order_dir": order_dir,
-            }
-
-            resp = self._request("get_history", params=params)
-            # Tautulli response structure: { "data": { "data": [ ... ], "recordsFiltered": ... } }
-            data_obj = resp.get("data", {})
-            page_data = data_obj.get("data", [])
-
-            # Get total available records from Tautulli (if provided)
-            if total_records_available is None:
-                total_records_available = data_obj.get("recordsFiltered") or data_obj.get(
-                    "recordsTotal"
-                )
+            if limit and (limit - fetched) < page_size:
+                current_page_size = limit - fetched
+
+            page_data, _ = self._fetch_history_page(
+                start, current_page_size, order_column, order_dir, server_filters
+            )
 
             if not page_data:
                 break
 
-            all_records.extend(page_data)
+            yield from page_data
+            fetched += len(page_data)
 
             # Stop if we've reached our limit or got less than requested
-            if limit and len(all_records) >= limit:
+            if limit and fetched >= limit:
                 break
             if len(page_data) < current_page_size:
                 break
 
-            # Safety check: if we know the total and we've fetched it all, stop
-            if total_records_available and len(all_records) >= total_records_available:
-                break
-
             start += current_page_size
 
-        return all_records
+    def iter_watch_history(
+        self,
+        page_size: int = 1000,
+        order_column: str = "date",
+        order_dir: str = "desc",
+        limit: Optional[int] = None,
+        user_id: Optional[int] = None,
+        media_type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over watch history records without building the full list.
+
+        When caching is enabled the cached list is reused; otherwise records are
+        yielded as pages arrive, so callers that filter or stop early never hold
+        the whole history at once.
+
+        Args:
+            page_size: Number of records per API request
+            order_column: Column to sort by
+            order_dir: Sort direction ("desc" or "asc")
+            limit: Maximum number of records to yield (None for all available)
+            user_id: Only yield history for this Tautulli user ID (server-side)
+            media_type: Only yield this media type (server-side)
+
+        Returns:
+            Iterator over watch history records
+        """
+        if self.cache_manager and self.cache_manager.is_enabled():
+            return iter(
+                self.get_watch_history(
+                    page_size, order_column, order_dir, limit, user_id, media_type
+                )
+            )
+
+        server_filters = {
+            key: value
+            for key, value in (("user_id", user_id), ("media_type", media_type))
+            if value is not None
+        }
+        return islice(
+            self._iter_watch_history(page_size, order_column, order_dir, limit, server_filters),
+            limit,
+        )
 
     def get_movie_completed_history(self) -> List[Dict[str, Any]]:
         """
@@ -277,17 +616,10 @@ class TautulliAPI(BaseAPIClient):
         sorted by date descending using server-side sorting.
         """
         # Use server-side sorting for better performance with larger page size
-        all_records = self.get_watch_history(page_size=1000, order_column="date", order_dir="desc")
+        all_records = self.iter_watch_history(page_size=1000, order_column="date", order_dir="desc")
 
         return [
-            {
-                "title": r.get("title"),
-                "rating_key": r.get("rating_key"),
-                "user": r.get("friendly_name"),
-                "watched_at": r.get("date"),
-                "watched_status": r.get("watched_status"),
-                "media_type": r.get("media_type"),
-            }
+            _format_movie_row(r)
             for r in all_records
             if r.get("watched_status") == 1 and r.get("media_type") == "movie"
         ]
@@ -313,16 +645,16 @@ class TautulliAPI(BaseAPIClient):
         Returns:
             List of formatted history records sorted newest first by server
         """
-        # Use server-side sorting (newest first) and smart limiting
-        # We might need more records than the limit due to client-side filtering
+        # Use server-side sorting (newest first) and smart limiting.
+        # user_id and media_type are filtered by Tautulli itself; only watched status and
+        # friendly_name have no get_history equivalent and still need client-side filtering.
         fetch_limit = None
         page_size = 1000  # Use larger page size for better performance
 
         if limit:
-            # If filters are applied, we might need to fetch more records to account for filtering
-            # Only apply a multiplier if we have filters that could reduce the result set
-            has_filters = watched_only or user_id is not None or username or media_type
-            if has_filters:
+            # Over-fetch only when client-side filters could shrink the result set
+            has_client_filters = watched_only or username
+            if has_client_filters:
                 # Fetch up to 3x the requested limit to account for filtering, but allow unlimited
                 fetch_limit = limit * 3
             else:
@@ -331,14 +663,19 @@ class TautulliAPI(BaseAPIClient):
 
         # Get pre-sorted records from server (newest first by date)
         # Use larger page size to reduce number of API calls
-        all_records = self.get_watch_history(
-            page_size=page_size, order_column="date", order_dir="desc", limit=fetch_limit
+        all_records = self.iter_watch_history(
+            page_size=page_size,
+            order_column="date",
+            order_dir="desc",
+            limit=fetch_limit,
+            user_id=user_id,
+            media_type=media_type,
         )
 
         filtered_records = []
 
         for record in all_records:
-            # Apply client-side filters (server-side filtering not available for these criteria)
+            # Apply client-side filters; user_id and media_type are rechecked as a safety net
 
             # Filter by watched status
             if watched_only and record.get("watched_status") != 1:
@@ -356,45 +693,7 @@ class TautulliAPI(BaseAPIClient):
             if media_type and record.get("media_type") != media_type:
                 continue
 
-            # Format title based on media type
-            title = record.get("title", "")
-            media_type_value = record.get("media_type", "")
-
-            if media_type_value == "episode":
-                # For episodes, combine series name, episode title, and season/episode info
-                series_title = record.get("grandparent_title", "")
-                episode_title = record.get("title", "")
-                season_num = record.get("parent_media_index")
-                episode_num = record.get("media_index")
-
-                if series_title and episode_title:
-                    if season_num is not None and episode_num is not None:
-                        title = f"{series_title} - {episode_title} (S{season_num} · E{episode_num})"
-                    else:
-                        title = f"{series_title} - {episode_title}"
-                elif series_title:
-                    title = series_title
-            # For movies and other types, use the original title
-
-            # Format the record with relevant fields
-            formatted_record = {
-                "history_id": record.get("id"),
-                "title": title,
-                "rating_key": record.get("rating_key"),
-                "user": record.get("friendly_name"),
-                "user_id": record.get("user_id"),
-                "watched_at": record.get("date"),
-                "stopped": record.get("stopped"),
-                "watched_status": record.get("watched_status"),
-                "media_type": media_type_value,
-                "year": record.get("year"),
-                "duration": record.get("duration"),
-                "percent_complete": record.get("percent_complete"),
-                "ip_address": record.get("ip_address"),
-                "platform": record.get("platform"),
-                "player": record.get("player"),
-            }
-            filtered_records.append(formatted_record)
+            filtered_records.append(_format_history_row(record))
 
             # Apply limit after filtering (records are already sorted by server)
             if limit and len(filtered_records) >= limit:
@@ -404,21 +703,16 @@ class TautulliAPI(BaseAPIClient):
 
     def get_history_item_details(self, history_id: int) -> Dict[str, Any]:
         """
-        Get detailed information about a specific history item by searching through all history.
+        Get detailed information about a specific history item.
+
+        Tautulli has no lookup by history row ID, so history is walked newest first
+        and the scan stops at the first match; recent items only cost one page.
 
         Args:
             history_id: The history entry ID to find
         """
-        # Get all history records and search for the matching ID
-        # Use no limit to ensure we can find any history ID, with larger page size for efficiency
-        all_records = self.get_watch_history(page_size=1000, limit=None)
-
-        # Find the record with matching ID
-        matching_record = None
-        for record in all_records:
-            if record.get("id") == history_id:
-                matching_record = record
-                break
+        records = self.iter_watch_history(page_size=1000, limit=None)
+        matching_record = next((r for r in records if r.get("id") == history_id), None)
 
         if not matching_record:
             return {}
@@ -430,29 +724,13 @@ class TautulliAPI(BaseAPIClient):
         metadata = {}
         if rating_key:
             metadata = self.get_metadata(rating_key)
-
-        # Format title based on media type (same logic as get_filtered_history)
-        title = record.get("title", "")
-        media_type_val = record.get("media_type", "")
-
-        if media_type_val == "episode":
-            series_title = record.get("grandparent_title", "")
-            episode_title = record.get("title", "")
-            season_num = record.get("parent_media_index")
-            episode_num = record.get("media_index")
-
-            if series_title and episode_title:
-                if season_num is not None and episode_num is not None:
-                    title = f"{series_title} - {episode_title} (S{season_num} · E{episode_num})"
-                else:
-                    title = f"{series_title} - {episode_title}"
-            elif series_title:
-                title = series_title
+        # Derive the IMDb ID from the metadata already fetched instead of a second lookup
+        imdb_id, _ = _scan_guids(metadata)
 
         # Combine history and metadata info
         return {
             "history_id": record.get("id"),
-            "title": title,
+            "title": _format_history_title(record),
             "rating_key": record.get("rating_key"),
             "user": record.get("friendly_name"),
             "user_id": record.get("user_id"),
@@ -473,7 +751,7 @@ class TautulliAPI(BaseAPIClient):
             "secure": record.get("secure"),
             "relayed": record.get("relayed"),
             # From metadata
-            "imdb_id": self.get_imdb_id_from_rating_key(rating_key) if rating_key else None,
+            "imdb_id": imdb_id,
             "summary": metadata.get("summary", ""),
             "rating": metadata.get("rating", ""),
             "content_rating": metadata.get("content_rating", ""),
@@ -488,21 +766,77 @@ class TautulliAPI(BaseAPIClient):
         """
         Get metadata for an item via rating_key.
 
-        Results are cached if cache_manager is available.
+        Responses are kept in memory for the lifetime of the client, and are
+        also cached on disk if cache_manager is available.
 
         Args:
             rating_key: Plex rating key
 
         Returns:
-            Metadata dictionary
+            Metadata dictionary (a shallow copy of the in-memory entry)
         """
+        memo_key = str(rating_key)
+        metadata = self._metadata_cache.get(memo_key)
+        if metadata is not None:
+            return dict(metadata)
+
         # Try cache first if available
         if self.cache_manager and self.cache_manager.is_enabled():
-            return self.cache_manager.get_metadata_imdb(
+            metadata = self.cache_manager.get_metadata_imdb(
                 rating_key, lambda: self._fetch_metadata(rating_key)
             )
+        else:
+            metadata = self._fetch_metadata(rating_key)
+
+        with self._metadata_lock:
+            if len(self._metadata_cache) >= METADATA_MEMO_MAX_ENTRIES:
+                # Dicts keep insertion order, so this drops the oldest entry
+                self._metadata_cache.pop(next(iter(self._metadata_cache)), None)
+            self._metadata_cache[memo_key] = metadata
+        return dict(metadata)
+
+    def get_metadata_bulk(self, rating_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for many rating keys at once.
+
+        Tautulli's get_metadata accepts a single rating_key, so keys that are not
+        already held in memory are looked up concurrently rather than one by one.
+
+        Args:
+            rating_keys: Plex rating keys (duplicates are looked up once)
+
+        Returns:
+            Dictionary mapping rating key (as string) -> metadata; keys whose
+            lookup failed are omitted
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(str(k) for k in rating_keys):
+            metadata = self._metadata_cache.get(key)
+            if metadata is not None:
+                results[key] = dict(metadata)
+            else:
+                missing.append(key)
+
+        if not missing:
+            return results
+
+        # Metadata lookups are independent network round trips, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(METADATA_WORKERS, len(missing))) as executor:
+            futures = {executor.submit(self.get_metadata, key): key for key in missing}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    # Skip failed lookups; callers treat them as missing metadata
+                    continue
 
-        return self._fetch_metadata(rating_key)
+        return results
+
+    def clear_metadata_cache(self) -> None:
+        """Forget in-memory metadata responses (for long-running processes)."""
+        with self._metadata_lock:
+            self._metadata_cache.clear()
 
     def _fetch_metadata(self, rating_key: str) -> Dict[str, Any]:
         """Internal method to fetch metadata from API."""
@@ -514,37 +848,25 @@ class TautulliAPI(BaseAPIClient):
         Haal IMDb ID (tt...) uit metadata.guids wanneer beschikbaar.
         Retourneert bijvoorbeeld 'tt1234567' of None.
         """
-        metadata = self.get_metadata(rating_key)
-        for guid in metadata.get("guids", []) or []:
-            m = IMDB_ID_PATTERN.match(guid)
-            if m:
-                return m.group(1)
-        return None
+        return _scan_guids(self.get_metadata(rating_key))[0]
 
     def get_episode_completed_history(self) -> List[Dict[str, Any]]:
         """
         Get completed episode watch history records sorted newest first.
 
         Returns records where watched_status == 1 and media_type == "episode",
-        sorted by date descending using server-side sorting.
+        sorted by date descending using server-side sorting. The result is memoized
+        for MEMO_TTL_SECONDS, and concurrent callers share a single fetch.
         """
+        return self._memoized("episode_completed_history", self._fetch_episode_completed_history)
+
+    def _fetch_episode_completed_history(self) -> List[Dict[str, Any]]:
+        """Internal method to fetch and reduce completed episode history."""
         # Use server-side sorting for better performance with larger page size
-        all_records = self.get_watch_history(page_size=1000, order_column="date", order_dir="desc")
+        all_records = self.iter_watch_history(page_size=1000, order_column="date", order_dir="desc")
 
         return [
-            {
-                "title": r.get("title"),
-                "rating_key": r.get("rating_key"),
-                "parent_rating_key": r.get("parent_rating_key"),
-                "grandparent_rating_key": r.get("grandparent_rating_key"),
-                "user": r.get("friendly_name"),
-                "watched_at": r.get("date"),
-                "watched_status": r.get("watched_status"),
-                "media_type": r.get("media_type"),
-                "season_num": r.get("parent_media_index"),
-                "episode_num": r.get("media_index"),
-                "series_title": r.get("grandparent_title"),
-            }
+            _format_episode_row(r)
             for r in all_records
             if r.get("watched_status") == 1 and r.get("media_type") == "episode"
         ]
@@ -554,49 +876,38 @@ class TautulliAPI(BaseAPIClient):
         Haal TVDB ID uit metadata.guids wanneer beschikbaar.
         Retourneert bijvoorbeeld '123456' of None.
         """
-        metadata = self.get_metadata(rating_key)
-        for guid in metadata.get("guids", []) or []:
-            m = TVDB_ID_PATTERN.match(guid)
-            if m:
-                return m.group(1)
-        return None
+        return _scan_guids(self.get_metadata(rating_key))[1]
 
     def build_series_metadata_cache(self, episode_history: List[Dict[str, Any]]) -> Dict[str, str]:
         """
         Build a cache mapping grandparent_rating_key to tvdb_id for efficient lookups.
 
+        The mapping is memoized for MEMO_TTL_SECONDS as long as it is requested
+        for the same episode_history list, and concurrent callers share one build.
+
         Args:
             episode_history: List of episode history records
 
         Returns:
             Dictionary mapping grandparent_rating_key -> tvdb_id
         """
-        series_cache = {}
-        unique_series_keys = set()
-
-        # Collect unique series (grandparent) rating keys
-        for record in episode_history:
-            grandparent_key = record.get("grandparent_rating_key")
-            if grandparent_key and grandparent_key not in unique_series_keys:
-                unique_series_keys.add(grandparent_key)
-
-        # Get metadata for each unique series
-        for series_key in unique_series_keys:
-            try:
-                metadata = self.get_metadata(str(series_key))
-                tvdb_id = None
-
-                for guid in metadata.get("guids", []) or []:
-                    m = TVDB_ID_PATTERN.match(guid)
-                    if m:
-                        tvdb_id = m.group(1)
-                        break
-
-                if tvdb_id:
-                    series_cache[str(series_key)] = tvdb_id
+        return self._memoized(
+            "series_metadata_cache",
+            lambda: self._build_series_metadata_cache(episode_history),
+            episode_history,
+        )
 
-            except Exception:
-                # Log error but continue with other series
-                continue
+    def _build_series_metadata_cache(self, episode_history: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Internal method to map series rating keys in episode_history to TVDB IDs."""
+        series_cache = {}
+        # Unique series (grandparent) rating keys, collected in a single pass
+        unique_series_keys = {
+            record.get("grandparent_rating_key") for record in episode_history
+        } - {None, ""}
+
+        for series_key, metadata in self.get_metadata_bulk(list(unique_series_keys)).items():
+            _, tvdb_id = _scan_guids(metadata)
+            if tvdb_id:
+                series_cache[series_key] = tvdb_id
 
         return series_cache
@@ -5,7 +5,7 @@ This module provides common filtering functions for movies and series
 based on various criteria.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 def filter_by_username(
@@ -213,6 +213,51 @@ def filter_by_excluded_tags(
     return filtered_items
 
 
+def _item_tags(item: Dict[str, Any]) -> set:
+    """Return an item's tag labels lowercased for case-insensitive matching."""
+    return {tag.lower() for tag in item.get("tag_labels", [])}
+
+
+def compose_filters(
+    tags: Optional[List[str]] = None,
+    match_all: bool = False,
+    excluded_tags: Optional[List[str]] = None,
+) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Combine the tag and excluded-tag filters into a single predicate.
+
+    Each item's tags are lowercased once and checked against both criteria,
+    so one list comprehension replaces chained filter_by_tags and
+    filter_by_excluded_tags passes.
+
+    Args:
+        tags: Tag names the item must carry (None = no filter)
+        match_all: If True, item must have ALL tags; if False, ANY tag
+        excluded_tags: Tag names the item must not carry (None = no filter)
+
+    Returns:
+        Predicate returning True for items that pass both tag filters
+
+    Examples:
+        >>> keep = compose_filters(tags=["4K"], excluded_tags=["Kids"])
+        >>> filtered = [movie for movie in movies if keep(movie)]
+    """
+    wanted = {tag.lower() for tag in tags} if tags else set()
+    excluded = {tag.lower() for tag in excluded_tags} if excluded_tags else set()
+
+    def keep(item: Dict[str, Any]) -> bool:
+        item_tags = _item_tags(item)
+        if wanted:
+            if match_all:
+                if not wanted.issubset(item_tags):
+                    return False
+            elif wanted.isdisjoint(item_tags):
+                return False
+        return excluded.isdisjoint(item_tags)
+
+    return keep
+
+
 def apply_streaming_filter(
     items: List[Dict[str, Any]],
     on_streaming: bool,
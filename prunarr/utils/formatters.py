@@ -6,8 +6,33 @@ in human-readable formats with Rich markup styling.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+# Binary file size units, each 1024 times the previous one
+FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Rich markup for watch statuses, built once instead of on every table row
+_MOVIE_STATUS_COLORS = {
+    "watched": "[green]✓ Watched[/green]",
+    "unwatched": "[red]✗ Unwatched[/red]",
+    "watched_by_other": "[yellow]👤 Watched[/yellow]",
+}
+_UNKNOWN_MOVIE_STATUS = "[dim]Unknown[/dim]"
+_SERIES_STATUS_COLORS = {
+    "fully_watched": "[green]✓ Fully Watched[/green]",
+    "partially_watched": "[yellow]📺 Partially Watched[/yellow]",
+    "unwatched": "[red]✗ Unwatched[/red]",
+    "no_episodes": "[dim]❌ No Episodes[/dim]",
+}
+_UNKNOWN_SERIES_STATUS = "[dim]❓ Unknown[/dim]"
+
+
+@lru_cache(maxsize=4096)
+def _format_epoch(timestamp: int, fmt: str) -> str:
+    """Format a Unix timestamp, caching repeats since table rows often share one."""
+    return datetime.fromtimestamp(timestamp).strftime(fmt)
+
 
 def format_file_size(size_bytes: int) -> str:
     """
@@ -22,21 +47,20 @@ def format_file_size(size_bytes: int) -> str:
     if not size_bytes:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(size_bytes)
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
     unit_index = 0
-
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    if size_bytes >= 1024:
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(FILE_SIZE_UNITS) - 1)
+    size = size_bytes / (1 << (unit_index * 10))
+    unit = FILE_SIZE_UNITS[unit_index]
 
     # Format with appropriate decimal places
     if size >= 100:
-        return f"{size:.0f} {units[unit_index]}"
+        return f"{size:.0f} {unit}"
     elif size >= 10:
-        return f"{size:.1f} {units[unit_index]}"
+        return f"{size:.1f} {unit}"
     else:
-        return f"{size:.2f} {units[unit_index]}"
+        return f"{size:.2f} {unit}"
 
 
 def format_date(date_obj: Optional[datetime]) -> str:
@@ -105,8 +129,7 @@ def format_timestamp_to_date(timestamp: Any, default: str = "N/A") -> str:
         return default
 
     try:
-        dt = datetime.fromtimestamp(int(timestamp))
-        return dt.strftime("%Y-%m-%d")
+        return _format_epoch(int(timestamp), "%Y-%m-%d")
     except (ValueError, TypeError):
         return default
 
@@ -125,16 +148,18 @@ def format_timestamp(timestamp: str) -> str:
         return "N/A"
 
     try:
-        dt = datetime.fromtimestamp(int(timestamp))
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return _format_epoch(int(timestamp), "%Y-%m-%d %H:%M")
     except (ValueError, TypeError):
         return str(timestamp)
 
 
+@lru_cache(maxsize=1024, typed=True)
 def format_duration(seconds: int) -> str:
     """
     Format duration in seconds to human readable format.
 
+    Results are cached, since durations cluster around a few common runtimes.
+
     Args:
         seconds: Duration in seconds
 
@@ -162,12 +187,7 @@ def format_movie_watch_status(status: str) -> str:
     Returns:
         Colored status string with Rich markup
     """
-    status_colors = {
-        "watched": "[green]✓ Watched[/green]",
-        "unwatched": "[red]✗ Unwatched[/red]",
-        "watched_by_other": "[yellow]👤 Watched[/yellow]",
-    }
-    return status_colors.get(status, "[dim]Unknown[/dim]")
+    return _MOVIE_STATUS_COLORS.get(status, _UNKNOWN_MOVIE_STATUS)
 
 
 def format_series_watch_status(status: str) -> str:
@@ -180,16 +200,7 @@ def format_series_watch_status(status: str) -> str:
     Returns:
         Colored status string with Rich markup
     """
-    if status == "fully_watched":
-        return "[green]✓ Fully Watched[/green]"
-    elif status == "partially_watched":
-        return "[yellow]📺 Partially Watched[/yellow]"
-    elif status == "unwatched":
-        return "[red]✗ Unwatched[/red]"
-    elif status == "no_episodes":
-        return "[dim]❌ No Episodes[/dim]"
-    else:
-        return "[dim]❓ Unknown[/dim]"
+    return _SERIES_STATUS_COLORS.get(status, _UNKNOWN_SERIES_STATUS)
 
 
 def format_history_watch_status(status: int) -> str:
@@ -6,14 +6,36 @@ and other data format conversions.
 """
 
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 
+# Compiled once: episode keys are parsed for every episode when computing series status
+_EPISODE_KEY_RE = re.compile(r"^[sS](\d+)[eE](\d+)$")
 
+# Number (with optional decimal) followed by a binary size unit, in any case and with
+# surrounding whitespace, so the input needs no normalized copy before matching
+_FILE_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?B)\s*$", re.IGNORECASE)
+
+# Unit conversion factors
+_FILE_SIZE_UNITS = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
+
+@lru_cache(maxsize=8192, typed=True)
 def make_episode_key(season_num: int, episode_num: int) -> str:
     """
     Create standardized episode key string.
 
+    The same season/episode pairs recur across every series, so results are
+    cached and interned to share one string object per key.
+
     Args:
         season_num: Season number
         episode_num: Episode number
@@ -21,7 +43,7 @@ def make_episode_key(season_num: int, episode_num: int) -> str:
     Returns:
         Episode key in format "s{season}e{episode}" (e.g., "s1e5")
     """
-    return f"s{season_num}e{episode_num}"
+    return sys.intern(f"s{season_num}e{episode_num}")
 
 
 def parse_episode_key(episode_key: str) -> Optional[Tuple[int, int]]:
@@ -34,13 +56,10 @@ def parse_episode_key(episode_key: str) -> Optional[Tuple[int, int]]:
     Returns:
         Tuple of (season_num, episode_num) or None if parsing fails
     """
-    try:
-        parts = episode_key.lower().split("e")
-        season_num = int(parts[0][1:])  # Remove 's' prefix
-        episode_num = int(parts[1])
-        return season_num, episode_num
-    except (ValueError, IndexError, AttributeError):
+    if not episode_key:
         return None
+    match = _EPISODE_KEY_RE.match(episode_key)
+    return (int(match.group(1)), int(match.group(2))) if match else None
 
 
 def parse_file_size(size_str: str) -> int:
@@ -72,9 +91,7 @@ def parse_file_size(size_str: str) -> int:
     if not size_str:
         raise ValueError("Size string cannot be empty")
 
-    # Match number (with optional decimal) and unit
-    pattern = r"^(\d+(?:\.\d+)?)\s*([KMGT]?B)$"
-    match = re.match(pattern, size_str.upper().strip())
+    match = _FILE_SIZE_RE.match(size_str)
 
     if not match:
         raise ValueError(
@@ -85,16 +102,7 @@ def parse_file_size(size_str: str) -> int:
     value_str, unit = match.groups()
     value = float(value_str)
 
-    # Unit conversion factors
-    units = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-    }
-
-    multiplier = units.get(unit, 1)
+    multiplier = _FILE_SIZE_UNITS.get(unit.upper(), 1)
     return int(value * multiplier)
 
 
@@ -8,6 +8,8 @@ domain objects and datetime values to JSON-compatible formats.
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from prunarr.utils.parsers import safe_timestamp_to_datetime
+
 
 def prepare_datetime_for_json(dt: Optional[datetime]) -> Optional[str]:
     """
@@ -128,8 +130,6 @@ def prepare_history_for_json(history: Dict[str, Any]) -> Dict[str, Any]:
         >>> result['watched_at']
         '2024-01-15T10:30:00'
     """
-    from prunarr.utils.parsers import safe_timestamp_to_datetime
-
     # Convert watched_at timestamp to datetime, then to ISO string
     watched_at_dt = safe_timestamp_to_datetime(history.get("watched_at"))
 
@@ -5,16 +5,38 @@ This module provides validation functions for user input,
 configuration values, and data integrity checks.
 """
 
-import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional
 
 import typer
 
+# Accepted values for CLI options, in the order they are listed in error messages
+OUTPUT_FORMATS = ("table", "json")
+MEDIA_TYPES = ("movie", "show", "episode")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
 
+# Byte multipliers for file size units
+_FILESIZE_UNITS = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
+# Two-character unit suffixes resolved by one lookup to (suffix length, multiplier);
+# anything else ending in "B" is the plain byte unit
+_FILESIZE_SUFFIXES = {unit: (2, mult) for unit, mult in _FILESIZE_UNITS.items() if len(unit) == 2}
+_BYTE_SUFFIX = (1, _FILESIZE_UNITS["B"])
+
+
+@lru_cache(maxsize=1024)
 def validate_filesize_string(size_str: str) -> Optional[int]:
     """
     Parse and validate file size string to bytes.
 
+    Results are cached, since the same size strings recur across items.
+
     Args:
         size_str: File size string (e.g., '1GB', '500MB', '2.5GB')
 
@@ -32,30 +54,47 @@ def validate_filesize_string(size_str: str) -> Optional[int]:
     if not size_str:
         return None
 
-    # Match number with optional decimal and unit
-    match = re.match(r"^(\d+(?:\.\d+)?)\s*([KMGT]?B)$", size_str.upper().strip())
-    if not match:
+    # Split "<digits>[.<digits>] <unit>" by hand; the grammar is too simple to need a regex
+    text = size_str.upper().strip()
+    entry = _FILESIZE_SUFFIXES.get(text[-2:]) or (_BYTE_SUFFIX if text[-1:] == "B" else None)
+    if entry is None or len(text) <= entry[0]:
         return None
 
-    value, unit = match.groups()
-    value = float(value)
+    suffix_len, multiplier = entry
+    whole, dot, fraction = text[:-suffix_len].rstrip().partition(".")
+    if not whole.isdecimal() or (dot and not fraction.isdecimal()):
+        return None
+    return int(float(f"{whole}.{fraction or 0}") * multiplier)
 
-    units = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-    }
 
-    multiplier = units.get(unit, 1)
-    return int(value * multiplier)
+def validate_filesize_strings_batch(size_strs: Iterable[str]) -> List[Optional[int]]:
+    """
+    Parse and validate many file size strings to bytes in one call.
+
+    Each distinct string is parsed once; repeats reuse the first result.
 
+    Args:
+        size_strs: File size strings (e.g., ['1GB', '500MB', '1GB'])
 
+    Returns:
+        Sizes in bytes in input order, with None for invalid entries
+
+    Examples:
+        >>> validate_filesize_strings_batch(['1KB', 'invalid', '1KB'])
+        [1024, None, 1024]
+    """
+    size_strs = list(size_strs)
+    parsed = {size_str: validate_filesize_string(size_str) for size_str in set(size_strs)}
+    return [parsed[size_str] for size_str in size_strs]
+
+
+@lru_cache(maxsize=1024)
 def validate_episode_key_format(episode_key: str) -> bool:
     """
     Validate episode key format.
 
+    Results are cached, since the same keys recur across every series.
+
     Args:
         episode_key: Episode key string (should be "s{season}e{episode}")
 
@@ -68,8 +107,38 @@ def validate_episode_key_format(episode_key: str) -> bool:
         >>> validate_episode_key_format('invalid')
         False
     """
-    pattern = r"^s\d+e\d+$"
-    return bool(re.match(pattern, episode_key.lower()))
+    if not episode_key:
+        return False
+
+    # "s<digits>e<digits>": a fixed prefix and two integers, checked without a regex
+    key = episode_key.lower()
+    if not key.startswith("s"):
+        return False
+    season, separator, episode = key[1:].partition("e")
+    return bool(separator) and season.isdecimal() and episode.isdecimal()
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """
+    Convert a value to int the way int() would, returning None instead of raising.
+
+    Native ints (the common case from API JSON) are returned as-is, and strings
+    are checked up front so invalid CLI input does not go through an exception.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        digits = text[1:] if text[:1] in ("+", "-") else text
+        if digits.isdecimal():
+            return -int(digits) if text[:1] == "-" else int(digits)
+        if "_" not in digits:
+            return None
+        # Underscore-grouped digits ("1_000") are rare; let int() judge them
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
 
 
 def validate_positive_int(value: any) -> Optional[int]:
@@ -92,11 +161,8 @@ def validate_positive_int(value: any) -> Optional[int]:
         >>> validate_positive_int('invalid')
         None
     """
-    try:
-        num = int(value)
-        return num if num > 0 else None
-    except (ValueError, TypeError):
-        return None
+    num = _to_int(value)
+    return num if num is not None and num > 0 else None
 
 
 def validate_non_negative_int(value: any) -> Optional[int]:
@@ -117,11 +183,8 @@ def validate_non_negative_int(value: any) -> Optional[int]:
         >>> validate_non_negative_int(-1)
         None
     """
-    try:
-        num = int(value)
-        return num if num >= 0 else None
-    except (ValueError, TypeError):
-        return None
+    num = _to_int(value)
+    return num if num is not None and num >= 0 else None
 
 
 def validate_percentage(value: any) -> Optional[float]:
@@ -142,11 +205,14 @@ def validate_percentage(value: any) -> Optional[float]:
         >>> validate_percentage(-5)
         None
     """
-    try:
-        num = float(value)
-        return num if 0 <= num <= 100 else None
-    except (ValueError, TypeError):
-        return None
+    if type(value) is float:
+        num = value
+    else:
+        try:
+            num = float(value)
+        except (ValueError, TypeError):
+            return None
+    return num if 0 <= num <= 100 else None
 
 
 def validate_output_format(output: str, logger) -> None:
@@ -165,8 +231,7 @@ def validate_output_format(output: str, logger) -> None:
         >>> validate_output_format("json", logger)   # Valid - no error
         >>> validate_output_format("xml", logger)    # Invalid - raises Exit
     """
-    valid_formats = ["table", "json"]
-    if output not in valid_formats:
+    if output not in OUTPUT_FORMATS:
         logger.error(f"Invalid output format: {output}. Must be 'table' or 'json'")
         raise typer.Exit(1)
 
@@ -207,9 +272,8 @@ def validate_media_type(media_type: str, logger) -> None:
     Raises:
         typer.Exit: If media type is invalid
     """
-    valid_types = ["movie", "show", "episode"]
-    if media_type and media_type not in valid_types:
-        logger.error(f"Invalid media type: {media_type}. Valid types: {', '.join(valid_types)}")
+    if media_type and media_type not in MEDIA_TYPES:
+        logger.error(f"Invalid media type: {media_type}. Valid types: {', '.join(MEDIA_TYPES)}")
         raise typer.Exit(1)
 
 
@@ -236,11 +300,10 @@ def validate_log_level(log_level: str) -> str:
         ...
         ValueError: log_level must be one of ['DEBUG', 'INFO', 'WARNING', 'ERROR']
     """
-    allowed_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
     normalized = log_level.upper()
 
-    if normalized not in allowed_levels:
-        raise ValueError(f"log_level must be one of {allowed_levels}, got '{log_level}'")
+    if normalized not in LOG_LEVELS:
+        raise ValueError(f"log_level must be one of {list(LOG_LEVELS)}, got '{log_level}'")
 
     return normalized
 
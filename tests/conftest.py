@@ -5,8 +5,13 @@ This module provides common test fixtures and configuration for all test modules
 including mock API clients, sample data, and test configuration objects.
 """
 
+import copy
+import io
+import json
 import tempfile
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Mapping
 from unittest.mock import Mock
 
 import pytest
@@ -15,6 +20,12 @@ import yaml
 from prunarr.config import Settings
 from prunarr.logger import PrunArrLogger
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 
 @pytest.fixture
 def mock_settings():
@@ -30,21 +41,38 @@ def mock_settings():
     )
 
 
+@pytest.fixture(scope="session")
+def config_dict():
+    """Read-only test configuration values, built once per test session."""
+    return MappingProxyType(
+        {
+            "radarr_api_key": "test-radarr-key",
+            "radarr_url": "http://localhost:7878",
+            "sonarr_api_key": "test-sonarr-key",
+            "sonarr_url": "http://localhost:8989",
+            "tautulli_api_key": "test-tautulli-key",
+            "tautulli_url": "http://localhost:8181",
+            "user_tag_regex": r"^\d+ - (.+)$",
+        }
+    )
+
+
 @pytest.fixture
-def temp_config_file():
-    """Create a temporary configuration file for testing."""
-    config_data = {
-        "radarr_api_key": "test-radarr-key",
-        "radarr_url": "http://localhost:7878",
-        "sonarr_api_key": "test-sonarr-key",
-        "sonarr_url": "http://localhost:8989",
-        "tautulli_api_key": "test-tautulli-key",
-        "tautulli_url": "http://localhost:8181",
-        "user_tag_regex": r"^\d+ - (.+)$",
-    }
+def in_memory_config(config_dict):
+    """
+    Configuration as an in-memory stream, for tests that need no real file.
+
+    Serialized as JSON, which is valid YAML and far cheaper to emit; fixtures that
+    exercise the real YAML format use temp_config_file.
+    """
+    return io.StringIO(json.dumps(dict(config_dict)))
 
+
+@pytest.fixture
+def temp_config_file(config_dict):
+    """Create a temporary configuration file for tests that exercise real paths."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(config_data, f)
+        yaml.dump(dict(config_dict), f, Dumper=SafeDumper)
         temp_path = f.name
 
     yield temp_path
@@ -53,11 +81,15 @@ def temp_config_file():
     Path(temp_path).unlink(missing_ok=True)
 
 
-@pytest.fixture
-def mock_radarr_api():
-    """Create a mock Radarr API client."""
-    mock_api = Mock()
-    mock_api.get_movie.return_value = [
+def _thaw(template: Mapping) -> dict:
+    """Return a mutable deep copy of a read-only template record."""
+    return copy.deepcopy(dict(template))
+
+
+@pytest.fixture(scope="session")
+def _sample_movie_template():
+    """Read-only sample movie, built once per test session."""
+    return MappingProxyType(
         {
             "id": 1,
             "title": "Test Movie",
@@ -72,19 +104,13 @@ def mock_radarr_api():
                 "relativePath": "Test Movie (2023)/Test Movie (2023) Bluray-1080p.mkv",
             },
         }
-    ]
-    mock_api.get_tag.return_value = {"id": 1, "label": "123 - testuser"}
-    mock_api.delete_movie.return_value = True
-    mock_api.get_movie_by_tmdb_id.return_value = mock_api.get_movie.return_value[0]
-    mock_api.get_movies_by_tag.return_value = mock_api.get_movie.return_value
-    return mock_api
+    )
 
 
-@pytest.fixture
-def mock_sonarr_api():
-    """Create a mock Sonarr API client."""
-    mock_api = Mock()
-    mock_api.get_series.return_value = [
+@pytest.fixture(scope="session")
+def _sample_series_template():
+    """Read-only sample series, built once per test session."""
+    return MappingProxyType(
         {
             "id": 1,
             "title": "Test Series",
@@ -109,7 +135,67 @@ def mock_sonarr_api():
                 "sizeOnDisk": 5368709120,
             },
         }
-    ]
+    )
+
+
+@pytest.fixture(scope="session")
+def _sample_watch_history_template():
+    """Read-only sample watch history, built once per test session."""
+    return (
+        MappingProxyType(
+            {
+                "id": 1,
+                "title": "Test Movie",
+                "rating_key": "12345",
+                "user_id": 123,
+                "friendly_name": "testuser",
+                "date": 1640995200,  # 2022-01-01
+                "watched_status": 1,
+                "media_type": "movie",
+                "year": 2023,
+                "duration": 7200,
+                "percent_complete": 100,
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def mock_radarr_api(_sample_movie_template):
+    """Create a mock Radarr API client."""
+    mock_api = Mock()
+    mock_api.get_movie.return_value = [_thaw(_sample_movie_template)]
+    mock_api.get_tag.return_value = {"id": 1, "label": "123 - testuser"}
+    mock_api.delete_movie.return_value = True
+    mock_api.get_movie_by_tmdb_id.return_value = mock_api.get_movie.return_value[0]
+    mock_api.get_movies_by_tag.return_value = mock_api.get_movie.return_value
+    return mock_api
+
+
+@pytest.fixture
+def simple_radarr_api(_sample_movie_template):
+    """
+    Plain-attribute stand-in for the Radarr API client returning the sample movie.
+
+    Much cheaper to build than a Mock; use mock_radarr_api when calls must be asserted.
+    """
+    movies = [_thaw(_sample_movie_template)]
+    tag = {"id": 1, "label": "123 - testuser"}
+    return SimpleNamespace(
+        get_movie=lambda movie_id=None, **kwargs: movies,
+        get_movie_by_tmdb_id=lambda tmdb_id: movies[0],
+        get_movies_by_tag=lambda tag_id: movies,
+        get_tag=lambda tag_id: tag,
+        get_tags=lambda: [tag],
+        delete_movie=lambda movie_id, **kwargs: True,
+    )
+
+
+@pytest.fixture
+def mock_sonarr_api(_sample_series_template):
+    """Create a mock Sonarr API client."""
+    mock_api = Mock()
+    mock_api.get_series.return_value = [_thaw(_sample_series_template)]
     mock_api.get_episodes_by_series_id.return_value = [
         {
             "id": 1,
@@ -133,28 +219,17 @@ def mock_sonarr_api():
         }
     ]
     mock_api.get_tag.return_value = {"id": 1, "label": "123 - testuser"}
+    mock_api.get_tags.return_value = [{"id": 1, "label": "123 - testuser"}]
     mock_api.delete_series.return_value = True
     return mock_api
 
 
 @pytest.fixture
-def mock_tautulli_api():
+def mock_tautulli_api(_sample_watch_history_template):
     """Create a mock Tautulli API client."""
     mock_api = Mock()
     mock_api.get_watch_history.return_value = [
-        {
-            "id": 1,
-            "title": "Test Movie",
-            "rating_key": "12345",
-            "user_id": 123,
-            "friendly_name": "testuser",
-            "date": 1640995200,  # 2022-01-01
-            "watched_status": 1,
-            "media_type": "movie",
-            "year": 2023,
-            "duration": 7200,
-            "percent_complete": 100,
-        }
+        _thaw(record) for record in _sample_watch_history_template
     ]
     mock_api.get_movie_completed_history.return_value = mock_api.get_watch_history.return_value
     mock_api.get_episode_completed_history.return_value = [
@@ -185,71 +260,21 @@ def mock_tautulli_api():
 
 
 @pytest.fixture
-def sample_movie_data():
-    """Sample movie data for testing."""
-    return {
-        "id": 1,
-        "title": "Test Movie",
-        "year": 2023,
-        "tmdbId": 12345,
-        "tags": [1],
-        "hasFile": True,
-        "movieFile": {
-            "id": 1,
-            "size": 1073741824,
-            "quality": {"quality": {"name": "Bluray-1080p"}},
-            "relativePath": "Test Movie (2023)/Test Movie (2023) Bluray-1080p.mkv",
-        },
-    }
+def sample_movie_data(_sample_movie_template):
+    """Sample movie data for testing (a fresh copy tests may modify)."""
+    return _thaw(_sample_movie_template)
 
 
 @pytest.fixture
-def sample_series_data():
-    """Sample series data for testing."""
-    return {
-        "id": 1,
-        "title": "Test Series",
-        "year": 2023,
-        "tvdbId": 54321,
-        "tags": [1],
-        "seasons": [
-            {
-                "seasonNumber": 1,
-                "statistics": {
-                    "episodeCount": 10,
-                    "episodeFileCount": 10,
-                    "totalEpisodeCount": 10,
-                    "sizeOnDisk": 5368709120,
-                },
-            }
-        ],
-        "statistics": {
-            "episodeCount": 10,
-            "episodeFileCount": 10,
-            "totalEpisodeCount": 10,
-            "sizeOnDisk": 5368709120,
-        },
-    }
+def sample_series_data(_sample_series_template):
+    """Sample series data for testing (a fresh copy tests may modify)."""
+    return _thaw(_sample_series_template)
 
 
 @pytest.fixture
-def sample_watch_history():
-    """Sample watch history data for testing."""
-    return [
-        {
-            "id": 1,
-            "title": "Test Movie",
-            "rating_key": "12345",
-            "user_id": 123,
-            "friendly_name": "testuser",
-            "date": 1640995200,
-            "watched_status": 1,
-            "media_type": "movie",
-            "year": 2023,
-            "duration": 7200,
-            "percent_complete": 100,
-        }
-    ]
+def sample_watch_history(_sample_watch_history_template):
+    """Sample watch history data for testing (a fresh copy tests may modify)."""
+    return [_thaw(record) for record in _sample_watch_history_template]
 
 
 @pytest.fixture
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the API client integration tests.
+
+The pyarr client class is patched once per module; each test still gets a fresh
+client mock, so return values and call records never leak between tests.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from prunarr.sonarr import SonarrAPI
+
+
+@pytest.fixture(scope="module")
+def patched_pyarr():
+    """Patch the pyarr Sonarr client class for the whole test module."""
+    with patch("prunarr.sonarr.PyarrSonarrAPI") as mock_pyarr:
+        yield mock_pyarr
+
+
+@pytest.fixture
+def mock_pyarr_instance(patched_pyarr):
+    """Fresh pyarr client mock handed to every SonarrAPI built in the test."""
+    mock_instance = Mock()
+    patched_pyarr.return_value = mock_instance
+    return mock_instance
+
+
+@pytest.fixture
+def api(mock_pyarr_instance):
+    """SonarrAPI client backed by mock_pyarr_instance."""
+    return SonarrAPI("http://localhost:8989", "test-api-key")
@@ -5,10 +5,21 @@ Tests the SonarrAPI class functionality including series retrieval,
 episode management, file tracking, and comprehensive error handling.
 """
 
-from unittest.mock import Mock, patch
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
 
+import pytest
+import requests
+
+from prunarr.cache import CacheConfig, CacheManager
 from prunarr.sonarr import SonarrAPI
 
+# Every test runs against the module-wide pyarr client patch from conftest.py
+pytestmark = pytest.mark.usefixtures("patched_pyarr")
+
 
 class TestSonarrAPI:
     """Test the SonarrAPI class functionality."""
@@ -24,88 +35,89 @@ class TestSonarrAPI:
         """Test that URLs are normalized during initialization."""
         api = SonarrAPI("http://localhost:8989/", "test-api-key")
         assert api._base_url == "http://localhost:8989"
+        assert api._episode_url == "http://localhost:8989/api/v3/episode"
+        assert api._episodefile_url == "http://localhost:8989/api/v3/episodefile"
+
+    def test_session_sends_api_key_header(self):
+        """Test that direct API calls authenticate via the pooled session header."""
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        assert api._session.headers["X-Api-Key"] == "test-api-key"
+        assert api._session.get_adapter("http://localhost:8989") is api._session.get_adapter(
+            "https://localhost:8989"
+        )
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the HTTP session."""
+        with patch("requests.Session.close") as mock_close:
+            with SonarrAPI("http://localhost:8989", "test-api-key") as api:
+                assert isinstance(api, SonarrAPI)
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_series_all(self, mock_pyarr):
+        mock_close.assert_called_once()
+
+    def test_get_series_all(self, api, mock_pyarr_instance):
         """Test getting all series."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_series.return_value = [
+        mock_pyarr_instance.get_series.return_value = [
             {"id": 1, "title": "Series 1"},
             {"id": 2, "title": "Series 2"},
         ]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_series()
 
-        mock_instance.get_series.assert_called_once_with()
+        mock_pyarr_instance.get_series.assert_called_once_with()
         assert len(result) == 2
         assert result[0]["title"] == "Series 1"
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_series_by_id(self, mock_pyarr):
+    def test_get_series_by_id(self, api, mock_pyarr_instance):
         """Test getting a specific series by ID."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_series.return_value = {"id": 1, "title": "Specific Series"}
+        mock_pyarr_instance.get_series.return_value = {"id": 1, "title": "Specific Series"}
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_series(series_id=1)
 
-        mock_instance.get_series.assert_called_once_with(1)
+        mock_pyarr_instance.get_series.assert_called_once_with(1)
         assert result["title"] == "Specific Series"
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_series_by_id_method(self, mock_pyarr):
+    def test_get_series_by_id_method(self, api, mock_pyarr_instance):
         """Test get_series_by_id method."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_series.return_value = {"id": 1, "title": "Test Series"}
+        mock_pyarr_instance.get_series.return_value = {"id": 1, "title": "Test Series"}
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_series_by_id(1)
 
-        mock_instance.get_series.assert_called_once_with(1)
+        mock_pyarr_instance.get_series.assert_called_once_with(1)
         assert result["title"] == "Test Series"
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episode_all(self, mock_pyarr):
+    def test_get_episode_all(self, api, mock_pyarr_instance):
         """Test getting all episodes."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.return_value = [
+        mock_pyarr_instance.get_episode.return_value = [
             {"id": 1, "title": "Episode 1"},
             {"id": 2, "title": "Episode 2"},
         ]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episode()
 
-        mock_instance.get_episode.assert_called_once_with()
+        mock_pyarr_instance.get_episode.assert_called_once_with()
         assert len(result) == 2
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episode_by_series_id(self, mock_pyarr):
+    def test_get_episode_by_series_id(self, api, mock_pyarr_instance):
         """Test getting episodes for a specific series."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.return_value = [{"id": 1, "title": "Episode 1"}]
+        mock_pyarr_instance.get_episode.return_value = [{"id": 1, "title": "Episode 1"}]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episode(series_id=123)
 
-        mock_instance.get_episode.assert_called_once_with(series=123)
+        mock_pyarr_instance.get_episode.assert_called_once_with(series=123)
         assert len(result) == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episodes_by_series_id_direct_api(self, mock_get):
         """Test get_episodes_by_series_id using direct HTTP call."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [
-            {"id": 1, "seriesId": 123, "title": "Episode 1"},
-            {"id": 2, "seriesId": 123, "title": "Episode 2"},
-        ]
+        mock_response.content = json.dumps(
+            [
+                {"id": 1, "seriesId": 123, "title": "Episode 1"},
+                {"id": 2, "seriesId": 123, "title": "Episode 2"},
+            ]
+        ).encode()
         mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
@@ -113,109 +125,473 @@ class TestSonarrAPI:
 
         mock_get.assert_called_once_with(
             "http://localhost:8989/api/v3/episode",
-            params={"seriesId": 123, "includeImages": "false", "apikey": "test-api-key"},
+            params={"seriesId": 123, "includeImages": "false"},
             timeout=30,
         )
         assert len(result) == 2
         assert result[0]["title"] == "Episode 1"
 
-    @patch("requests.get")
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_by_series_id_fallback(self, mock_pyarr, mock_get):
+    @patch("requests.Session.get")
+    def test_get_episodes_by_series_id_fallback(self, mock_get, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id fallback to pyarr."""
         # Mock direct HTTP call failure
         mock_get.side_effect = Exception("HTTP error")
 
         # Mock pyarr fallback success
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.return_value = [{"id": 1, "title": "Episode 1"}]
+        mock_pyarr_instance.get_episode.return_value = [{"id": 1, "title": "Episode 1"}]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         # Should fall back to pyarr
-        mock_instance.get_episode.assert_called_with(seriesId=123)
+        mock_pyarr_instance.get_episode.assert_called_with(seriesId=123)
         assert len(result) == 1
         assert result[0]["title"] == "Episode 1"
 
-    @patch("requests.get")
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_by_series_id_all_fallbacks_fail(self, mock_pyarr, mock_get):
+    @patch("requests.Session.get")
+    def test_get_episodes_by_series_id_all_fallbacks_fail(self, mock_get, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id when all methods fail."""
         # Mock all methods failing
         mock_get.side_effect = Exception("HTTP error")
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.side_effect = Exception("Pyarr error")
+        mock_pyarr_instance.get_episode.side_effect = Exception("Pyarr error")
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         # Should return empty list
         assert result == []
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_tag(self, mock_pyarr):
-        """Test getting tag information."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_tag.return_value = {"id": 5, "label": "123 - testuser"}
+    @patch("requests.Session.get")
+    def test_get_episode_files_decodes_raw_bytes(self, mock_get):
+        """Test that raw response bytes are decoded without calling response.json()."""
+        mock_response = Mock()
+        mock_response.content = b'[{"id": 1, "size": 2048}]'
+        mock_response.json.side_effect = AssertionError("stdlib decoder should not be used")
+        mock_get.return_value = mock_response
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        with patch("prunarr.api.base_client.orjson", json):
+            result = api.get_episode_files()
+
+        assert result == [{"id": 1, "size": 2048}]
+
+    @patch("requests.Session.get")
+    def test_get_episode_files_without_orjson(self, mock_get):
+        """Test that decoding falls back to response.json() when orjson is missing."""
+        mock_response = Mock()
+        mock_response.content = b"ignored"
+        mock_response.json.return_value = [{"id": 1}]
+        mock_get.return_value = mock_response
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        with patch("prunarr.api.base_client.orjson", None):
+            result = api.get_episode_files()
+
+        assert result == [{"id": 1}]
+
+    @patch("requests.Session.get")
+    def test_get_episode_files_conditional_get(self, mock_get):
+        """Test that a 304 reply reuses the payload stored with the ETag."""
+        first = Mock(status_code=200, headers={"ETag": '"v1"'})
+        first.content = json.dumps([{"id": 1}]).encode()
+        not_modified = Mock(status_code=304, headers={})
+        not_modified.json.side_effect = AssertionError("304 has no body to decode")
+        mock_get.side_effect = [first, not_modified]
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        assert api.get_episode_files(series_id=123) == [{"id": 1}]
+        assert api.get_episode_files(series_id=123) == [{"id": 1}]
+
+        assert "headers" not in mock_get.call_args_list[0].kwargs
+        assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch("requests.Session.get")
+    def test_conditional_get_returns_fresh_copies(self, mock_get):
+        """Test that mutating a returned payload does not corrupt later 304 replies."""
+        first = Mock(status_code=200, headers={"ETag": '"v1"'})
+        first.content = json.dumps([{"id": 1}]).encode()
+        not_modified = Mock(status_code=304, headers={})
+        mock_get.side_effect = [first, not_modified, not_modified]
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        api.get_episode_files(series_id=123)[0]["tagged"] = True
+        replay = api.get_episode_files(series_id=123)
+        assert replay == [{"id": 1}]
+        replay.append({"id": 2})
+        assert api.get_episode_files(series_id=123) == [{"id": 1}]
+
+    @patch("requests.Session.get")
+    def test_conditional_get_cache_is_bounded(self, mock_get):
+        """Test that only series-scoped responses are kept, least recently used evicted."""
+        mock_get.side_effect = lambda url, **kwargs: Mock(
+            status_code=200, headers={"ETag": '"v1"'}, content=b"[]"
+        )
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        api.get_episode_files()
+        assert len(api._etag_cache) == 0
+
+        with patch("prunarr.sonarr.ETAG_CACHE_MAX_ENTRIES", 2):
+            for series_id in (1, 2, 1, 3):
+                api.get_episode_files(series_id=series_id)
+
+        cached_series = [dict(params)["seriesId"] for _, params in api._etag_cache]
+        assert cached_series == [1, 3]
+
+    @patch("requests.Session.get")
+    def test_get_episodes_by_series_id_season_number(self, mock_get):
+        """Test that a season filter is sent to Sonarr and enforced on the result."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            [
+                {"id": 1, "seasonNumber": 2},
+                {"id": 2, "seasonNumber": 3},
+            ]
+        ).encode()
+        mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
+        result = api.get_episodes_by_series_id(123, season_number=2)
+
+        mock_get.assert_called_once_with(
+            "http://localhost:8989/api/v3/episode",
+            params={"seriesId": 123, "includeImages": "false", "seasonNumber": 2},
+            timeout=30,
+        )
+        assert result == [{"id": 1, "seasonNumber": 2}]
+
+    @patch("requests.Session.get")
+    def test_get_episodes_by_series_ids(self, mock_get):
+        """Test fetching episodes for several series concurrently."""
+
+        def respond(url, params, timeout):
+            response = Mock()
+            response.content = json.dumps([{"id": params["seriesId"] * 10}]).encode()
+            return response
+
+        mock_get.side_effect = respond
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+        result = api.get_episodes_by_series_ids([1, 2, 3, 2], concurrency=2)
+
+        assert result == {1: [{"id": 10}], 2: [{"id": 20}], 3: [{"id": 30}]}
+        assert mock_get.call_count == 3
+
+    def test_get_episodes_by_series_ids_empty(self):
+        """Test that no requests are made for an empty ID list."""
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+        assert api.get_episodes_by_series_ids([]) == {}
+
+    @patch("requests.Session.get")
+    def test_get_episodes_by_series_id_remembers_fallback(self, mock_get, api, mock_pyarr_instance):
+        """Test that the working fallback is reused without retrying the failed methods."""
+        mock_get.side_effect = Exception("HTTP error")
+        mock_pyarr_instance.get_episode.return_value = [{"id": 1}]
+
+        api.get_episodes_by_series_id(1)
+        api.get_episodes_by_series_id(2)
+
+        assert mock_get.call_count == 1
+        assert mock_pyarr_instance.get_episode.call_count == 2
+        mock_pyarr_instance.get_episode.assert_called_with(seriesId=2)
+
+    def test_concurrent_series_lookups_share_one_request(self, api, mock_pyarr_instance):
+        """Test that simultaneous lookups of the same series issue a single request."""
+        release = threading.Event()
+
+        def slow_get_series(series_id):
+            release.wait(timeout=5)
+            return {"id": series_id}
+
+        mock_pyarr_instance.get_series.side_effect = slow_get_series
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(api.get_series_by_id, 7) for _ in range(4)]
+            while len(api._inflight) == 0:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [{"id": 7}] * 4
+        mock_pyarr_instance.get_series.assert_called_once_with(7)
+        assert api._inflight == {}
+
+    def test_single_flight_propagates_errors(self, api, mock_pyarr_instance):
+        """Test that a failed shared fetch raises and is not remembered."""
+        mock_pyarr_instance.get_tag.side_effect = [Exception("API error"), {"id": 1, "label": "x"}]
+
+        with pytest.raises(Exception, match="API error"):
+            api.get_tag(1)
+        assert api.get_tag(1) == {"id": 1, "label": "x"}
+
+    def test_get_tag(self, api, mock_pyarr_instance):
+        """Test getting tag information."""
+        mock_pyarr_instance.get_tag.return_value = {"id": 5, "label": "123 - testuser"}
+
         result = api.get_tag(5)
 
-        mock_instance.get_tag.assert_called_once_with(5)
+        mock_pyarr_instance.get_tag.assert_called_once_with(5)
         assert result["label"] == "123 - testuser"
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_delete_series_success(self, mock_pyarr):
+    def test_get_tags(self, api, mock_pyarr_instance):
+        """Test getting all tags in a single call."""
+        mock_pyarr_instance.get_tag.return_value = [
+            {"id": 1, "label": "123 - testuser"},
+            {"id": 2, "label": "4K"},
+        ]
+
+        result = api.get_tags()
+
+        mock_pyarr_instance.get_tag.assert_called_once_with()
+        assert [tag["label"] for tag in result] == ["123 - testuser", "4K"]
+
+    def test_series_and_tags_cached_across_clients(self, tmp_path, mock_pyarr_instance):
+        """Test a second client run reuses cached series and tag lists."""
+        mock_pyarr_instance.get_series.return_value = [{"id": 1, "title": "Series", "tags": [1]}]
+        mock_pyarr_instance.get_tag.return_value = [{"id": 1, "label": "123 - testuser"}]
+
+        for _ in range(2):
+            cache_manager = CacheManager(CacheConfig(cache_dir=tmp_path))
+            api = SonarrAPI("http://localhost:8989", "test-api-key", cache_manager=cache_manager)
+            assert api.get_series() == [{"id": 1, "title": "Series", "tags": [1]}]
+            assert api.get_tags() == [{"id": 1, "label": "123 - testuser"}]
+
+        mock_pyarr_instance.get_series.assert_called_once_with()
+        mock_pyarr_instance.get_tag.assert_called_once_with()
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_episode_files_cached_until_delete(self, mock_get, mock_delete, tmp_path):
+        """Test that series episode files are cached and invalidated by deletes."""
+        mock_response = Mock()
+        mock_response.content = json.dumps([{"id": 7, "seriesId": 123, "size": 100}]).encode()
+        mock_get.return_value = mock_response
+
+        cache_manager = CacheManager(CacheConfig(cache_dir=tmp_path))
+        api = SonarrAPI("http://localhost:8989", "test-api-key", cache_manager=cache_manager)
+
+        api.get_episode_files(series_id=123)
+        api.get_episode_files(series_id=123)
+        assert mock_get.call_count == 1
+
+        assert api.delete_episode_file(7, series_id=123) is True
+        api.get_episode_files(series_id=123)
+        assert mock_get.call_count == 2
+
+    @patch("requests.Session.get", side_effect=Exception("HTTP error"))
+    def test_episode_files_failure_not_cached(self, mock_get, tmp_path):
+        """Test that a failed episode file fetch is not cached as empty."""
+        cache_manager = CacheManager(CacheConfig(cache_dir=tmp_path))
+        api = SonarrAPI("http://localhost:8989", "test-api-key", cache_manager=cache_manager)
+
+        assert api.get_episode_files(series_id=123) == []
+        assert api.get_episode_files(series_id=123) == []
+        assert mock_get.call_count == 2
+
+    def test_delete_series_success(self, api, mock_pyarr_instance):
         """Test successful series deletion."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.del_series.return_value = True
+        mock_pyarr_instance.del_series.return_value = True
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.delete_series(123)
 
-        mock_instance.del_series.assert_called_once_with(
+        mock_pyarr_instance.del_series.assert_called_once_with(
             123, delete_files=True, add_exclusion=False
         )
         assert result is True
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_delete_series_with_options(self, mock_pyarr):
+    def test_delete_series_with_options(self, api, mock_pyarr_instance):
         """Test series deletion with custom options."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.del_series.return_value = True
+        mock_pyarr_instance.del_series.return_value = True
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.delete_series(123, delete_files=False, add_exclusion=True)
 
-        mock_instance.del_series.assert_called_once_with(
+        mock_pyarr_instance.del_series.assert_called_once_with(
             123, delete_files=False, add_exclusion=True
         )
         assert result is True
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_delete_series_failure(self, mock_pyarr):
+    def test_delete_series_failure(self, api, mock_pyarr_instance):
         """Test series deletion failure handling."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.del_series.side_effect = Exception("API error")
+        mock_pyarr_instance.del_series.side_effect = Exception("API error")
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.delete_series(123)
 
         assert result is False
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_season_info(self, mock_pyarr):
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files(self, mock_get, mock_delete):
+        """Test that only the requested season's files are deleted in one bulk request."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            [
+                {"id": 1, "seasonNumber": 1},
+                {"id": 2, "seasonNumber": 2},
+                {"id": 3, "seasonNumber": 2},
+            ]
+        ).encode()
+        mock_get.return_value = mock_response
+        mock_delete.return_value = Mock(status_code=204)
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+        result = api.delete_season_files(123, season_number=2)
+
+        assert result is True
+        mock_delete.assert_called_once_with(
+            "http://localhost:8989/api/v3/episodefile/bulk",
+            json={"episodeFileIds": [2, 3]},
+            timeout=60,
+        )
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files_without_bulk_endpoint(self, mock_get, mock_delete):
+        """Test the per-file fallback on Sonarr versions without bulk deletes."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            [
+                {"id": 1, "seasonNumber": 1},
+                {"id": 2, "seasonNumber": 2},
+                {"id": 3, "seasonNumber": 2},
+            ]
+        ).encode()
+        mock_get.return_value = mock_response
+        mock_delete.side_effect = lambda url, **kwargs: Mock(
+            status_code=405 if url.endswith("/bulk") else 200
+        )
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key", delete_concurrency=2)
+
+        assert api.delete_season_files(123, season_number=2) is True
+        assert api.delete_season_files(123, season_number=1) is True
+
+        deleted_urls = sorted(call.args[0] for call in mock_delete.call_args_list)
+        assert deleted_urls == [
+            "http://localhost:8989/api/v3/episodefile/1",
+            "http://localhost:8989/api/v3/episodefile/2",
+            "http://localhost:8989/api/v3/episodefile/3",
+            "http://localhost:8989/api/v3/episodefile/bulk",
+        ]
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files_reuses_season_index(self, mock_get, mock_delete):
+        """Test that pruning several seasons lists the series' files only once."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            [
+                {"id": 1, "seasonNumber": 1},
+                {"id": 2, "seasonNumber": 2},
+                {"id": 3, "seasonNumber": 3},
+            ]
+        ).encode()
+        mock_get.return_value = mock_response
+        mock_delete.return_value = Mock(status_code=200)
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        assert api.delete_season_files(123, season_number=1) is True
+        assert api.delete_season_files(123, season_number=2) is True
+        assert api.delete_season_files(123, season_number=1) is True
+
+        assert mock_get.call_count == 1
+        assert mock_delete.call_count == 2
+        assert api._season_file_index[123] == {3: [3]}
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files_streams_with_ijson(self, mock_get, mock_delete):
+        """Test that the season index is built from a streamed response when ijson is present."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_get.return_value = mock_response
+        fake_ijson = Mock()
+        fake_ijson.items.return_value = iter(
+            [{"id": 1, "seasonNumber": 1}, {"id": 2, "seasonNumber": 2}]
+        )
+        mock_delete.return_value = Mock(status_code=200)
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        with patch("prunarr.sonarr.ijson", fake_ijson):
+            assert api.delete_season_files(123, season_number=2) is True
+
+        assert mock_get.call_args.kwargs["stream"] is True
+        fake_ijson.items.assert_called_once_with(mock_response.raw, "item", use_float=True)
+        mock_delete.assert_called_once_with(
+            "http://localhost:8989/api/v3/episodefile/bulk",
+            json={"episodeFileIds": [2]},
+            timeout=60,
+        )
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files_stream_failure(self, mock_get, mock_delete):
+        """Test that a listing stream breaking off mid-way fails instead of deleting nothing."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_get.return_value = mock_response
+
+        def broken_stream(*args, **kwargs):
+            yield {"id": 1, "seasonNumber": 2}
+            raise ConnectionError("stream interrupted")
+
+        fake_ijson = Mock()
+        fake_ijson.items.side_effect = broken_stream
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        with patch("prunarr.sonarr.ijson", fake_ijson):
+            assert api.delete_season_files(123, season_number=2) is False
+
+        mock_delete.assert_not_called()
+        assert 123 not in api._season_file_index
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files_listing_failure_not_cached(self, mock_get, mock_delete):
+        """Test that a failed listing reports failure and is retried on the next call."""
+        mock_response = Mock()
+        mock_response.content = json.dumps([{"id": 1, "seasonNumber": 1}]).encode()
+        mock_get.side_effect = [requests.ConnectionError("Connection error"), mock_response]
+        mock_delete.return_value = Mock(status_code=200)
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        assert api.delete_season_files(123, season_number=1) is False
+        assert 123 not in api._season_file_index
+        mock_delete.assert_not_called()
+
+        assert api.delete_season_files(123, season_number=1) is True
+        assert mock_get.call_count == 2
+        mock_delete.assert_called_once()
+
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_season_files_partial_failure(self, mock_get, mock_delete):
+        """Test that a single failed deletion is reported."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            [
+                {"id": 1, "seasonNumber": 1},
+                {"id": 2, "seasonNumber": 1},
+            ]
+        ).encode()
+        mock_get.return_value = mock_response
+        mock_delete.side_effect = [Mock(status_code=404), Mock(), Exception("API error")]
+
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        assert api.delete_season_files(123, season_number=1) is False
+        assert mock_delete.call_count == 3
+
+    def test_get_season_info(self, api, mock_pyarr_instance):
         """Test getting season information."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_series.return_value = {
+        mock_pyarr_instance.get_series.return_value = {
             "id": 1,
             "seasons": [
                 {"seasonNumber": 1, "statistics": {"episodeCount": 10}},
@@ -223,31 +599,23 @@ class TestSonarrAPI:
             ],
         }
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_season_info(1)
 
         assert len(result) == 2
         assert result[0]["seasonNumber"] == 1
         assert result[1]["statistics"]["episodeCount"] == 12
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_season_info_exception(self, mock_pyarr):
+    def test_get_season_info_exception(self, api, mock_pyarr_instance):
         """Test get_season_info with API exception."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_series.side_effect = Exception("API error")
+        mock_pyarr_instance.get_series.side_effect = Exception("API error")
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_season_info(1)
 
         assert result == []
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_with_files(self, mock_pyarr):
+    def test_get_episodes_with_files(self, api, mock_pyarr_instance):
         """Test getting episodes with file information."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.return_value = [
+        mock_pyarr_instance.get_episode.return_value = [
             {
                 "id": 1,
                 "seriesId": 123,
@@ -259,7 +627,6 @@ class TestSonarrAPI:
             }
         ]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_with_files()
 
         assert len(result) == 1
@@ -267,45 +634,78 @@ class TestSonarrAPI:
         assert result[0]["has_file"] is True
         assert result[0]["episode_file_id"] == 456
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_with_files_by_series(self, mock_pyarr):
-        """Test getting episodes with files for specific series."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.return_value = [{"id": 1, "seriesId": 123, "hasFile": True}]
+    @patch("requests.Session.get")
+    def test_get_episodes_with_files_embedded_file(self, mock_get):
+        """Test that series-scoped episodes include embedded file details."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "seriesId": 123,
+                    "seasonNumber": 1,
+                    "hasFile": True,
+                    "episodeFileId": 456,
+                    "episodeFile": {
+                        "id": 456,
+                        "size": 1024,
+                        "path": "/tv/Show/S01E01.mkv",
+                        "quality": {"quality": {"name": "HDTV-720p"}},
+                    },
+                },
+                {"id": 2, "seriesId": 123, "seasonNumber": 1, "hasFile": False},
+            ]
+        ).encode()
+        mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_with_files(series_id=123)
 
-        mock_instance.get_episode.assert_called_once_with(series=123)
+        mock_get.assert_called_once_with(
+            "http://localhost:8989/api/v3/episode",
+            params={"seriesId": 123, "includeEpisodeFile": "true", "includeImages": "false"},
+            timeout=30,
+        )
+        assert result[0]["size"] == 1024
+        assert result[0]["quality"] == "HDTV-720p"
+        assert result[0]["path"] == "/tv/Show/S01E01.mkv"
+        assert result[1]["size"] == 0
+        assert result[1]["path"] is None
+
+    @patch("requests.Session.get", side_effect=Exception("Connection error"))
+    def test_get_episodes_with_files_by_series(self, mock_get, api, mock_pyarr_instance):
+        """Test getting episodes with files for specific series via pyarr fallback."""
+        mock_pyarr_instance.get_episode.return_value = [{"id": 1, "seriesId": 123, "hasFile": True}]
+
+        result = api.get_episodes_with_files(series_id=123)
+
+        mock_pyarr_instance.get_episode.assert_called_once_with(series=123)
         assert len(result) == 1
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_with_files_exception(self, mock_pyarr):
+    def test_get_episodes_with_files_exception(self, api, mock_pyarr_instance):
         """Test get_episodes_with_files with API exception."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-        mock_instance.get_episode.side_effect = Exception("API error")
+        mock_pyarr_instance.get_episode.side_effect = Exception("API error")
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_with_files()
 
         assert result == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episode_files(self, mock_get):
         """Test getting episode file information."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [
-            {
-                "id": 1,
-                "seriesId": 123,
-                "size": 1073741824,
-                "quality": {"quality": {"name": "HDTV-1080p"}},
-                "relativePath": "Season 01/Episode.mkv",
-            }
-        ]
+        mock_response.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "seriesId": 123,
+                    "size": 1073741824,
+                    "quality": {"quality": {"name": "HDTV-1080p"}},
+                    "relativePath": "Season 01/Episode.mkv",
+                }
+            ]
+        ).encode()
         mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
@@ -313,18 +713,18 @@ class TestSonarrAPI:
 
         mock_get.assert_called_once_with(
             "http://localhost:8989/api/v3/episodefile",
-            params={"apikey": "test-api-key"},
+            params={},
             timeout=30,
         )
         assert len(result) == 1
         assert result[0]["size"] == 1073741824
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episode_files_by_series(self, mock_get):
         """Test getting episode files for specific series."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [{"id": 1, "seriesId": 123}]
+        mock_response.content = json.dumps([{"id": 1, "seriesId": 123}]).encode()
         mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
@@ -332,12 +732,12 @@ class TestSonarrAPI:
 
         mock_get.assert_called_once_with(
             "http://localhost:8989/api/v3/episodefile",
-            params={"seriesId": 123, "apikey": "test-api-key"},
+            params={"seriesId": 123},
             timeout=30,
         )
         assert len(result) == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episode_files_exception(self, mock_get):
         """Test get_episode_files with HTTP exception."""
         mock_get.side_effect = Exception("HTTP error")
@@ -347,60 +747,55 @@ class TestSonarrAPI:
 
         assert result == []
 
-    @patch("pyarr.SonarrAPI.get_episode")
-    def test_get_episodes_by_series_id_dict_response(self, mock_get):
+    def test_get_episodes_by_series_id_dict_response(self, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id with dict response."""
         # Mock returning a single episode as dict instead of list
-        mock_get.return_value = {"id": 1, "title": "Episode 1"}
+        mock_pyarr_instance.get_episode.return_value = {"id": 1, "title": "Episode 1"}
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         assert isinstance(result, list)
         assert len(result) == 1
         assert result[0]["id"] == 1
 
-    @patch("pyarr.SonarrAPI.get_episode")
-    def test_get_episodes_by_series_id_other_response(self, mock_get):
+    def test_get_episodes_by_series_id_other_response(self, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id with unexpected response type."""
         # Mock returning something unexpected (string)
-        mock_get.return_value = "unexpected"
+        mock_pyarr_instance.get_episode.return_value = "unexpected"
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         assert result == []
 
-    @patch("pyarr.SonarrAPI.get_episode")
-    def test_get_episodes_by_series_id_fallback_dict_response(self, mock_get):
+    def test_get_episodes_by_series_id_fallback_dict_response(self, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id fallback with dict response."""
         # First call fails, second call returns dict
-        mock_get.side_effect = [Exception("First failed"), {"id": 1, "title": "Episode 1"}]
+        mock_pyarr_instance.get_episode.side_effect = [
+            Exception("First failed"),
+            {"id": 1, "title": "Episode 1"},
+        ]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         assert isinstance(result, list)
         assert len(result) == 1
         assert result[0]["id"] == 1
 
-    @patch("pyarr.SonarrAPI.get_episode")
-    def test_get_episodes_by_series_id_fallback_other_response(self, mock_get):
+    def test_get_episodes_by_series_id_fallback_other_response(self, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id fallback with unexpected response."""
         # First call fails, second call returns unexpected type
-        mock_get.side_effect = [Exception("First failed"), "unexpected"]
+        mock_pyarr_instance.get_episode.side_effect = [Exception("First failed"), "unexpected"]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         assert result == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episode_files_dict_response(self, mock_get):
         """Test get_episode_files with dict response."""
         # Mock returning a single file as dict instead of list
         mock_response = Mock()
-        mock_response.json.return_value = {"id": 1, "path": "/path/to/file"}
+        mock_response.content = json.dumps({"id": 1, "path": "/path/to/file"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -411,25 +806,26 @@ class TestSonarrAPI:
         assert len(result) == 1
         assert result[0]["id"] == 1
 
-    @patch("pyarr.SonarrAPI.get_episode")
-    def test_get_episodes_by_series_id_fallback_list_response(self, mock_get):
+    def test_get_episodes_by_series_id_fallback_list_response(self, api, mock_pyarr_instance):
         """Test get_episodes_by_series_id fallback returns list."""
         # First call fails, second call returns list
-        mock_get.side_effect = [Exception("First failed"), [{"id": 1, "title": "Episode 1"}]]
+        mock_pyarr_instance.get_episode.side_effect = [
+            Exception("First failed"),
+            [{"id": 1, "title": "Episode 1"}],
+        ]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_by_series_id(123)
 
         assert isinstance(result, list)
         assert len(result) == 1
         assert result[0]["id"] == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episode_files_other_response(self, mock_get):
         """Test get_episode_files with unexpected response type."""
         # Mock returning something unexpected
         mock_response = Mock()
-        mock_response.json.return_value = "unexpected"
+        mock_response.content = json.dumps("unexpected").encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -442,7 +838,7 @@ class TestSonarrAPI:
         """Test get_series_episodes_summary successful execution."""
         api = SonarrAPI("http://localhost:8989", "test-api-key")
 
-        with patch.object(api, "get_episodes_with_files") as mock_episodes:
+        with patch.object(api, "_iter_episodes_with_files") as mock_episodes:
             mock_episodes.return_value = [
                 {"season_number": 1, "has_file": True},
                 {"season_number": 1, "has_file": False},
@@ -467,11 +863,33 @@ class TestSonarrAPI:
             assert season_2["total_episodes"] == 2
             assert season_2["downloaded_episodes"] == 2
 
+    def test_get_series_episodes_summary_sizes(self):
+        """Test that the summary totals embedded file sizes per season."""
+        api = SonarrAPI("http://localhost:8989", "test-api-key")
+
+        with patch.object(api, "_iter_episodes_with_files") as mock_episodes:
+            mock_episodes.return_value = [
+                {"season_number": 1, "has_file": True, "size": 100},
+                {"season_number": 1, "has_file": False, "size": 0},
+                {"season_number": 2, "has_file": True, "size": 250},
+            ]
+
+            result = api.get_series_episodes_summary(123)
+
+        assert result["size_on_disk"] == 350
+        assert [s["size_on_disk"] for s in result["seasons"]] == [100, 250]
+        assert set(result["seasons"][0]) == {
+            "season_number",
+            "total_episodes",
+            "downloaded_episodes",
+            "size_on_disk",
+        }
+
     def test_get_series_episodes_summary_exception(self):
         """Test get_series_episodes_summary with exception."""
         api = SonarrAPI("http://localhost:8989", "test-api-key")
 
-        with patch.object(api, "get_episodes_with_files") as mock_episodes:
+        with patch.object(api, "_iter_episodes_with_files") as mock_episodes:
             mock_episodes.side_effect = Exception("API error")
 
             result = api.get_series_episodes_summary(123)
@@ -486,12 +904,12 @@ class TestSonarrAPI:
 class TestSonarrAPIDataHandling:
     """Test data handling and edge cases in SonarrAPI."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episodes_by_series_id_single_episode_response(self, mock_get):
         """Test handling single episode response as dict instead of list."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"id": 1, "title": "Single Episode"}
+        mock_response.content = json.dumps({"id": 1, "title": "Single Episode"}).encode()
         mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
@@ -500,12 +918,12 @@ class TestSonarrAPIDataHandling:
         assert len(result) == 1
         assert result[0]["title"] == "Single Episode"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_episodes_by_series_id_unexpected_response(self, mock_get):
         """Test handling unexpected response type."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = "unexpected string response"
+        mock_response.content = json.dumps("unexpected string response").encode()
         mock_get.return_value = mock_response
 
         api = SonarrAPI("http://localhost:8989", "test-api-key")
@@ -513,14 +931,10 @@ class TestSonarrAPIDataHandling:
 
         assert result == []
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_with_files_data_transformation(self, mock_pyarr):
+    def test_get_episodes_with_files_data_transformation(self, api, mock_pyarr_instance):
         """Test that episode data is properly transformed."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-
         # Test with complete episode data
-        mock_instance.get_episode.return_value = [
+        mock_pyarr_instance.get_episode.return_value = [
             {
                 "id": 1,
                 "seriesId": 123,
@@ -536,7 +950,6 @@ class TestSonarrAPIDataHandling:
             }
         ]
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_with_files()
 
         episode = result[0]
@@ -553,16 +966,11 @@ class TestSonarrAPIDataHandling:
         assert episode["runtime"] == 42
         assert episode["monitored"] is True
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_with_files_missing_fields(self, mock_pyarr):
+    def test_get_episodes_with_files_missing_fields(self, api, mock_pyarr_instance):
         """Test handling episodes with missing fields."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-
         # Episode with minimal data
-        mock_instance.get_episode.return_value = [{"id": 1}]  # Only ID field
+        mock_pyarr_instance.get_episode.return_value = [{"id": 1}]  # Only ID field
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_with_files()
 
         episode = result[0]
@@ -574,22 +982,17 @@ class TestSonarrAPIDataHandling:
         assert episode["runtime"] == 0
         assert episode["monitored"] is False
 
-    @patch("prunarr.sonarr.PyarrSonarrAPI")
-    def test_get_episodes_with_files_non_list_response(self, mock_pyarr):
+    def test_get_episodes_with_files_non_list_response(self, api, mock_pyarr_instance):
         """Test handling non-list response from get_episode."""
-        mock_instance = Mock()
-        mock_pyarr.return_value = mock_instance
-
         # Single episode returned as dict
-        mock_instance.get_episode.return_value = {"id": 1, "title": "Single Episode"}
+        mock_pyarr_instance.get_episode.return_value = {"id": 1, "title": "Single Episode"}
 
-        api = SonarrAPI("http://localhost:8989", "test-api-key")
         result = api.get_episodes_with_files()
 
         assert len(result) == 1
         assert result[0]["id"] == 1
 
         # None response
-        mock_instance.get_episode.return_value = None
+        mock_pyarr_instance.get_episode.return_value = None
         result = api.get_episodes_with_files()
         assert result == []
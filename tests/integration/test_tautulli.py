@@ -5,12 +5,24 @@ Tests the TautulliAPI class functionality including watch history retrieval,
 metadata extraction, ID extraction, and pagination handling.
 """
 
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-from prunarr.tautulli import IMDB_ID_PATTERN, TVDB_ID_PATTERN, TautulliAPI
+from prunarr.tautulli import (
+    GUID_PATTERN,
+    HISTORY_PAGE_WORKERS,
+    IMDB_ID_PATTERN,
+    TVDB_ID_PATTERN,
+    TautulliAPI,
+    _format_history_title,
+    _scan_guids,
+)
 
 
 class TestTautulliAPI:
@@ -28,14 +40,43 @@ class TestTautulliAPI:
         api = TautulliAPI("http://localhost:8181/", "test-api-key")
         assert api.base_url == "http://localhost:8181"
 
-    @patch("requests.get")
+    def test_session_reused_across_requests(self):
+        """Test that requests go through one pooled session that close() releases."""
+        with patch("requests.Session.close") as mock_close:
+            with TautulliAPI("http://localhost:8181", "test-api-key") as api:
+                assert api._session.headers["Accept"] == "application/json"
+                assert "gzip" in api._session.headers["Accept-Encoding"]
+                adapter = api._session.get_adapter("http://localhost:8181")
+                assert adapter._pool_maxsize >= HISTORY_PAGE_WORKERS
+
+        mock_close.assert_called_once()
+
+    def test_session_retries_transient_errors(self):
+        """Test that the session retries throttling and server errors with backoff."""
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        retry = api._session.get_adapter("http://localhost:8181").max_retries
+
+        assert retry.total == 3
+        assert retry.backoff_factor > 0
+        assert {429, 500, 502, 503, 504} <= set(retry.status_forcelist)
+
+    @patch("requests.Session.get")
+    def test_request_retries_exhausted(self, mock_get):
+        """Test that exhausted retries report the command and page position."""
+        mock_get.side_effect = requests.exceptions.RetryError("too many 503 error responses")
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        with pytest.raises(ValueError, match="get_history at record 2000"):
+            api._request("get_history", params={"start": 2000, "length": 1000})
+
+    @patch("requests.Session.get")
     def test_request_success(self, mock_get):
         """Test successful API request."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers.get.return_value = "application/json"
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"response": {"data": {"key": "value"}}}
+        mock_response.content = json.dumps({"response": {"data": {"key": "value"}}}).encode()
         mock_get.return_value = mock_response
 
         api = TautulliAPI("http://localhost:8181", "test-api-key")
@@ -48,14 +89,31 @@ class TestTautulliAPI:
         )
         assert result == {"data": {"key": "value"}}
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_request_decodes_raw_bytes(self, mock_get):
+        """Test that the raw body is decoded with orjson when it is available."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get.return_value = "application/json"
+        mock_response.content = b'{"response": {"result": "success", "data": [1, 2]}}'
+        mock_response.json.side_effect = AssertionError("stdlib decoder should not be used")
+        mock_get.return_value = mock_response
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+
+        with patch("prunarr.api.base_client.orjson", json):
+            result = api._request("get_history")
+
+        assert result == {"result": "success", "data": [1, 2]}
+
+    @patch("requests.Session.get")
     def test_request_with_no_params(self, mock_get):
         """Test API request without additional parameters."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers.get.return_value = "application/json"
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"response": {"success": True}}
+        mock_response.content = json.dumps({"response": {"success": True}}).encode()
         mock_get.return_value = mock_response
 
         api = TautulliAPI("http://localhost:8181", "test-api-key")
@@ -68,7 +126,7 @@ class TestTautulliAPI:
         )
         assert result == {"success": True}
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_http_error(self, mock_get):
         """Test API request with HTTP error."""
         mock_response = Mock()
@@ -82,7 +140,7 @@ class TestTautulliAPI:
         with pytest.raises(ValueError, match="Tautulli server not accessible"):
             api._request("test_command")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_timeout(self, mock_get):
         """Test API request timeout."""
         mock_get.side_effect = requests.Timeout("Request timeout")
@@ -125,6 +183,25 @@ class TestTautulliAPI:
         assert len(result) == 3
         assert mock_request.call_count == 2  # Should stop after second call
 
+    @patch.object(TautulliAPI, "_request")
+    def test_get_watch_history_concurrent_pages(self, mock_request):
+        """Test remaining pages are fetched by offset once the total is known."""
+        records = [{"id": i, "title": f"Movie {i}"} for i in range(5)]
+
+        def request_side_effect(cmd, params):
+            start, length = params["start"], params["length"]
+            return {"data": {"data": records[start : start + length], "recordsFiltered": 5}}
+
+        mock_request.side_effect = request_side_effect
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        result = api.get_watch_history(page_size=2)
+
+        assert [r["id"] for r in result] == [0, 1, 2, 3, 4]
+        assert mock_request.call_count == 3
+        starts = sorted(call.kwargs["params"]["start"] for call in mock_request.call_args_list)
+        assert starts == [0, 2, 4]
+
     @patch.object(TautulliAPI, "_request")
     def test_get_watch_history_with_limit(self, mock_request):
         """Test watch history with limit enforcement."""
@@ -157,7 +234,50 @@ class TestTautulliAPI:
             },
         )
 
-    @patch.object(TautulliAPI, "get_watch_history")
+    @patch.object(TautulliAPI, "_request")
+    def test_get_watch_history_server_filters(self, mock_request):
+        """Test that user, media type and search filters are sent to get_history."""
+        mock_request.return_value = {"data": {"data": []}}
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        api.get_watch_history(user_id=123, media_type="movie", search="Matrix")
+
+        params = mock_request.call_args.kwargs["params"]
+        assert params["user_id"] == 123
+        assert params["media_type"] == "movie"
+        assert params["search"] == "Matrix"
+
+    @patch.object(TautulliAPI, "_request")
+    def test_iter_watch_history_is_lazy(self, mock_request):
+        """Test that later pages are only requested once the iterator reaches them."""
+        mock_request.side_effect = [
+            {"data": {"data": [{"id": 1}, {"id": 2}]}},
+            {"data": {"data": [{"id": 3}, {"id": 4}]}},
+            {"data": {"data": []}},
+        ]
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        records = api.iter_watch_history(page_size=2)
+
+        assert next(records) == {"id": 1}
+        assert mock_request.call_count == 1
+        assert [r["id"] for r in records] == [2, 3, 4]
+        assert mock_request.call_count == 3
+
+    @patch.object(TautulliAPI, "iter_watch_history")
+    def test_get_filtered_history_forwards_server_filters(self, mock_get_history):
+        """Test that server-filterable criteria are pushed down without over-fetching."""
+        mock_get_history.return_value = []
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        api.get_filtered_history(user_id=123, media_type="movie", limit=10)
+
+        kwargs = mock_get_history.call_args.kwargs
+        assert kwargs["user_id"] == 123
+        assert kwargs["media_type"] == "movie"
+        assert kwargs["limit"] == 10
+
+    @patch.object(TautulliAPI, "iter_watch_history")
     def test_get_movie_completed_history(self, mock_get_history):
         """Test getting completed movie history."""
         mock_get_history.return_value = [
@@ -196,7 +316,7 @@ class TestTautulliAPI:
         assert result[0]["media_type"] == "movie"
         assert result[0]["watched_status"] == 1
 
-    @patch.object(TautulliAPI, "get_watch_history")
+    @patch.object(TautulliAPI, "iter_watch_history")
     def test_get_filtered_history(self, mock_get_history):
         """Test getting filtered history."""
         mock_get_history.return_value = [
@@ -230,7 +350,7 @@ class TestTautulliAPI:
         assert result[0]["title"] == "Movie 1"
         assert result[0]["user"] == "testuser"
 
-    @patch.object(TautulliAPI, "get_watch_history")
+    @patch.object(TautulliAPI, "iter_watch_history")
     def test_get_filtered_history_with_limit(self, mock_get_history):
         """Test filtered history with result limit."""
         # Mock more data than the limit
@@ -255,7 +375,7 @@ class TestTautulliAPI:
 
         assert len(result) == 5
 
-    @patch.object(TautulliAPI, "get_watch_history")
+    @patch.object(TautulliAPI, "iter_watch_history")
     def test_get_history_item_details(self, mock_get_history):
         """Test getting details for a specific history item."""
         mock_get_history.return_value = [
@@ -264,21 +384,24 @@ class TestTautulliAPI:
         ]
 
         with patch.object(TautulliAPI, "get_metadata") as mock_get_metadata:
-            mock_get_metadata.return_value = {"summary": "A great movie", "rating": "8.5"}
-
-            with patch.object(TautulliAPI, "get_imdb_id_from_rating_key") as mock_get_imdb:
-                mock_get_imdb.return_value = "tt1234567"
+            mock_get_metadata.return_value = {
+                "summary": "A great movie",
+                "rating": "8.5",
+                "guids": ["imdb://tt1234567", "tmdb://42"],
+            }
 
-                api = TautulliAPI("http://localhost:8181", "test-api-key")
-                result = api.get_history_item_details(1)
+            api = TautulliAPI("http://localhost:8181", "test-api-key")
+            result = api.get_history_item_details(1)
 
-                assert result["history_id"] == 1
-                assert result["title"] == "Movie 1"
-                assert result["imdb_id"] == "tt1234567"
-                assert result["summary"] == "A great movie"
-                assert result["rating"] == "8.5"
+            assert result["history_id"] == 1
+            assert result["title"] == "Movie 1"
+            assert result["imdb_id"] == "tt1234567"
+            assert result["summary"] == "A great movie"
+            assert result["rating"] == "8.5"
+            # The IMDb ID comes from the same metadata response
+            mock_get_metadata.assert_called_once_with("123")
 
-    @patch.object(TautulliAPI, "get_watch_history")
+    @patch.object(TautulliAPI, "iter_watch_history")
     def test_get_history_item_details_not_found(self, mock_get_history):
         """Test getting details for non-existent history item."""
         mock_get_history.return_value = [{"id": 1, "title": "Movie 1"}]
@@ -288,6 +411,20 @@ class TestTautulliAPI:
 
         assert result == {}
 
+    @patch.object(TautulliAPI, "get_metadata", return_value={})
+    @patch.object(TautulliAPI, "_request")
+    def test_get_history_item_details_stops_at_match(self, mock_request, mock_get_metadata):
+        """Test that a recent history item is found without fetching later pages."""
+        # A full first page out of a much larger history
+        page = [{"id": 1000 - i, "title": f"Movie {1000 - i}"} for i in range(1000)]
+        mock_request.return_value = {"data": {"data": page, "recordsFiltered": 10000}}
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        result = api.get_history_item_details(990)
+
+        assert result["history_id"] == 990
+        assert mock_request.call_count == 1
+
     @patch.object(TautulliAPI, "_request")
     def test_get_metadata(self, mock_request):
         """Test getting metadata for a rating key."""
@@ -301,6 +438,32 @@ class TestTautulliAPI:
         mock_request.assert_called_once_with("get_metadata", params={"rating_key": "12345"})
         assert result["title"] == "Test Movie"
 
+    @patch.object(TautulliAPI, "_request")
+    def test_get_metadata_memoized(self, mock_request):
+        """Test that repeated metadata lookups for one rating key hit the API once."""
+        mock_request.return_value = {"data": {"guids": ["imdb://tt1", "tvdb://2"]}}
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+
+        assert api.get_imdb_id_from_rating_key("12345") == "tt1"
+        assert api.get_tvdb_id_from_rating_key(12345) == "2"
+        assert mock_request.call_count == 1
+
+        api.clear_metadata_cache()
+        api.get_metadata("12345")
+        assert mock_request.call_count == 2
+
+    @patch.object(TautulliAPI, "_request")
+    def test_get_metadata_returns_copy(self, mock_request):
+        """Test that callers cannot modify the memoized metadata."""
+        mock_request.return_value = {"data": {"title": "Test Movie"}}
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        api.get_metadata("12345")["title"] = "Changed"
+
+        assert api.get_metadata("12345")["title"] == "Test Movie"
+        assert api.get_metadata_bulk(["12345"])["12345"]["title"] == "Test Movie"
+
     @patch.object(TautulliAPI, "get_metadata")
     def test_get_imdb_id_from_rating_key(self, mock_get_metadata):
         """Test extracting IMDb ID from metadata."""
@@ -335,7 +498,7 @@ class TestTautulliAPI:
 
         assert result is None
 
-    @patch.object(TautulliAPI, "get_watch_history")
+    @patch.object(TautulliAPI, "iter_watch_history")
     def test_get_episode_completed_history(self, mock_get_history):
         """Test getting completed episode history."""
         mock_get_history.return_value = [
@@ -366,6 +529,57 @@ class TestTautulliAPI:
         assert result[0]["episode_num"] == 1
         assert result[0]["series_title"] == "Test Series"
 
+    @patch.object(TautulliAPI, "get_metadata")
+    @patch.object(TautulliAPI, "iter_watch_history")
+    def test_episode_history_and_series_cache_memoized(self, mock_get_history, mock_get_metadata):
+        """Test repeated calls reuse memoized history and series cache."""
+        mock_get_history.return_value = [
+            {
+                "grandparent_rating_key": "100",
+                "watched_status": 1,
+                "media_type": "episode",
+            }
+        ]
+        mock_get_metadata.return_value = {"guids": ["tvdb://111"]}
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        history = api.get_episode_completed_history()
+        assert api.get_episode_completed_history() is history
+        assert mock_get_history.call_count == 1
+
+        series_cache = api.build_series_metadata_cache(history)
+        assert api.build_series_metadata_cache(history) is series_cache
+        assert mock_get_metadata.call_count == 1
+
+        # A different history list is not served from the memo
+        assert api.build_series_metadata_cache(list(history)) == {"100": "111"}
+        assert mock_get_metadata.call_count == 2
+
+    @patch.object(TautulliAPI, "iter_watch_history")
+    def test_concurrent_episode_history_calls_share_one_fetch(self, mock_get_history):
+        """Test that callers arriving while history is being fetched wait for that fetch."""
+        release = threading.Event()
+
+        def slow_history(**kwargs):
+            release.wait(timeout=5)
+            return [{"grandparent_rating_key": "100", "watched_status": 1, "media_type": "episode"}]
+
+        mock_get_history.side_effect = slow_history
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(api.get_episode_completed_history) for _ in range(4)]
+            deadline = time.monotonic() + 5
+            while not api._inflight and time.monotonic() < deadline:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert mock_get_history.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert api._inflight == {}
+
     @patch.object(TautulliAPI, "get_metadata")
     def test_get_tvdb_id_from_rating_key(self, mock_get_metadata):
         """Test extracting TVDB ID from metadata."""
@@ -425,6 +639,44 @@ class TestTautulliAPI:
         assert result == {"100": "111"}
         assert "200" not in result
 
+    @patch.object(TautulliAPI, "get_metadata")
+    def test_build_series_metadata_cache_concurrent(self, mock_get_metadata):
+        """Test that series metadata requests overlap instead of running one by one."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def metadata_side_effect(rating_key):
+            # Only returns once three lookups are in flight at the same time
+            barrier.wait()
+            return {"guids": [f"tvdb://{rating_key}0"]}
+
+        mock_get_metadata.side_effect = metadata_side_effect
+        episode_history = [{"grandparent_rating_key": key} for key in ("1", "2", "3")]
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        result = api.build_series_metadata_cache(episode_history)
+
+        assert result == {"1": "10", "2": "20", "3": "30"}
+
+    @patch.object(TautulliAPI, "_fetch_metadata")
+    def test_get_metadata_bulk(self, mock_fetch):
+        """Test bulk metadata reuses memoized entries, dedupes keys and skips failures."""
+
+        def fetch_side_effect(rating_key):
+            if rating_key == "3":
+                raise ValueError("API error")
+            return {"rating_key": rating_key}
+
+        mock_fetch.side_effect = fetch_side_effect
+
+        api = TautulliAPI("http://localhost:8181", "test-api-key")
+        api.get_metadata("1")
+        mock_fetch.reset_mock()
+
+        result = api.get_metadata_bulk(["1", "2", 2, "3"])
+
+        assert result == {"1": {"rating_key": "1"}, "2": {"rating_key": "2"}}
+        assert sorted(call.args[0] for call in mock_fetch.call_args_list) == ["2", "3"]
+
 
 class TestTautulliRegexPatterns:
     """Test the regex patterns used for ID extraction."""
@@ -491,6 +743,38 @@ class TestTautulliRegexPatterns:
         assert match is not None
         assert match.group(1) == "12"
 
+    def test_guid_pattern_agrees_with_individual_patterns(self):
+        """Test that the combined GUID pattern extracts the same IDs as the separate ones."""
+        guids = ["imdb://tt0123456", "tvdb://123456", "tvdb://12.34", "tmdb://99", "tvdb://"]
+
+        for guid in guids:
+            match = GUID_PATTERN.match(guid)
+            imdb = IMDB_ID_PATTERN.match(guid)
+            tvdb = TVDB_ID_PATTERN.match(guid)
+            assert (match.group("imdb") if match else None) == (imdb.group(1) if imdb else None)
+            assert (match.group("tvdb") if match else None) == (tvdb.group(1) if tvdb else None)
+
+    def test_scan_guids_finds_both_ids(self):
+        """Test that one scan returns the first IMDb and TVDB IDs."""
+        metadata = {"guids": ["tmdb://1", "tvdb://222", "imdb://tt333", "tvdb://444"]}
+        assert _scan_guids(metadata) == ("tt333", "222")
+        assert _scan_guids({"guids": None}) == (None, None)
+
+    def test_format_history_title(self):
+        """Test display titles for movies and episodes with partial details."""
+        assert _format_history_title({"title": "Movie", "media_type": "movie"}) == "Movie"
+        episode = {
+            "title": "Pilot",
+            "media_type": "episode",
+            "grandparent_title": "Show",
+            "parent_media_index": 1,
+            "media_index": 2,
+        }
+        assert _format_history_title(episode) == "Show - Pilot (S1 · E2)"
+        assert _format_history_title({**episode, "media_index": None}) == "Show - Pilot"
+        assert _format_history_title({**episode, "title": ""}) == "Show"
+        assert _format_history_title({**episode, "grandparent_title": ""}) == "Pilot"
+
     @patch.object(TautulliAPI, "_request")
     def test_get_watch_history_pagination_empty_page(self, mock_request):
         """Test pagination with empty page data."""
@@ -558,15 +842,15 @@ class TestTautulliRegexPatterns:
         for record in result:
             assert record["user"] == "Alice"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tvdb_id_from_rating_key_no_match(self, mock_get):
         """Test get_tvdb_id_from_rating_key returns None when no match (line 386)."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers.get.return_value = "application/json"
-        mock_response.json.return_value = {
-            "response": {"data": {"guids": ["imdb://tt123456", "other://some_id"]}}  # No TVDB ID
-        }
+        mock_response.content = json.dumps(
+            {"response": {"data": {"guids": ["imdb://tt123456", "other://some_id"]}}}  # No TVDB ID
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -5,6 +5,7 @@ Tests configuration loading, validation, and error handling for both
 YAML file and environment variable configuration methods.
 """
 
+import io
 import os
 import tempfile
 from pathlib import Path
@@ -14,7 +15,7 @@ import pytest
 import yaml
 from pydantic import ValidationError
 
-from prunarr.config import Settings, load_settings
+from prunarr.config import Settings, load_settings, load_settings_from_stream
 
 
 class TestSettings:
@@ -126,6 +127,13 @@ class TestSettings:
 
         assert settings.user_tag_regex == r"^\d+ - (.+)$"
 
+    def test_user_tag_pattern_compiled_once(self, mock_settings):
+        """Test that the compiled user tag pattern is cached on the settings object."""
+        pattern = mock_settings.user_tag_pattern
+
+        assert pattern is mock_settings.user_tag_pattern
+        assert pattern.match("123 - testuser").group(1) == "testuser"
+
 
 class TestLoadSettings:
     """Test the load_settings function behavior."""
@@ -163,7 +171,19 @@ class TestLoadSettings:
             assert settings.tautulli_api_key == "env-tautulli-key"
             assert settings.tautulli_url == "http://env:8181"
 
-    def test_yaml_overrides_environment(self, temp_config_file):
+    def test_load_from_stream(self, in_memory_config):
+        """Test loading configuration from an in-memory YAML stream."""
+        settings = load_settings_from_stream(in_memory_config)
+
+        assert settings.radarr_api_key == "test-radarr-key"
+        assert settings.tautulli_url == "http://localhost:8181"
+
+    def test_load_from_invalid_stream(self):
+        """Test that malformed YAML streams raise the same error as files."""
+        with pytest.raises(ValueError, match="Invalid YAML configuration file"):
+            load_settings_from_stream(io.StringIO("invalid: yaml: content: ["))
+
+    def test_yaml_overrides_environment(self, in_memory_config):
         """Test that YAML values take precedence over environment variables."""
         env_vars = {
             "RADARR_API_KEY": "env-radarr-key",
@@ -175,7 +195,7 @@ class TestLoadSettings:
         }
 
         with patch.dict(os.environ, env_vars):
-            settings = load_settings(temp_config_file)
+            settings = load_settings_from_stream(in_memory_config)
 
             # YAML values should override environment
             assert settings.radarr_api_key == "test-radarr-key"
@@ -4,6 +4,7 @@ Unit tests for PrunArr helper methods.
 Tests the new refactored helper methods that were extracted during code refactoring.
 """
 
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -11,6 +12,8 @@ import pytest
 
 from prunarr.config import Settings
 from prunarr.prunarr import PrunArr
+from prunarr.services.user_service import UserService
+from prunarr.tautulli import TautulliAPI
 
 
 class TestMovieHelpers:
@@ -132,6 +135,46 @@ class TestEpisodeHelpers:
         assert "alice" in lookup["12345"]["s1e5"]
         assert "bob" in lookup["12345"]["s1e6"]
 
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_build_episode_watch_lookup_allowed_tvdb(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test restricting the episode watch lookup to selected series."""
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        tautulli_history = [
+            {
+                "grandparent_rating_key": "100",
+                "season_num": 1,
+                "episode_num": 1,
+                "user": "alice",
+                "watched_at": "1000",
+            },
+            {
+                "grandparent_rating_key": "200",
+                "season_num": 1,
+                "episode_num": 1,
+                "user": "bob",
+                "watched_at": "2000",
+            },
+        ]
+        series_tvdb_cache = {"100": "12345", "200": "67890"}
+
+        lookup = prunarr.media_matcher.build_episode_watch_lookup(
+            tautulli_history, series_tvdb_cache, allowed_tvdb={"67890"}
+        )
+
+        assert list(lookup) == ["67890"]
+        assert "bob" in lookup["67890"]["s1e1"]
+
     @patch("prunarr.prunarr.RadarrAPI")
     @patch("prunarr.prunarr.SonarrAPI")
     @patch("prunarr.prunarr.TautulliAPI")
@@ -446,19 +489,83 @@ class TestPrunArrIntegration:
                 "seasons": [{"seasonNumber": 1}, {"seasonNumber": 2}],
             },
         ]
-        mock_sonarr_instance.get_tag.return_value = {"id": 1, "label": "123 - bob"}
+        mock_sonarr_instance.get_tags.return_value = [{"id": 1, "label": "123 - bob"}]
 
         # Test with untagged included
         series = prunarr.get_all_sonarr_series(include_untagged=True)
         assert len(series) == 2
         assert series[0]["user"] == "bob"
         assert series[1]["user"] is None
+        assert series[0]["_title_folded"] == "series 1"
 
         # Test without untagged
         series = prunarr.get_all_sonarr_series(include_untagged=False)
         assert len(series) == 1
         assert series[0]["user"] == "bob"
 
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_get_all_sonarr_series_fetches_tags_once(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test that tags are resolved from a single bulk fetch, not per series."""
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        mock_sonarr_instance = mock_sonarr.return_value
+        mock_sonarr_instance.get_series.return_value = [
+            {"id": i, "title": f"Series {i}", "tags": [1, 2], "seasons": []} for i in range(5)
+        ]
+        mock_sonarr_instance.get_tags.return_value = [
+            {"id": 1, "label": "123 - bob"},
+            {"id": 2, "label": "4K"},
+        ]
+
+        series = prunarr.get_all_sonarr_series()
+
+        assert len(series) == 5
+        assert all(s["user"] == "bob" for s in series)
+        assert all(s["tag_labels"] == ["4K"] for s in series)
+        mock_sonarr_instance.get_tags.assert_called_once_with()
+        mock_sonarr_instance.get_tag.assert_not_called()
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_get_all_sonarr_series_tag_fetch_failure(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test that a failed bulk tag fetch falls back to per-tag lookups."""
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        mock_sonarr_instance = mock_sonarr.return_value
+        mock_sonarr_instance.get_series.return_value = [
+            {"id": 1, "title": "Series 1", "tags": [1, 2], "seasons": []}
+        ]
+        mock_sonarr_instance.get_tags.side_effect = Exception("API error")
+        mock_sonarr_instance.get_tag.side_effect = lambda tag_id: {
+            1: {"id": 1, "label": "123 - bob"},
+            2: {"id": 2, "label": "4K"},
+        }[tag_id]
+
+        series = prunarr.get_all_sonarr_series()
+
+        assert series[0]["user"] == "bob"
+        assert series[0]["tag_labels"] == ["4K"]
+        assert prunarr.series_service._tag_map_cache is None
+
     @patch("prunarr.prunarr.RadarrAPI")
     @patch("prunarr.prunarr.SonarrAPI")
     @patch("prunarr.prunarr.TautulliAPI")
@@ -694,7 +801,7 @@ class TestCriticalSeriesLogic:
                 "seasons": [],
             }
         ]
-        mock_sonarr_instance.get_tag.return_value = {"id": 1, "label": "1 - alice"}
+        mock_sonarr_instance.get_tags.return_value = [{"id": 1, "label": "1 - alice"}]
         mock_sonarr_instance.get_season_info.return_value = []
 
         # Mock Tautulli history - 5 out of 10 episodes watched
@@ -722,11 +829,166 @@ class TestCriticalSeriesLogic:
         assert series[0]["total_episodes"] == 10
         assert series[0]["completion_percentage"] == 50.0
 
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_series_watch_status_available_seasons(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test available seasons are derived from the series payload without extra calls."""
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        mock_sonarr_instance = mock_sonarr.return_value
+        mock_sonarr_instance.get_series.return_value = [
+            {
+                "id": 1,
+                "title": "Series A",
+                "tvdbId": 111111,
+                "tags": [1],
+                "statistics": {"episodeCount": 4, "episodeFileCount": 2},
+                "seasons": [
+                    {"seasonNumber": 1, "statistics": {"episodeFileCount": 0}},
+                    {"seasonNumber": 2, "statistics": {"episodeFileCount": 2, "sizeOnDisk": 500}},
+                ],
+            },
+            {
+                "id": 2,
+                "title": "Series B",
+                "tvdbId": 222222,
+                "tags": [1],
+                "statistics": {},
+                "seasons": [{"seasonNumber": 1, "statistics": {}}],
+            },
+            {
+                "id": 3,
+                "title": "Series C",
+                "tvdbId": 333333,
+                "tags": [1],
+                "statistics": {"episodeCount": 2, "episodeFileCount": 0},
+                "seasons": [{"seasonNumber": 1, "statistics": {"episodeFileCount": 0}}],
+            },
+        ]
+        mock_sonarr_instance.get_tags.return_value = [{"id": 1, "label": "1 - alice"}]
+
+        mock_tautulli_instance = mock_tautulli.return_value
+        mock_tautulli_instance.get_episode_completed_history.return_value = []
+        mock_tautulli_instance.build_series_metadata_cache.return_value = {}
+
+        series = prunarr.get_series_with_watch_status()
+
+        assert [s["available_seasons"] for s in series] == ["2", "None", "None"]
+        assert [s["total_size_on_disk"] for s in series] == [500, 0, 0]
+        mock_sonarr_instance.get_series.assert_called_once_with()
+
+        # Title filter is case-insensitive against the cached lowercased title
+        series = prunarr.get_series_with_watch_status(series_filter="SERIES b")
+        assert [s["title"] for s in series] == ["Series B"]
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_series_watch_status_memoized(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test series, tags and watch lookup are built once until invalidated."""
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        mock_sonarr_instance = mock_sonarr.return_value
+        mock_sonarr_instance.get_series.return_value = [
+            {"id": 1, "title": "Series A", "tvdbId": 111111, "tags": [1], "seasons": []},
+            {"id": 2, "title": "Series B", "tvdbId": 222222, "tags": [], "seasons": []},
+        ]
+        mock_sonarr_instance.get_tags.return_value = [{"id": 1, "label": "1 - alice"}]
+
+        mock_tautulli_instance = mock_tautulli.return_value
+        mock_tautulli_instance.get_episode_completed_history.return_value = []
+        mock_tautulli_instance.build_series_metadata_cache.return_value = {}
+
+        assert len(prunarr.get_series_with_watch_status()) == 2
+        assert len(prunarr.get_series_with_watch_status(include_untagged=False)) == 1
+        assert len(prunarr.get_all_sonarr_series()) == 2
+
+        assert mock_sonarr_instance.get_series.call_count == 1
+        assert mock_sonarr_instance.get_tags.call_count == 1
+        assert mock_tautulli_instance.get_episode_completed_history.call_count == 1
+
+        prunarr.series_service.invalidate()
+        prunarr.get_series_with_watch_status()
+
+        assert mock_sonarr_instance.get_series.call_count == 2
+        assert mock_sonarr_instance.get_tags.call_count == 2
+        assert mock_tautulli_instance.get_episode_completed_history.call_count == 2
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_series_ready_for_removal(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """CRITICAL: Test only fully watched, old enough, tagged series are removable."""
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        mock_sonarr_instance = mock_sonarr.return_value
+        mock_sonarr_instance.get_series.return_value = [
+            {
+                "id": series_id,
+                "title": f"Series {series_id}",
+                "tvdbId": tvdb_id,
+                "tags": tags,
+                "statistics": {"episodeCount": 2, "episodeFileCount": 2},
+                "seasons": [],
+            }
+            for series_id, tvdb_id, tags in [(1, 111, [1]), (2, 222, [1]), (3, 333, [])]
+        ]
+        mock_sonarr_instance.get_tags.return_value = [{"id": 1, "label": "1 - alice"}]
+
+        mock_tautulli_instance = mock_tautulli.return_value
+        mock_tautulli_instance.get_episode_completed_history.return_value = [
+            {
+                "grandparent_rating_key": key,
+                "season_num": 1,
+                "episode_num": episode,
+                "user": "alice",
+                "watched_at": "1704067200",
+            }
+            # Series 1 and 3 fully watched, series 2 only half
+            for key, episode in [("10", 1), ("10", 2), ("20", 1), ("30", 1), ("30", 2)]
+        ]
+        mock_tautulli_instance.build_series_metadata_cache.return_value = {
+            "10": "111",
+            "20": "222",
+            "30": "333",
+        }
+
+        result = prunarr.get_series_ready_for_removal(days_watched=30)
+
+        assert [s["id"] for s in result] == [1]
+        assert result[0]["removal_type"] == "series"
+        assert prunarr.get_series_ready_for_removal(days_watched=100000) == []
+
 
 class TestCriticalErrorHandling:
     """Test critical error handling paths in tautulli."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_tautulli_invalid_api_key(self, mock_get):
         """CRITICAL: Test handling of invalid API key."""
         from prunarr.tautulli import TautulliAPI
@@ -740,7 +1002,7 @@ class TestCriticalErrorHandling:
         with pytest.raises(ValueError, match="Invalid Tautulli API key"):
             api._request("test")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_tautulli_server_not_accessible(self, mock_get):
         """CRITICAL: Test handling of inaccessible server."""
         from prunarr.tautulli import TautulliAPI
@@ -755,7 +1017,7 @@ class TestCriticalErrorHandling:
         with pytest.raises(ValueError, match="Tautulli server not accessible"):
             api._request("test")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_tautulli_connection_error(self, mock_get):
         """CRITICAL: Test handling of connection errors."""
         import requests
@@ -769,7 +1031,7 @@ class TestCriticalErrorHandling:
         with pytest.raises(ValueError, match="Cannot connect to Tautulli"):
             api._request("test")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_tautulli_invalid_json_response(self, mock_get):
         """CRITICAL: Test handling of non-JSON responses."""
         from prunarr.tautulli import TautulliAPI
@@ -783,3 +1045,217 @@ class TestCriticalErrorHandling:
 
         with pytest.raises(ValueError, match="Invalid response from Tautulli"):
             api._request("test")
+
+
+class TestSeriesDetailedInfo:
+    """Tests for episode-level series details."""
+
+    @staticmethod
+    def _make_prunarr(mock_tautulli, mock_sonarr):
+        settings = Settings(
+            radarr_api_key="test",
+            radarr_url="http://test",
+            sonarr_api_key="test",
+            sonarr_url="http://test",
+            tautulli_api_key="test",
+            tautulli_url="http://test",
+        )
+        prunarr = PrunArr(settings)
+
+        mock_sonarr_instance = mock_sonarr.return_value
+        mock_sonarr_instance.get_series.return_value = [
+            {
+                "id": 1,
+                "title": "Series A",
+                "tvdbId": 111111,
+                "tags": [1],
+                "statistics": {"episodeCount": 4, "episodeFileCount": 4},
+                "seasons": [
+                    {"seasonNumber": 0, "totalEpisodeCount": 1, "statistics": {}},
+                    {
+                        "seasonNumber": 1,
+                        "totalEpisodeCount": 2,
+                        "statistics": {"episodeFileCount": 2},
+                    },
+                    {
+                        "seasonNumber": 2,
+                        "totalEpisodeCount": 2,
+                        "statistics": {"episodeFileCount": 2},
+                    },
+                ],
+            }
+        ]
+        mock_sonarr_instance.get_tags.return_value = [{"id": 1, "label": "1 - alice"}]
+        mock_sonarr_instance.get_episodes_by_series_id.return_value = [
+            {
+                "seriesId": 1,
+                "seasonNumber": season,
+                "episodeNumber": episode,
+                "title": f"Title {season}x{episode}",
+                "hasFile": True,
+                "episodeFileId": season * 10 + episode,
+            }
+            for season, episode in [(0, 1), (1, 1), (1, 2), (2, 1), (2, 2)]
+        ]
+
+        mock_tautulli_instance = mock_tautulli.return_value
+        mock_tautulli_instance.get_episode_completed_history.return_value = [
+            {
+                "grandparent_rating_key": "1000",
+                "season_num": 1,
+                "episode_num": 1,
+                "user": "alice",
+                "watched_at": "1704067200",
+            },
+            {
+                "grandparent_rating_key": "1000",
+                "season_num": 1,
+                "episode_num": 1,
+                "user": "bob",
+                "watched_at": "1704153600",
+            },
+            {
+                "grandparent_rating_key": "1000",
+                "season_num": 2,
+                "episode_num": 1,
+                "user": "bob",
+                "watched_at": "1704067200",
+            },
+        ]
+        mock_tautulli_instance.build_series_metadata_cache.return_value = {"1000": "111111"}
+        return prunarr
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_get_series_detailed_info(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test episode watch status and season totals, skipping specials."""
+        prunarr = self._make_prunarr(mock_tautulli, mock_sonarr)
+
+        info = prunarr.get_series_detailed_info(1)
+
+        assert set(info["seasons_data"]) == {1, 2}
+        assert info["total_episodes"] == 4
+
+        season_1 = info["seasons_data"][1]
+        assert season_1["watched_by_user"] == 1
+        assert season_1["unwatched"] == 1
+        assert [ep["episode_number"] for ep in season_1["episodes"]] == [1, 2]
+
+        episode = season_1["episodes"][0]
+        assert episode["episode_key"] == "s1e1"
+        assert episode["title"] == "Title 1x1"
+        assert episode["watched"] is True
+        assert episode["watched_at"] == "1704067200"
+        assert sorted(episode["all_watchers"]) == ["alice", "bob"]
+        assert episode["most_recent_watch"] == datetime.fromtimestamp(1704153600)
+
+        season_2 = info["seasons_data"][2]
+        assert season_2["watched_by_others"] == 1
+        assert season_2["episodes"][0]["watch_status"] == "watched_by_others"
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    def test_get_series_detailed_info_fetches_history_once(self, mock_sonarr, mock_radarr):
+        """Test that the detail and watch status passes share one Tautulli history fetch."""
+        prunarr = self._make_prunarr(Mock(), mock_sonarr)
+        history = [
+            {
+                "grandparent_rating_key": "1000",
+                "parent_media_index": 1,
+                "media_index": 1,
+                "friendly_name": "alice",
+                "date": "1704067200",
+                "watched_status": 1,
+                "media_type": "episode",
+            }
+        ]
+
+        def slow_history(**kwargs):
+            # Keep the first fetch in flight while the second caller asks for history
+            time.sleep(0.1)
+            return iter(history)
+
+        with (
+            patch.object(
+                TautulliAPI, "iter_watch_history", side_effect=slow_history
+            ) as mock_history,
+            patch.object(
+                TautulliAPI,
+                "get_metadata_bulk",
+                return_value={"1000": {"guids": ["tvdb://111111"]}},
+            ),
+        ):
+            info = prunarr.get_series_detailed_info(1)
+
+        assert mock_history.call_count == 1
+        assert info["seasons_data"][1]["watched_by_user"] == 1
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_get_series_detailed_info_filters(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test season and watched filters on episode details."""
+        prunarr = self._make_prunarr(mock_tautulli, mock_sonarr)
+
+        info = prunarr.get_series_detailed_info(1, season_filter=1, unwatched_only=True)
+
+        assert list(info["seasons_data"]) == [1]
+        episodes = info["seasons_data"][1]["episodes"]
+        assert [ep["episode_key"] for ep in episodes] == ["s1e2"]
+
+        assert prunarr.get_series_detailed_info(99) == {}
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_get_series_detailed_info_season_fallback(
+        self, mock_tautulli, mock_sonarr, mock_radarr
+    ):
+        """Test placeholder episodes are built from seasons when Sonarr returns none."""
+        prunarr = self._make_prunarr(mock_tautulli, mock_sonarr)
+        mock_sonarr.return_value.get_episodes_by_series_id.return_value = []
+
+        info = prunarr.get_series_detailed_info(1)
+
+        assert info["total_episodes"] == 4
+        episode = info["seasons_data"][1]["episodes"][0]
+        assert episode["title"] == "Episode 1"
+        assert episode["has_file"] is True
+        assert episode["watched"] is True
+
+    @patch("prunarr.prunarr.RadarrAPI")
+    @patch("prunarr.prunarr.SonarrAPI")
+    @patch("prunarr.prunarr.TautulliAPI")
+    def test_get_series_detailed_info_summary_only(self, mock_tautulli, mock_sonarr, mock_radarr):
+        """Test summary_only returns season counts without episode details."""
+        prunarr = self._make_prunarr(mock_tautulli, mock_sonarr)
+
+        info = prunarr.get_series_detailed_info(1, summary_only=True)
+
+        assert info["total_episodes"] == 4
+        season_1 = info["seasons_data"][1]
+        assert season_1["episodes"] == []
+        assert season_1["watched_by_user"] == 1
+        assert season_1["unwatched"] == 1
+        assert info["seasons_data"][2]["watched_by_others"] == 1
+
+
+class TestUserServiceTagSources:
+    """Test username extraction against a plain API client."""
+
+    def test_extract_username_from_api_client(self, simple_radarr_api):
+        """Test resolving the username through per-tag API lookups."""
+        service = UserService(r"^\d+ - (.+)$")
+        movie = simple_radarr_api.get_movie()[0]
+
+        assert service.extract_username_from_tags(movie["tags"], simple_radarr_api) == "testuser"
+
+    def test_extract_username_from_tag_map(self, simple_radarr_api):
+        """Test resolving the username through a prefetched tag map."""
+        service = UserService(r"^\d+ - (.+)$")
+        tag_map = service.build_tag_map(simple_radarr_api)
+
+        assert tag_map == {1: "123 - testuser"}
+        assert service.extract_username_from_tags([1], tag_map) == "testuser"
+        assert service.extract_username_from_tags([2], tag_map) is None
@@ -6,6 +6,8 @@ Tests formatting functions, episode key handling, and other shared utilities.
 
 from datetime import datetime
 
+import pytest
+
 from prunarr.utils import (
     format_completion_percentage,
     format_date,
@@ -19,6 +21,16 @@ from prunarr.utils import (
     make_episode_key,
     parse_episode_key,
 )
+from prunarr.utils.filters import compose_filters, filter_by_excluded_tags, filter_by_tags
+from prunarr.utils.parsers import parse_file_size
+from prunarr.utils.validators import (
+    validate_episode_key_format,
+    validate_filesize_string,
+    validate_filesize_strings_batch,
+    validate_non_negative_int,
+    validate_percentage,
+    validate_positive_int,
+)
 
 
 class TestFormatFileSize:
@@ -287,6 +299,15 @@ class TestMakeEpisodeKey:
         """Test creating key with triple digit numbers."""
         assert make_episode_key(100, 999) == "s100e999"
 
+    def test_repeated_keys_share_one_string(self):
+        """Test that identical keys are returned as the same string object."""
+        assert make_episode_key(2, 7) is make_episode_key(2, 7)
+
+    def test_result_independent_of_call_order(self):
+        """Test that a cached int key is not returned for equal float arguments."""
+        assert make_episode_key(3, 4) == "s3e4"
+        assert make_episode_key(3.0, 4) == "s3.0e4"
+
 
 class TestParseEpisodeKey:
     """Test episode key parsing."""
@@ -336,11 +357,149 @@ class TestParseEpisodeKey:
         """Test parsing empty string."""
         assert parse_episode_key("") is None
 
+    def test_trailing_characters(self):
+        """Test that keys with extra characters are rejected."""
+        assert parse_episode_key("s1e5x") is None
+        assert parse_episode_key("xs1e5") is None
+
     def test_none_input(self):
         """Test parsing None input."""
         assert parse_episode_key(None) is None
 
 
+class TestParseFileSize:
+    """Test file size string parsing."""
+
+    def test_standard_units(self):
+        """Test parsing each supported unit."""
+        assert parse_file_size("1024B") == 1024
+        assert parse_file_size("500MB") == 524288000
+        assert parse_file_size("2.5GB") == 2684354560
+
+    def test_case_and_whitespace_insensitive(self):
+        """Test that unit case and surrounding whitespace are ignored."""
+        assert parse_file_size("  1gb ") == 1073741824
+        assert parse_file_size("500 mB") == 524288000
+
+    def test_invalid_format(self):
+        """Test that malformed strings raise ValueError."""
+        for size_str in ("", "GB", "1XB", "1.GB"):
+            with pytest.raises(ValueError):
+                parse_file_size(size_str)
+
+
+class TestComposeFilters:
+    """Test single-pass filter composition."""
+
+    ITEMS = [
+        {"title": "Alpha", "user": "alice", "watch_status": "watched", "tag_labels": ["4K", "HDR"]},
+        {"title": "Beta", "user": "bob", "watch_status": "unwatched", "tag_labels": ["4k"]},
+        {"title": "Gamma", "user": "alice", "watch_status": "fully_watched", "tag_labels": []},
+        {"title": "alphabet", "user": "alice", "watch_status": "watched", "tag_labels": ["Kids"]},
+    ]
+
+    def test_no_criteria_keeps_everything(self):
+        """Test that an empty composition accepts every item."""
+        keep = compose_filters()
+        assert all(keep(item) for item in self.ITEMS)
+
+    def test_tags_match_chained_filters(self):
+        """Test that tag criteria match the chained filter_by_* functions."""
+        for tags, match_all, excluded in [
+            (["4K"], False, None),
+            (["4k", "hdr"], True, None),
+            (None, False, ["kids"]),
+            (["4K", "Kids"], False, ["HDR"]),
+        ]:
+            expected = filter_by_excluded_tags(
+                filter_by_tags(self.ITEMS, tags, match_all=match_all), excluded
+            )
+            keep = compose_filters(tags=tags, match_all=match_all, excluded_tags=excluded)
+            assert [item for item in self.ITEMS if keep(item)] == expected
+
+
+class TestValidateFilesizeString:
+    """Test file size string validation."""
+
+    def test_valid_sizes(self):
+        """Test sizes with each unit, decimals, spacing and case."""
+        assert validate_filesize_string("1GB") == 1024**3
+        assert validate_filesize_string("500mb") == 500 * 1024**2
+        assert validate_filesize_string("2.5GB") == int(2.5 * 1024**3)
+        assert validate_filesize_string(" 3 kb ") == 3 * 1024
+        assert validate_filesize_string("10B") == 10
+        assert validate_filesize_string("1TB") == 1024**4
+
+    def test_invalid_sizes(self):
+        """Test that malformed numbers and unknown units are rejected."""
+        for size in ["", "GB", "1", "1XB", "1PB", ".5GB", "1.GB", "-1GB", "1e3GB", "1.5.5MB"]:
+            assert validate_filesize_string(size) is None, size
+
+    def test_batch(self):
+        """Test batch parsing keeps input order and marks invalid entries."""
+        assert validate_filesize_strings_batch(["1KB", "bad", "2MB", "1KB"]) == [
+            1024,
+            None,
+            2 * 1024**2,
+            1024,
+        ]
+        assert validate_filesize_strings_batch([]) == []
+
+
+class TestValidateEpisodeKeyFormat:
+    """Test episode key format validation."""
+
+    def test_valid_keys(self):
+        """Test valid keys in either case."""
+        assert validate_episode_key_format("s1e5")
+        assert validate_episode_key_format("S12E345")
+
+    def test_invalid_keys(self):
+        """Test keys with missing or non-numeric parts."""
+        for key in ["", "s1", "e5", "se5", "s1e", "1e5", "s1e5x", "sxe5", "s1ee5"]:
+            assert not validate_episode_key_format(key), key
+
+
+class TestValidateNumbers:
+    """Test numeric validators for native and string inputs."""
+
+    def test_positive_int(self):
+        """Test positive integer validation."""
+        assert validate_positive_int(5) == 5
+        assert validate_positive_int("10") == 10
+        assert validate_positive_int(True) == 1
+        assert validate_positive_int(0) is None
+        assert validate_positive_int(-1) is None
+        assert validate_positive_int("invalid") is None
+        assert validate_positive_int(None) is None
+
+    def test_non_negative_int(self):
+        """Test non-negative integer validation."""
+        assert validate_non_negative_int(0) == 0
+        assert validate_non_negative_int("7") == 7
+        assert validate_non_negative_int(-1) is None
+        assert validate_non_negative_int([]) is None
+
+    def test_string_inputs_match_int_conversion(self):
+        """Test that string parsing accepts exactly what int() accepts."""
+        assert validate_positive_int(" +12 ") == 12
+        assert validate_positive_int("1_000") == 1000
+        assert validate_non_negative_int("-0") == 0
+        assert validate_non_negative_int("-3") is None
+        for value in ["", "-", "1.5", "²", "0x10", "--1"]:
+            assert validate_non_negative_int(value) is None, value
+
+    def test_percentage(self):
+        """Test percentage validation always yields floats within 0-100."""
+        assert validate_percentage(50) == 50.0
+        assert isinstance(validate_percentage(50), float)
+        assert validate_percentage(99.5) == 99.5
+        assert validate_percentage("12.5") == 12.5
+        assert validate_percentage(100.5) is None
+        assert validate_percentage(-5) is None
+        assert validate_percentage("abc") is None
+
+
 class TestUtilsIntegration:
     """Integration tests for utility functions."""
 